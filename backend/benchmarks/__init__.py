@@ -0,0 +1,5 @@
+"""
+Benchmarks for the backend.
+
+Run from the `backend/` directory, e.g. ``python -m benchmarks.db_write_throughput``.
+"""
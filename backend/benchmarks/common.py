@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django() -> None:
+    """
+    Configure Django for a standalone benchmark script.
+    """
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
+
+    import django
+    django.setup()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of `samples` (0 for an empty list).
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100.0 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Count, mean and p50/p95/p99 of latency samples in seconds, reported in ms.
+    """
+    count = len(samples)
+    return {
+        'count': count,
+        'mean_ms': round(1000 * sum(samples) / count, 3) if count else 0.0,
+        'p50_ms': round(1000 * percentile(samples, 50), 3),
+        'p95_ms': round(1000 * percentile(samples, 95), 3),
+        'p99_ms': round(1000 * percentile(samples, 99), 3),
+    }
+
+
+def _flatten(data: Dict[str, Any], prefix: str = '') -> Dict[str, float]:
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare_to_baseline(result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compare a benchmark result with a stored baseline.
+
+    Latencies (keys ending in `_ms`) regress when they grow, and
+    throughputs (keys ending in `_per_s`) when they shrink, by more than
+    `tolerance` (a fraction, e.g. 0.2 for 20%). Other numbers are ignored.
+
+    Returns:
+        List[str]: One line per regressed metric (empty if none)
+    """
+    current, previous = _flatten(result), _flatten(baseline)
+    regressions = []
+    for name, before in sorted(previous.items()):
+        after = current.get(name)
+        if after is None or not before:
+            continue
+        if name.endswith('_ms') and after > before * (1 + tolerance):
+            regressions.append(f"{name}: {before} -> {after} (+{100 * (after / before - 1):.1f}%)")
+        elif name.endswith('_per_s') and after < before * (1 - tolerance):
+            regressions.append(f"{name}: {before} -> {after} (-{100 * (1 - after / before):.1f}%)")
+    return regressions
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add --save-baseline/--baseline/--tolerance to a benchmark's argument parser.
+    """
+    parser.add_argument('--save-baseline', metavar='PATH', help="Store this run's result as a baseline")
+    parser.add_argument('--baseline', metavar='PATH', help="Compare this run against a stored baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed relative slowdown before a metric counts as regressed (default: 0.2)")
+
+
+def report(result: Dict[str, Any], args: argparse.Namespace) -> None:
+    """
+    Print a benchmark result, then save it and/or compare it with a
+    baseline as requested. Exits with status 1 if any metric regressed.
+    """
+    print(json.dumps(result, indent=2, default=str))
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(result, indent=2, default=str) + '\n')
+        print(f"Saved baseline to {args.save_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(result, baseline, args.tolerance)
+        if regressions:
+            print(f"Regressions against {args.baseline}:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})", file=sys.stderr)
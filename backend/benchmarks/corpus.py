@@ -0,0 +1,184 @@
+"""
+Generated resume corpus (PDF, DOCX and TXT) for the parser and load benchmarks.
+
+Resumes are built from a seeded random generator, so a given seed and
+count always produce the same files. PDFs are written directly (one
+Helvetica text page per 50 lines, with clickable link annotations), so
+no PDF authoring library is needed::
+
+    python -m benchmarks.corpus --out /tmp/resumes --count 20
+"""
+import argparse
+import io
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+FORMATS = ('pdf', 'docx', 'txt')
+
+FIRST_NAMES = "Ada Alan Grace Linus Margaret Ken Barbara Dennis Radia Guido Frances Edsger".split()
+LAST_NAMES = "Lovelace Turing Hopper Torvalds Hamilton Thompson Liskov Ritchie Perlman Rossum Allen Dijkstra".split()
+SKILLS = (
+    "Python Django PostgreSQL Redis Kubernetes Docker AWS Terraform React TypeScript "
+    "Go Rust Kafka Spark Airflow GraphQL Celery Linux Prometheus Grafana"
+).split()
+VERBS = "Designed Built Scaled Migrated Owned Led Automated Optimized Shipped Maintained".split()
+NOUNS = (
+    "payment service, search pipeline, data platform, billing API, recommendation engine, "
+    "CI/CD pipeline, observability stack, onboarding flow, analytics dashboard, message queue"
+).split(', ')
+COMPANIES = "Initech Globex Umbrella Hooli Stark Wayne Acme Soylent Wonka Cyberdyne".split()
+UNIVERSITIES = ("State University", "Institute of Technology", "City College", "Polytechnic")
+
+
+def resume_lines(rng: random.Random, index: int) -> Tuple[List[str], List[str]]:
+    """
+    Lines of one pseudo-random resume and the profile URLs it links to.
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    handle = f"{first.lower()}{last.lower()}{index}"
+    links = [f"https://github.com/{handle}", f"https://www.linkedin.com/in/{handle}"]
+    lines = [
+        f"{first} {last}",
+        f"{handle}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        links[0],
+        "",
+        "SKILLS",
+        ", ".join(rng.sample(SKILLS, 8)),
+        "",
+        "EXPERIENCE",
+    ]
+    for _ in range(rng.randint(2, 4)):
+        start = rng.randint(2010, 2020)
+        lines.append(f"Senior Engineer, {rng.choice(COMPANIES)} ({start} - {start + rng.randint(1, 4)})")
+        for _ in range(rng.randint(3, 6)):
+            lines.append(
+                f"- {rng.choice(VERBS)} the {rng.choice(NOUNS)} using {rng.choice(SKILLS)} "
+                f"and {rng.choice(SKILLS)}, cutting latency by {rng.randint(10, 80)}%."
+            )
+        lines.append("")
+    lines += [
+        "EDUCATION",
+        f"B.Sc. Computer Science, {rng.choice(LAST_NAMES)} {rng.choice(UNIVERSITIES)} ({rng.randint(2004, 2014)})",
+    ]
+    return lines, links
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf(lines: List[str], links: List[str]) -> bytes:
+    """
+    Minimal PDF with the given text lines; links become URI annotations on page 1.
+    """
+    pages = [lines[i:i + 50] for i in range(0, len(lines), 50)] or [[]]
+    objects: Dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /Name /F1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    page_ids = []
+    next_id = 4
+    for page_number, page_lines in enumerate(pages):
+        content = "BT /F1 10 Tf 14 TL 50 800 Td " + " ".join(
+            f"({_pdf_escape(line)}) Tj T*" for line in page_lines
+        ) + " ET"
+        content_bytes = content.encode('cp1252', 'replace')
+        content_id, page_id = next_id, next_id + 1
+        next_id += 2
+        objects[content_id] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content_bytes), content_bytes)
+
+        annots = b""
+        if page_number == 0 and links:
+            annot_ids = []
+            for n, url in enumerate(links):
+                y = 780 - 14 * n
+                objects[next_id] = (
+                    b"<< /Type /Annot /Subtype /Link /Rect [50 %d 300 %d] /Border [0 0 0] "
+                    b"/A << /S /URI /URI (%s) >> >>" % (y, y + 12, _pdf_escape(url).encode('ascii'))
+                )
+                annot_ids.append(next_id)
+                next_id += 1
+            annots = b" /Annots [" + b" ".join(b"%d 0 R" % i for i in annot_ids) + b"]"
+        objects[page_id] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R%s >>" % (content_id, annots)
+        )
+        page_ids.append(page_id)
+    objects[2] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % i for i in page_ids), len(page_ids)
+    )
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = out.tell()
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (object_id, objects[object_id]))
+    xref_offset = out.tell()
+    size = max(objects) + 1
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % size)
+    for object_id in range(1, size):
+        out.write(b"%010d 00000 n \n" % offsets[object_id])
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+    return out.getvalue()
+
+
+def make_docx(lines: List[str]) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def make_txt(lines: List[str]) -> bytes:
+    return ("\n".join(lines) + "\n").encode('utf-8')
+
+
+def make_resume(file_format: str, rng: random.Random, index: int) -> bytes:
+    """
+    One generated resume in the given format ('pdf', 'docx' or 'txt').
+    """
+    lines, links = resume_lines(rng, index)
+    if file_format == 'pdf':
+        return make_pdf(lines, links)
+    if file_format == 'docx':
+        return make_docx(lines)
+    return make_txt(lines)
+
+
+def generate_corpus(directory: Path, count: int, seed: int = 42) -> List[Path]:
+    """
+    Write `count` resumes per format into `directory`.
+
+    Returns:
+        List[Path]: The generated files
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    paths = []
+    for index in range(count):
+        for file_format in FORMATS:
+            path = directory / f"resume_{index:04d}.{file_format}"
+            path.write_bytes(make_resume(file_format, rng, index))
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--out', required=True, help="Directory to write the resumes to")
+    parser.add_argument('--count', type=int, default=20, help="Resumes per format")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    paths = generate_corpus(Path(args.out), args.count, args.seed)
+    print(f"Wrote {len(paths)} resumes to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Concurrent write throughput of the configured database profile.
+
+Creates a throwaway test database for the current DB_ENGINE settings and
+has several threads insert JobPosting rows, one transaction per insert,
+as concurrent uploads would. Compare profiles by running it under
+different environments::
+
+    python -m benchmarks.db_write_throughput
+    SQLITE_JOURNAL_MODE=DELETE SQLITE_SYNCHRONOUS=FULL python -m benchmarks.db_write_throughput
+    DB_ENGINE=postgres python -m benchmarks.db_write_throughput
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from benchmarks.common import add_baseline_arguments, report, setup_django, summarize
+
+
+def run(threads: int, writes_per_thread: int) -> dict:
+    from django.conf import settings
+    from django.db import connection, connections
+    from jobs.models import JobPosting
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(threads)
+
+    def writer(worker: int):
+        local = []
+        try:
+            start_barrier.wait()
+            for i in range(writes_per_thread):
+                started = time.perf_counter()
+                JobPosting.objects.create(
+                    title=f"Benchmark {worker}-{i}",
+                    company="Benchmark Inc",
+                    description="Benchmark job description " * 20,
+                    required_skills=["python", "django", f"skill-{i % 50}"],
+                )
+                local.append(time.perf_counter() - started)
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+        finally:
+            connections.close_all()
+            with lock:
+                latencies.extend(local)
+
+    workers = [threading.Thread(target=writer, args=(n,)) for n in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    db = settings.DATABASES['default']
+    return {
+        'engine': db['ENGINE'],
+        'options': dict(db.get('OPTIONS', {})),
+        'conn_max_age': db.get('CONN_MAX_AGE'),
+        'vendor': connection.vendor,
+        'threads': threads,
+        'writes': len(latencies),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'elapsed_s': round(elapsed, 3),
+        'writes_per_s': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'latency': summarize(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=200, help="Inserts per thread")
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if connection.vendor == 'sqlite':
+            # A file-backed test database, so journal mode and locking
+            # behave as in production rather than as an in-memory database.
+            connection.settings_dict['TEST']['NAME'] = os.path.join(tmp, 'bench.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0)
+        try:
+            result = run(args.threads, args.writes)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    report(result, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+Local stand-in for the Groq chat completions API.
+
+Answers resume parsing, job parsing, matching and cover letter prompts
+with plausible, deterministic JSON/text after a configurable delay, and
+reports token usage, so load tests exercise the whole request path
+without network access or API spend. Point the backend at it with
+GROQ_BASE_URL (read by the groq client)::
+
+    python -m benchmarks.fake_groq --port 8765 --latency-ms 300
+    GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=fake python manage.py runserver
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+from benchmarks.corpus import SKILLS
+
+COMPLETIONS_PATH = '/openai/v1/chat/completions'
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+\.[\w.]+')
+
+
+def _skills_in(text: str) -> List[str]:
+    return [skill for skill in SKILLS if re.search(rf'\b{re.escape(skill)}\b', text)]
+
+
+def _first_line(text: str) -> str:
+    return next((line.strip() for line in text.splitlines() if line.strip()), '')
+
+
+def _answer(system: str, user: str) -> str:
+    """Reply content for a prompt, recognized by its system message."""
+    if 'resume parser' in system:
+        email = _EMAIL.search(user)
+        return json.dumps({
+            'name': _first_line(user)[:60],
+            'email': email.group(0) if email else None,
+            'phone': None,
+            'skills': _skills_in(user),
+            'education': [{'degree': 'B.Sc. Computer Science'}],
+            'work_experience': [{'title': 'Senior Engineer', 'summary': user[:200]}],
+        })
+    if 'job posting parser' in system:
+        return json.dumps({
+            'title': _first_line(user)[:80] or 'Software Engineer',
+            'company': 'Benchmark Inc',
+            'location': 'Remote',
+            'required_skills': _skills_in(user) or ['Python'],
+            'responsibilities': [],
+            'qualifications': [],
+        })
+    if 'job matching' in system:
+        digest = int(hashlib.sha256(user.encode('utf-8')).hexdigest()[:8], 16)
+        return json.dumps({
+            'match_score': digest % 101,
+            'missing_skills': [],
+            'summary': 'Benchmark match summary.',
+        })
+    return "Dear hiring team,\n\n" + "I would love to bring my experience to your team. " * 20
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    latency = 0.0
+    jitter = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path != COMPLETIONS_PATH:
+            self._send_json(404, {'error': {'message': f'Unknown path {self.path}'}})
+            return
+        payload = json.loads(body or b'{}')
+        messages = payload.get('messages', [])
+        system = ' '.join(m.get('content', '') for m in messages if m.get('role') == 'system')
+        user = ' '.join(m.get('content', '') for m in messages if m.get('role') == 'user')
+
+        time.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        content = _answer(system, user)
+        usage = {
+            'prompt_tokens': (len(system) + len(user)) // 4,
+            'completion_tokens': len(content) // 4,
+        }
+        usage['total_tokens'] = usage['prompt_tokens'] + usage['completion_tokens']
+        model = payload.get('model', 'fake')
+
+        if payload.get('stream'):
+            self._send_stream(model, content, usage)
+            return
+        self._send_json(200, {
+            'id': f'chatcmpl-{uuid.uuid4().hex}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': usage,
+        })
+
+    def _send_json(self, status: int, data: Dict[str, Any]) -> None:
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, model: str, content: str, usage: Dict[str, int]) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        completion_id = f'chatcmpl-{uuid.uuid4().hex}'
+        pieces = re.findall(r'\S+\s*', content)
+        for n, piece in enumerate(pieces):
+            chunk = {
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0,
+                    'delta': {'content': piece},
+                    'finish_reason': 'stop' if n == len(pieces) - 1 else None,
+                }],
+            }
+            if n == len(pieces) - 1:
+                chunk['x_groq'] = {'id': completion_id, 'usage': usage}
+            self.wfile.write(b'data: ' + json.dumps(chunk).encode('utf-8') + b'\n\n')
+        self.wfile.write(b'data: [DONE]\n\n')
+        self.close_connection = True
+
+
+def start_fake_groq(latency_ms: float = 0.0, jitter_ms: float = 0.0, host: str = '127.0.0.1', port: int = 0):
+    """
+    Serve the fake API on a background thread.
+
+    Returns:
+        Tuple[ThreadingHTTPServer, str]: The server (call shutdown() when
+        done) and its base URL, suitable for GROQ_BASE_URL
+    """
+    handler = type('Handler', (FakeGroqHandler,), {
+        'latency': latency_ms / 1000.0,
+        'jitter': jitter_ms / 1000.0,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='fake-groq', daemon=True).start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=300.0, help="Mean response delay")
+    parser.add_argument('--jitter-ms', type=float, default=50.0, help="Standard deviation of the delay")
+    args = parser.parse_args()
+
+    server, url = start_fake_groq(args.latency_ms, args.jitter_ms, args.host, args.port)
+    print(f"Fake Groq API listening on {url} (GROQ_BASE_URL={url})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Cold-start cost: `manage.py check` and a fresh process's first request.
+
+Each scenario runs `--repeat` times in a new interpreter with
+`python -X importtime`. The report covers wall time, total import
+time, and which heavy parsing/LLM libraries got imported (they should
+be loaded on first use, not at startup). It also lists the slowest
+imports by cumulative time::
+
+    python -m benchmarks.import_time --repeat 5
+    python -m benchmarks.import_time --save-baseline startup-baseline.json
+    python -m benchmarks.import_time --baseline startup-baseline.json
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.common import BACKEND_DIR, add_baseline_arguments, report, summarize
+
+HEAVY_MODULES = ('PyPDF2', 'pdfplumber', 'docx', 'groq')
+
+# Django set up through the WSGI entry point, then one request that
+# resolves against the full URLconf (and so imports every view module)
+FIRST_REQUEST = """
+from django.test import Client
+import core.wsgi
+Client().get('/metrics')
+"""
+
+SCENARIOS = {
+    'check': [sys.executable, '-X', 'importtime', 'manage.py', 'check'],
+    'first_request': [sys.executable, '-X', 'importtime', '-c', FIRST_REQUEST],
+}
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Module name -> (self, cumulative) microseconds
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def run_scenario(command: List[str], repeat: int, top: int) -> dict:
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'core.settings', 'PYTHONPATH': str(BACKEND_DIR)}
+    wall, imports = [], []
+    modules = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run(command, cwd=BACKEND_DIR, env=env, capture_output=True, text=True)
+        wall.append(time.perf_counter() - started)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{' '.join(command[3:])} failed:\n{completed.stderr[-2000:]}")
+        modules = parse_importtime(completed.stderr)
+        imports.append(sum(own for own, _ in modules.values()) / 1e6)
+
+    slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:top]
+    return {
+        'wall': summarize(wall),
+        'imports': summarize(imports),
+        'modules_imported': len(modules),
+        'heavy_modules_loaded': [name for name in HEAVY_MODULES if name in modules],
+        # [module, cumulative ms] pairs, from the last run
+        'slowest_imports': [[name, round(cumulative / 1000, 1)] for name, (_, cumulative) in slowest],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh processes per scenario")
+    parser.add_argument('--top', type=int, default=15, help="Slowest imports to list")
+    parser.add_argument('--scenario', choices=sorted(SCENARIOS), action='append',
+                        help="Scenario to run (repeatable; default: all)")
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    result = {
+        name: run_scenario(SCENARIOS[name], args.repeat, args.top)
+        for name in args.scenario or SCENARIOS
+    }
+    report(result, args)
+
+
+if __name__ == '__main__':
+    main()
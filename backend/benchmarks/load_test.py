@@ -0,0 +1,201 @@
+"""
+End-to-end load test: register -> login -> upload resume -> post job -> match.
+
+Each virtual user runs the whole flow once over HTTP; `--concurrency`
+users run at a time. By default the test is self-contained: it starts
+the fake Groq API (benchmarks/fake_groq.py), a throwaway file-backed
+test database and media directory, and the Django app on a local
+threaded WSGI server, so runs are reproducible and cost nothing::
+
+    python -m benchmarks.load_test --users 50 --concurrency 8 --llm-latency-ms 300
+    python -m benchmarks.load_test --save-baseline load-baseline.json
+    python -m benchmarks.load_test --baseline load-baseline.json --tolerance 0.25
+
+Use `--target http://host:port` to drive an already running backend
+instead (start it with GROQ_BASE_URL pointing at `python -m benchmarks.fake_groq`).
+
+Reports p50/p95/p99 per step and per flow, throughput, and errors.
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.common import add_baseline_arguments, report, setup_django, summarize
+from benchmarks.corpus import FORMATS, SKILLS, make_resume
+
+STEPS = ('register', 'login', 'upload_resume', 'post_job', 'match')
+_CONTENT_TYPES = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'txt': 'text/plain',
+}
+
+
+@contextmanager
+def self_hosted_backend(llm_latency_ms: float, llm_jitter_ms: float, fast_hashing: bool):
+    """
+    Run the fake Groq API and the Django app on local ports for the
+    duration of the block, against a throwaway database and media root.
+
+    Yields:
+        str: Base URL of the backend
+    """
+    from benchmarks.fake_groq import start_fake_groq
+
+    groq_server, groq_url = start_fake_groq(llm_latency_ms, llm_jitter_ms)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ.update({
+            'GROQ_BASE_URL': groq_url,
+            'GROQ_API_KEY': 'fake-benchmark-key',
+            'MEDIA_ROOT': str(Path(tmp) / 'media'),
+            'DEBUG': 'False',
+        })
+        setup_django()
+
+        from django.conf import settings
+        from django.core.handlers.wsgi import WSGIHandler
+        from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler
+        from django.db import connection
+
+        if fast_hashing:
+            settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+        if connection.vendor == 'sqlite':
+            connection.settings_dict['TEST']['NAME'] = os.path.join(tmp, 'bench.sqlite3')
+        old_name = connection.creation.create_test_db(verbosity=0)
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadedWSGIServer(('127.0.0.1', 0), QuietHandler)
+        server.set_app(WSGIHandler())
+        thread = threading.Thread(target=server.serve_forever, name='benchmark-backend', daemon=True)
+        thread.start()
+        try:
+            yield f'http://127.0.0.1:{server.server_address[1]}'
+        finally:
+            server.shutdown()
+            server.server_close()
+            groq_server.shutdown()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def job_description(rng: random.Random, index: int) -> str:
+    skills = rng.sample(SKILLS, 5)
+    return (
+        f"Senior Backend Engineer {index}\n"
+        f"We are hiring an engineer to own our platform team #{index}. "
+        f"You will build services with {', '.join(skills)} and mentor the team. "
+        f"Requirements: {rng.randint(3, 8)}+ years of experience with {skills[0]} and {skills[1]}."
+    )
+
+
+def run_flow(base_url: str, run_id: str, index: int, seed: int) -> Dict[str, object]:
+    """
+    One virtual user's flow. Returns per-step latencies and the first error, if any.
+    """
+    import requests
+
+    rng = random.Random(seed + index)
+    username = f"bench-{run_id}-{index}"
+    password = f"Bench-{run_id}-pw!"
+    file_format = FORMATS[index % len(FORMATS)]
+    timings: Dict[str, float] = {}
+
+    with requests.Session() as session:
+        def step(name, method, path, expected, **kwargs):
+            started = time.perf_counter()
+            response = session.request(method, base_url + path, timeout=120, **kwargs)
+            timings[name] = time.perf_counter() - started
+            if response.status_code not in expected:
+                raise RuntimeError(f"{name}: HTTP {response.status_code} {response.text[:200]}")
+            return response.json()
+
+        try:
+            step('register', 'POST', '/api/register/', (201,), json={
+                'username': username, 'email': f"{username}@example.com",
+                'password': password, 'password2': password, 'name': f"Bench User {index}",
+            })
+            token = step('login', 'POST', '/api/login/', (200,), json={
+                'username': username, 'password': password,
+            })['token']
+            session.headers['Authorization'] = f"Token {token}"
+
+            resume = make_resume(file_format, rng, index)
+            candidate = step('upload_resume', 'POST', '/api/candidates/upload_resume/', (200, 201), files={
+                'resume': (f"resume_{index}.{file_format}", resume, _CONTENT_TYPES[file_format]),
+            })
+            job = step('post_job', 'POST', '/api/jobs/create_from_description/', (200, 201), json={
+                'job_description': job_description(rng, index),
+            })
+            step('match', 'POST', '/api/matches/match_candidate_to_job/', (200, 201), json={
+                'candidate_id': candidate['id'], 'job_id': job['id'],
+            })
+            return {'timings': timings, 'error': None}
+        except Exception as e:
+            return {'timings': timings, 'error': str(e)}
+
+
+def run(base_url: str, users: int, concurrency: int, seed: int) -> dict:
+    run_id = f"{int(time.time())}{random.randint(0, 9999):04d}"
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(lambda i: run_flow(base_url, run_id, i, seed), range(users)))
+    elapsed = time.perf_counter() - started
+
+    steps: Dict[str, List[float]] = {name: [] for name in STEPS}
+    flows, errors = [], []
+    for result in results:
+        for name, seconds in result['timings'].items():
+            steps[name].append(seconds)
+        if result['error']:
+            errors.append(result['error'])
+        else:
+            flows.append(sum(result['timings'].values()))
+    requests_made = sum(len(samples) for samples in steps.values())
+
+    return {
+        'users': users,
+        'concurrency': concurrency,
+        'completed_flows': len(flows),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'elapsed_s': round(elapsed, 3),
+        'flows_per_s': round(len(flows) / elapsed, 2) if elapsed else 0.0,
+        'requests_per_s': round(requests_made / elapsed, 2) if elapsed else 0.0,
+        'flow': summarize(flows),
+        'steps': {name: summarize(samples) for name, samples in steps.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=40, help="Virtual users, one flow each")
+    parser.add_argument('--concurrency', type=int, default=8, help="Flows running at the same time")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--target', help="Base URL of a running backend (default: start one locally)")
+    parser.add_argument('--llm-latency-ms', type=float, default=300.0, help="Fake Groq mean response delay")
+    parser.add_argument('--llm-jitter-ms', type=float, default=50.0, help="Fake Groq delay standard deviation")
+    parser.add_argument('--fast-hashing', action='store_true',
+                        help="Use a cheap password hasher so register/login do not dominate")
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    if args.target:
+        result = run(args.target.rstrip('/'), args.users, args.concurrency, args.seed)
+    else:
+        with self_hosted_backend(args.llm_latency_ms, args.llm_jitter_ms, args.fast_hashing) as base_url:
+            result = run(base_url, args.users, args.concurrency, args.seed)
+        result['llm_latency_ms'] = args.llm_latency_ms
+    report(result, args)
+
+
+if __name__ == '__main__':
+    main()
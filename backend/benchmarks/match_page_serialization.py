@@ -0,0 +1,123 @@
+"""
+Serialization time and bytes-on-wire for a page of JobMatch results.
+
+Builds an in-memory page of fully nested JobMatch payloads (candidate
+work history, job description and cover letter included), then compares
+the stdlib and orjson renderers and the compressed response sizes::
+
+    python -m benchmarks.match_page_serialization --page-size 100
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+import uuid
+
+from benchmarks.common import add_baseline_arguments, report, setup_django, summarize
+
+WORDS = (
+    "designed delivered built scaled migrated owned led mentored optimized automated "
+    "service platform pipeline api database cluster cache queue dashboard model "
+    "python django postgresql kubernetes react aws terraform kafka redis spark "
+    "reliability latency throughput cost security onboarding roadmap customers "
+    "team engineers stakeholders product analytics billing search payments"
+).split()
+
+
+def text(rng: random.Random, words: int) -> str:
+    """Pseudo-random prose, so compression ratios resemble real text rather than repeats."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def build_page(page_size: int):
+    from django.contrib.auth.models import User
+    from django.utils import timezone
+    from candidates.models import CandidateProfile
+    from jobs.models import JobPosting
+    from matching.models import JobMatch
+    from matching.serializers import JobMatchSerializer
+
+    rng = random.Random(42)
+    matches = []
+    for i in range(page_size):
+        user = User(username=f"candidate{i}")
+        candidate = CandidateProfile(
+            id=uuid.uuid4(), user=user, name=f"Candidate {i}",
+            parsed_skills=["Python", "Django", "PostgreSQL", "Kubernetes", "React", f"Skill {i}"],
+            parsed_education=[{"degree": "BSc Computer Science", "institution": "State University", "year": 2015}],
+            parsed_work_experience=[
+                {"title": f"Engineer {n}", "company": f"Company {n}", "years": 2, "description": text(rng, 60)}
+                for n in range(4)
+            ],
+        )
+        job = JobPosting(
+            id=uuid.uuid4(), title=f"Backend Engineer {i}", company="Acme",
+            description=text(rng, 400), location="Remote",
+            required_skills=["Python", "Django", "SQL", "AWS"], posted_date=timezone.now(),
+        )
+        matches.append(JobMatch(
+            id=uuid.uuid4(), candidate=candidate, job=job, match_score=50 + i % 50,
+            missing_skills=["AWS"], match_summary=text(rng, 50), cover_letter=text(rng, 300),
+        ))
+    return {"next": None, "previous": None, "results": JobMatchSerializer(matches, many=True).data}
+
+
+def time_call(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    return result, summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.conf import settings
+    from rest_framework.renderers import JSONRenderer
+    from core.middleware import brotli
+    from core.renderers import FastJSONRenderer, orjson
+
+    page = build_page(args.page_size)
+
+    stdlib_body, stdlib_render = time_call(lambda: JSONRenderer().render(page), args.repeat)
+    gzip_body, gzip_time = time_call(lambda: gzip.compress(stdlib_body, compresslevel=6), args.repeat)
+    result = {
+        'page_size': args.page_size,
+        'render': {'stdlib': stdlib_render},
+        'parse': {'stdlib': time_call(lambda: json.loads(stdlib_body), args.repeat)[1]},
+        'compress': {'gzip': gzip_time},
+        'bytes': {
+            'raw': len(stdlib_body),
+            'gzip': len(gzip_body),
+        },
+    }
+    if orjson is not None:
+        fast_body, fast_render = time_call(lambda: FastJSONRenderer().render(page), args.repeat)
+        assert json.loads(fast_body) == json.loads(stdlib_body)
+        result['render']['orjson'] = fast_render
+        result['parse']['orjson'] = time_call(lambda: orjson.loads(fast_body), args.repeat)[1]
+    else:
+        result['render']['orjson'] = 'orjson not installed'
+    if brotli is not None:
+        brotli_body, brotli_time = time_call(
+            lambda: brotli.compress(stdlib_body, quality=settings.COMPRESSION_BROTLI_QUALITY), args.repeat
+        )
+        result['compress']['brotli'] = brotli_time
+        result['bytes']['brotli'] = len(brotli_body)
+    else:
+        result['bytes']['brotli'] = 'brotli not installed'
+
+    report(result, args)
+
+
+if __name__ == '__main__':
+    main()
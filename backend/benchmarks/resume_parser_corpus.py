@@ -0,0 +1,71 @@
+"""
+ResumeParser text and link extraction on a generated resume corpus.
+
+Generates `--count` resumes per format (PDF, DOCX, TXT) with a fixed
+seed, then times ResumeParser.extract_text and extract_urls on every
+file, `--repeat` times, after one untimed warm-up pass::
+
+    python -m benchmarks.resume_parser_corpus --count 50 --repeat 3
+    python -m benchmarks.resume_parser_corpus --save-baseline parser-baseline.json
+    python -m benchmarks.resume_parser_corpus --baseline parser-baseline.json
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import BACKEND_DIR, add_baseline_arguments, report, summarize
+from benchmarks.corpus import FORMATS, generate_corpus
+
+
+def run(count: int, repeat: int, seed: int) -> dict:
+    import sys
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    from utils.resume_parser import ResumeParser
+
+    formats = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_corpus(Path(tmp), count, seed)
+        for file_format in FORMATS:
+            files = [path for path in paths if path.suffix == f'.{file_format}']
+            for path in files:
+                ResumeParser.extract_urls(ResumeParser.extract_text(path), path)
+
+            text_latencies, url_latencies = [], []
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for path in files:
+                    t0 = time.perf_counter()
+                    text = ResumeParser.extract_text(path)
+                    t1 = time.perf_counter()
+                    ResumeParser.extract_urls(text, path)
+                    url_latencies.append(time.perf_counter() - t1)
+                    text_latencies.append(t1 - t0)
+            elapsed = time.perf_counter() - started
+
+            processed = len(files) * repeat
+            formats[file_format] = {
+                'files': len(files),
+                'avg_bytes': round(sum(path.stat().st_size for path in files) / len(files)) if files else 0,
+                'files_per_s': round(processed / elapsed, 1) if elapsed else 0.0,
+                'extract_text': summarize(text_latencies),
+                'extract_urls': summarize(url_latencies),
+            }
+
+    return {'count': count, 'repeat': repeat, 'seed': seed, 'formats': formats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=30, help="Resumes per format")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed passes over the corpus")
+    parser.add_argument('--seed', type=int, default=42)
+    add_baseline_arguments(parser)
+    args = parser.parse_args()
+
+    report(run(args.count, args.repeat, args.seed), args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from candidates.search import store_resume_text
+from candidates.services import extract_resume, resolve_email, apply_parsed_resume
+from utils.llm_functions import GroqLLMFunctions
+
+
+class Command(BaseCommand):
+    help = "Re-run extraction (and LLM parsing) on stored resume files without new uploads"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--candidate', action='append', dest='candidates', default=[],
+                            help="Only re-parse this candidate id (repeatable)")
+        parser.add_argument('--workers', type=int, default=4,
+                            help="Resumes extracted and parsed concurrently")
+        parser.add_argument('--text-only', action='store_true',
+                            help="Only refresh the stored resume text and search index, skip the LLM")
+
+    def handle(self, *args, **options):
+        candidates = CandidateProfile.objects.exclude(resume_sha256__isnull=True).exclude(resume_sha256='')
+        if options['candidates']:
+            candidates = candidates.filter(id__in=options['candidates'])
+        candidates = list(candidates)
+
+        llm_functions = None if options['text_only'] else GroqLLMFunctions()
+
+        def reparse(candidate):
+            resume_text, extracted_urls = extract_resume(candidate.resume_sha256, candidate.resume_file_type)
+            parsed_data = None
+            if llm_functions is not None:
+                parsed_data = resolve_email(llm_functions.parse_resume(resume_text), extracted_urls)
+                # parse_resume returns empty defaults when the LLM call fails;
+                # applying them would wipe the stored profile. An email is
+                # required, as for uploads
+                if not parsed_data.get('email'):
+                    raise ValueError("Parsed resume did not contain an email address.")
+            return resume_text, parsed_data
+
+        updated = failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            futures = {executor.submit(reparse, candidate): candidate for candidate in candidates}
+            # Workers only extract and call the LLM; database writes stay on this thread
+            for future in as_completed(futures):
+                candidate = futures[future]
+                try:
+                    resume_text, parsed_data = future.result()
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"Failed to re-parse candidate {candidate.id}: {e}")
+                    continue
+
+                if parsed_data is not None:
+                    apply_parsed_resume(candidate, parsed_data)
+                    candidate.save()
+                store_resume_text(candidate, resume_text)
+                updated += 1
+                self.stdout.write(f"Re-parsed candidate {candidate.id}")
+
+        self.stdout.write(self.style.SUCCESS(f"Re-parsed {updated} resumes ({failed} failed)"))
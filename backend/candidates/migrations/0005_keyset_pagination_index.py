@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:53
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0004_remove_candidateprofile_username_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="candidateprofile",
+            index=models.Index(
+                fields=["created_at", "id"], name="candidates_created_id"
+            ),
+        ),
+    ]
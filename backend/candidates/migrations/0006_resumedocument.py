@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0005_keyset_pagination_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("codec", models.CharField(max_length=10)),
+                ("compressed_text", models.BinaryField()),
+                ("text_length", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "candidate",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="resume_document",
+                        to="candidates.candidateprofile",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+SQLITE_CREATE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS candidates_resume_fts "
+    "USING fts5(body, content='', tokenize='porter unicode61')",
+]
+POSTGRES_CREATE = [
+    "CREATE TABLE IF NOT EXISTS candidates_resume_tsv "
+    "(document_id bigint PRIMARY KEY, body tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS candidates_resume_tsv_body "
+    "ON candidates_resume_tsv USING GIN (body)",
+]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_CREATE, "postgresql": POSTGRES_CREATE}.get(vendor, [])
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    table = {"sqlite": "candidates_resume_fts", "postgresql": "candidates_resume_tsv"}.get(vendor)
+    if table:
+        schema_editor.execute(f"DROP TABLE IF EXISTS {table}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0006_resumedocument"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0007_resume_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="candidateprofile",
+            name="resume_file_type",
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+        migrations.AddField(
+            model_name="candidateprofile",
+            name="resume_filename",
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name="candidateprofile",
+            name="resume_sha256",
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+    ]
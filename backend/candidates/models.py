@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
 import uuid
+from utils.text_compression import compress_text, decompress_text
 
 class CandidateProfile(models.Model):
     """Model to store candidate resume and profile information"""
@@ -15,12 +16,45 @@ class CandidateProfile(models.Model):
     parsed_skills = models.JSONField(null=True, blank=True)
     parsed_education = models.JSONField(null=True, blank=True)
     parsed_work_experience = models.JSONField(null=True, blank=True)
+
+    # Original resume file in the content-addressed blob store
+    resume_sha256 = models.CharField(max_length=64, null=True, blank=True, db_index=True)
+    resume_file_type = models.CharField(max_length=10, null=True, blank=True)
+    resume_filename = models.CharField(max_length=255, null=True, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='candidates_created_id'),
+        ]
+
     def __str__(self):
         return self.name if self.name else f"Candidate {self.id}"
 
 
 
+
+
+class ResumeDocument(models.Model):
+    """Raw resume text, stored compressed and indexed for full-text search"""
+    candidate = models.OneToOneField(CandidateProfile, on_delete=models.CASCADE, related_name='resume_document')
+    codec = models.CharField(max_length=10)
+    compressed_text = models.BinaryField()
+    text_length = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def text(self):
+        if not self.compressed_text:
+            return ''
+        return decompress_text(self.codec, bytes(self.compressed_text))
+
+    @text.setter
+    def text(self, value):
+        self.codec, self.compressed_text = compress_text(value or '')
+        self.text_length = len(value or '')
+
+    def __str__(self):
+        return f"Resume text for {self.candidate}"
@@ -0,0 +1,166 @@
+import html
+import logging
+import re
+from typing import Any, Dict, List
+
+from django.db import connection, transaction
+
+from .models import ResumeDocument
+
+logger = logging.getLogger(__name__)
+
+# Created by migration 0007. SQLite: contentless FTS5 table (the text
+# itself lives compressed in ResumeDocument), rowid is ResumeDocument.id.
+# PostgreSQL: one tsvector per ResumeDocument with a GIN index.
+SQLITE_INDEX_TABLE = 'candidates_resume_fts'
+POSTGRES_INDEX_TABLE = 'candidates_resume_tsv'
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+SNIPPET_RADIUS = 80
+
+
+def _unindex(cursor, document_id: int, old_text: str) -> None:
+    if connection.vendor == 'sqlite':
+        # Contentless FTS5 tables need the original text to remove a row
+        cursor.execute(
+            f"INSERT INTO {SQLITE_INDEX_TABLE}({SQLITE_INDEX_TABLE}, rowid, body) VALUES ('delete', %s, %s)",
+            [document_id, old_text]
+        )
+    elif connection.vendor == 'postgresql':
+        cursor.execute(f"DELETE FROM {POSTGRES_INDEX_TABLE} WHERE document_id = %s", [document_id])
+
+
+def _index(cursor, document_id: int, text: str) -> None:
+    if connection.vendor == 'sqlite':
+        cursor.execute(
+            f"INSERT INTO {SQLITE_INDEX_TABLE}(rowid, body) VALUES (%s, %s)",
+            [document_id, text]
+        )
+    elif connection.vendor == 'postgresql':
+        cursor.execute(
+            f"INSERT INTO {POSTGRES_INDEX_TABLE}(document_id, body) VALUES (%s, to_tsvector('english', %s))",
+            [document_id, text]
+        )
+
+
+def store_resume_text(candidate, text: str) -> ResumeDocument:
+    """
+    Persist a candidate's raw resume text (compressed) and re-index it.
+
+    Args:
+        candidate (CandidateProfile): Candidate the resume belongs to
+        text (str): Raw resume text
+
+    Returns:
+        ResumeDocument: Saved document
+    """
+    with transaction.atomic():
+        document = ResumeDocument.objects.select_for_update().filter(candidate=candidate).first()
+        old_text = None
+        if document is None:
+            document = ResumeDocument(candidate=candidate)
+        elif document.compressed_text:
+            old_text = document.text
+
+        document.text = text
+        document.save()
+
+        with connection.cursor() as cursor:
+            if old_text is not None:
+                _unindex(cursor, document.id, old_text)
+            _index(cursor, document.id, text)
+    return document
+
+
+def remove_resume_from_index(document: ResumeDocument) -> None:
+    """Drop a document from the full-text index (called before it is deleted)."""
+    with connection.cursor() as cursor:
+        _unindex(cursor, document.id, document.text)
+
+
+def _query_terms(query: str) -> List[str]:
+    return _TOKEN.findall(query.lower())
+
+
+def _search_ids(terms: List[str], limit: int) -> List[tuple]:
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            # Quote every term so user input cannot inject FTS5 query syntax
+            match = ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+            cursor.execute(
+                f"SELECT rowid, bm25({SQLITE_INDEX_TABLE}) AS rank FROM {SQLITE_INDEX_TABLE} "
+                f"WHERE {SQLITE_INDEX_TABLE} MATCH %s ORDER BY rank LIMIT %s",
+                [match, limit]
+            )
+            # bm25() is lower-is-better; flip it so higher means more relevant
+            return [(row[0], -row[1]) for row in cursor.fetchall()]
+        if connection.vendor == 'postgresql':
+            cursor.execute(
+                f"SELECT document_id, ts_rank(body, query) AS rank "
+                f"FROM {POSTGRES_INDEX_TABLE}, plainto_tsquery('english', %s) query "
+                f"WHERE body @@ query ORDER BY rank DESC LIMIT %s",
+                [' '.join(terms), limit]
+            )
+            return cursor.fetchall()
+    raise NotImplementedError(f"Full-text search is not supported on {connection.vendor}")
+
+
+def make_snippet(text: str, terms: List[str], radius: int = SNIPPET_RADIUS) -> str:
+    """
+    Cut a window of `text` around the first query term and mark matches with <b></b>.
+
+    The resume text is HTML-escaped, so the snippet is safe to render as
+    HTML: the <b> tags are the only markup in it.
+    """
+    if not text:
+        return ''
+    pattern = re.compile(r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\w*', re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - radius) if first else 0
+    end = min(len(text), (first.end() if first else 0) + radius)
+    window = ' '.join(text[start:end].split())
+
+    parts = []
+    position = 0
+    for match in pattern.finditer(window):
+        parts.append(html.escape(window[position:match.start()]))
+        parts.append(f"<b>{html.escape(match.group(0))}</b>")
+        position = match.end()
+    parts.append(html.escape(window[position:]))
+    return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(text) else '')
+
+
+def search_resumes(query: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Rank candidates by full-text relevance of their resume to `query`.
+
+    Args:
+        query (str): Free-text keywords
+        limit (int): Maximum number of hits
+
+    Returns:
+        List[Dict]: Hits with candidate id, name, rank and snippet, best first
+
+    Raises:
+        NotImplementedError: The database has no full-text index (only
+        SQLite and PostgreSQL do, see migration 0007)
+    """
+    terms = _query_terms(query)
+    if not terms:
+        return []
+
+    ranked = _search_ids(terms, limit)
+    documents = ResumeDocument.objects.select_related('candidate').in_bulk([doc_id for doc_id, _ in ranked])
+
+    hits = []
+    for doc_id, rank in ranked:
+        document = documents.get(doc_id)
+        if document is None:
+            continue
+        hits.append({
+            'candidate_id': str(document.candidate_id),
+            'name': document.candidate.name,
+            'rank': float(rank),
+            'snippet': make_snippet(document.text, terms),
+        })
+    return hits
@@ -3,6 +3,7 @@ from rest_framework import serializers
 from .models import CandidateProfile
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
+from core.serializers import SparseFieldsetMixin
 
 class UserRegistrationSerializer(serializers.Serializer):
     username = serializers.CharField(required=True)
@@ -48,7 +49,7 @@ class UserLoginSerializer(serializers.Serializer):
         data['user'] = user
         return data
 
-class CandidateProfileSerializer(serializers.ModelSerializer):
+class CandidateProfileSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     username = serializers.ReadOnlyField(source='user.username')
 
     class Meta:
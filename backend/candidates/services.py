@@ -0,0 +1,69 @@
+import os
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from utils.blob_store import BlobStore
+from utils.llm_schemas import as_email
+from utils.resume_parser import ResumeParser
+
+resume_blob_store = BlobStore(settings.RESUME_BLOB_ROOT)
+
+
+def resume_file_type(filename: str) -> str:
+    """File type ('.pdf', '.docx', ...) of an uploaded resume, from its name."""
+    return os.path.splitext(filename or '')[1].lower()
+
+
+def extract_resume(digest: str, file_type: str, file: Optional[BinaryIO] = None) -> Tuple[str, List[str]]:
+    """
+    Extract text and URLs from a stored resume blob.
+
+    Args:
+        digest (str): SHA-256 of the resume in the blob store
+        file_type (str): File type such as '.pdf'
+        file (BinaryIO, optional): The resume content when already at hand
+            (e.g. the upload itself), to avoid reading the blob back
+
+    Returns:
+        Tuple[str, List[str]]: Resume text and the URLs found in it
+    """
+    if file is not None:
+        resume_text = ResumeParser.extract_text(file, file_type)
+        return resume_text, ResumeParser.extract_urls(resume_text, file, file_type)
+
+    with resume_blob_store.open(digest) as file:
+        resume_text = ResumeParser.extract_text(file, file_type)
+        extracted_urls = ResumeParser.extract_urls(resume_text, file, file_type)
+    return resume_text, extracted_urls
+
+
+def resolve_email(parsed_data: Dict[str, Any], extracted_urls: List[str]) -> Dict[str, Any]:
+    """
+    Fall back to the resume's mailto links when the LLM found no email.
+
+    The parsed email itself is already validated (see RESUME_SCHEMA).
+
+    Args:
+        parsed_data (Dict): Parsed resume data, updated in place
+        extracted_urls (List[str]): URLs extracted from the resume
+
+    Returns:
+        Dict: The same parsed data
+    """
+    if not parsed_data.get('email'):
+        mailto_links = [url[len('mailto:'):] for url in extracted_urls if url.startswith('mailto:')]
+        parsed_data['email'] = as_email(mailto_links)
+
+    return parsed_data
+
+
+def apply_parsed_resume(candidate, parsed_data: Dict[str, Any]) -> None:
+    """
+    Copy parsed resume fields onto a candidate profile without saving it.
+    """
+    candidate.name = parsed_data.get('name') or candidate.name
+    candidate.email = parsed_data.get('email') or candidate.email
+    candidate.parsed_skills = parsed_data.get('skills', [])
+    candidate.parsed_education = parsed_data.get('education', [])
+    candidate.parsed_work_experience = parsed_data.get('work_experience', [])
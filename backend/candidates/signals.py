@@ -0,0 +1,28 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from core.authentication import invalidate_token_cache
+from core.caching import register_cache_invalidation
+from .models import CandidateProfile, ResumeDocument
+from .search import remove_resume_from_index
+
+register_cache_invalidation(CandidateProfile)
+
+
+@receiver(pre_delete, sender=ResumeDocument)
+def unindex_resume_document(sender, instance, **kwargs):
+    remove_resume_from_index(instance)
+
+
+@receiver(post_delete, sender=Token)
+def drop_cached_token(sender, instance, **kwargs):
+    invalidate_token_cache(instance.key)
+
+
+@receiver(post_save, sender=User)
+def drop_cached_user_tokens(sender, instance, **kwargs):
+    # Cached (user, token) pairs would otherwise keep a deactivated user authenticated
+    for key in Token.objects.filter(user=instance).values_list('key', flat=True):
+        invalidate_token_cache(key)
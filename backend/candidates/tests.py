@@ -1,3 +1,319 @@
-from django.test import TestCase
+import hashlib
+import io
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from utils.blob_store import BlobStore
+from utils.llm_schemas import RESUME_SCHEMA
+from .models import CandidateProfile, ResumeDocument
+from .search import make_snippet, search_resumes, store_resume_text
+from .uploads import MULTIPART_OVERHEAD
+
+
+class MakeSnippetTests(SimpleTestCase):
+    def test_marks_matches(self):
+        snippet = make_snippet('Senior engineer with Python and Django experience', ['python', 'django'])
+        self.assertEqual(snippet, 'Senior engineer with <b>Python</b> and <b>Django</b> experience')
+
+    def test_marks_word_prefixes(self):
+        self.assertEqual(make_snippet('Managed engineers', ['engineer']), 'Managed <b>engineers</b>')
+
+    def test_resume_markup_is_escaped(self):
+        text = '<script>alert("x")</script> Python & <img src=x onerror=alert(1)>'
+        snippet = make_snippet(text, ['python', 'script'])
+        self.assertNotIn('<script', snippet)
+        self.assertNotIn('<img', snippet)
+        self.assertEqual(
+            snippet,
+            '&lt;<b>script</b>&gt;alert(&quot;x&quot;)&lt;/<b>script</b>&gt; <b>Python</b> &amp; '
+            '&lt;img src=x onerror=alert(1)&gt;'
+        )
+
+    def test_window_around_first_match(self):
+        text = 'a ' * 100 + 'Kubernetes' + ' b' * 100
+        snippet = make_snippet(text, ['kubernetes'], radius=10)
+        self.assertTrue(snippet.startswith('…'))
+        self.assertTrue(snippet.endswith('…'))
+        self.assertIn('<b>Kubernetes</b>', snippet)
+        self.assertLess(len(snippet), 60)
+
+    def test_empty_text(self):
+        self.assertEqual(make_snippet('', ['python']), '')
+
+
+class ResumeSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            return
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.ann = CandidateProfile.objects.create(name='Ann')
+        cls.bob = CandidateProfile.objects.create(name='Bob')
+        store_resume_text(cls.ann, 'Python developer. Python, Django and PostgreSQL for five years.')
+        store_resume_text(cls.bob, 'Java developer who also wrote some Python scripts.')
+
+    def setUp(self):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest("Full-text search needs SQLite or PostgreSQL")
+        for cache in caches.all():
+            cache.clear()
+
+    def test_ranks_by_relevance(self):
+        hits = search_resumes('python')
+        self.assertEqual([hit['name'] for hit in hits], ['Ann', 'Bob'])
+        self.assertIn('<b>Python</b>', hits[0]['snippet'])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual([hit['name'] for hit in search_resumes('python django')], ['Ann'])
+        self.assertEqual(search_resumes('python cobol'), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        self.assertEqual([hit['name'] for hit in search_resumes('java OR "django"')], [])
+        self.assertEqual(search_resumes('!!!'), [])
+
+    def test_reindexed_on_update_and_unindexed_on_delete(self):
+        store_resume_text(self.bob, 'Rust and Go engineer.')
+        self.assertEqual([hit['name'] for hit in search_resumes('java')], [])
+        self.assertEqual([hit['name'] for hit in search_resumes('rust')], ['Bob'])
+
+        ResumeDocument.objects.filter(candidate=self.bob).delete()
+        self.assertEqual(search_resumes('rust'), [])
+
+    def test_text_stored_compressed(self):
+        document = ResumeDocument.objects.get(candidate=self.ann)
+        self.assertEqual(document.text, 'Python developer. Python, Django and PostgreSQL for five years.')
+        self.assertEqual(document.text_length, len(document.text))
+
+    def test_search_endpoint(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = client.get('/api/candidates/search/', {'q': 'django', 'limit': 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([hit['candidate_id'] for hit in response.data['results']], [str(self.ann.id)])
+
+        self.assertEqual(client.get('/api/candidates/search/').status_code, 400)
+        self.assertEqual(client.get('/api/candidates/search/', {'q': 'x', 'limit': 'many'}).status_code, 400)
+
+    def test_unsupported_database(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        with mock.patch('candidates.search.connection', mock.Mock(vendor='mysql', cursor=connection.cursor)):
+            response = client.get('/api/candidates/search/', {'q': 'django'})
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response.data, {'error': 'Full-text search is not supported on mysql'})
+
+
+class FakeResumeLLM:
+    """Stand-in for GroqLLMFunctions parsing resumes; text containing 'unparseable' fails."""
+
+    def __init__(self, email='ann@example.com'):
+        self.email = email
+
+    def parse_resume(self, resume_text):
+        if 'unparseable' in resume_text:
+            raise RuntimeError("Groq API call failed")
+        return {
+            'name': 'Ann', 'email': self.email, 'skills': resume_text.split()[:2],
+            'education': [], 'work_experience': []
+        }
+
+
+class TempBlobStoreMixin:
+    def use_temp_blob_store(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.blob_store = BlobStore(directory.name)
+        for target in ('candidates.views.resume_blob_store', 'candidates.services.resume_blob_store'):
+            patcher = mock.patch(target, self.blob_store)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def stored_blobs(self):
+        return sorted(
+            name for root, _, files in os.walk(self.blob_store.root) if os.path.basename(root) != 'tmp'
+            for name in files
+        )
+
+
+class ResumeUploadStorageTests(TempBlobStoreMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('ann', 'ann@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.use_temp_blob_store()
+        self.llm = FakeResumeLLM()
+        patcher = mock.patch('candidates.views.GroqLLMFunctions', side_effect=lambda: self.llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def upload(self, content, path='/api/candidates/upload_resume/', name='resume.txt'):
+        resume = SimpleUploadedFile(name, content, content_type='application/octet-stream')
+        return self.client.post(path, {'resume': resume}, format='multipart')
+
+    def test_parsed_resume_is_stored(self):
+        content = b'Python Django developer'
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 201)
+        digest = hashlib.sha256(content).hexdigest()
+        self.assertEqual(self.stored_blobs(), [digest])
+        candidate = CandidateProfile.objects.get(user=self.user)
+        self.assertEqual((candidate.resume_sha256, candidate.resume_file_type), (digest, '.txt'))
+        self.assertEqual(candidate.resume_document.text, 'Python Django developer')
+
+    def test_failed_parse_leaves_no_blob(self):
+        response = self.upload(b'unparseable resume')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.stored_blobs(), [])
+        self.assertFalse(CandidateProfile.objects.exists())
+
+    def test_resume_without_email_leaves_no_blob(self):
+        self.llm = FakeResumeLLM(email=None)
+        response = self.upload(b'Python developer')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.stored_blobs(), [])
+
+    def test_import_stores_identical_resumes_once(self):
+        content = b'Go Rust developer'
+        first = self.upload(content, '/api/candidates/import_resume/')
+        second = self.upload(content, '/api/candidates/import_resume/')
+        self.assertEqual((first.status_code, second.status_code), (201, 200))
+        self.assertEqual(first.data['id'], second.data['id'])
+        self.assertEqual(self.stored_blobs(), [hashlib.sha256(content).hexdigest()])
+
+    @override_settings(RESUME_UPLOAD_MAX_SIZE=1024)
+    def test_refused_from_content_length(self):
+        with mock.patch('candidates.uploads.ResumeUploadHandler.receive_data_chunk') as receive:
+            response = self.upload(b'x' * (1024 + MULTIPART_OVERHEAD + 1))
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.data, {'error': 'Resume is larger than the 1 KB limit'})
+        receive.assert_not_called()
+        self.assertEqual(self.stored_blobs(), [])
+
+    @override_settings(RESUME_UPLOAD_MAX_SIZE=1024)
+    def test_refused_when_streamed_body_exceeds_limit(self):
+        # Small enough to pass the Content-Length check
+        response = self.upload(b'x' * 1025)
+        self.assertEqual(response.status_code, 413)
+        self.assertFalse(CandidateProfile.objects.exists())
+
+        self.assertEqual(self.upload(b'x' * 1024).status_code, 201)
+
+    def test_content_must_match_extension(self):
+        response = self.upload(b'Plain text pretending to be a PDF', name='resume.pdf')
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(response.data, {'error': 'File content is not a PDF'})
+
+        response = self.upload(b'%PDF-1.7 ...', name='resume.docx')
+        self.assertEqual(response.status_code, 415)
+
+        response = self.upload(b'MZ', name='resume.exe')
+        self.assertEqual(response.status_code, 415)
+        self.assertIn("Unsupported file type '.exe'", response.data['error'])
+        self.assertEqual(self.stored_blobs(), [])
+
+    def test_missing_file(self):
+        response = self.client.post('/api/candidates/upload_resume/', {}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+
+    def test_import_dedups_by_content_hash(self):
+        content = b'Go Rust developer'
+        first = self.upload(content, '/api/candidates/import_resume/', name='first.txt')
+        self.assertEqual(first.status_code, 201)
+        candidate = CandidateProfile.objects.get(id=first.data['id'])
+        self.assertEqual(candidate.resume_sha256, hashlib.sha256(content).hexdigest())
+        self.assertIsNone(candidate.user)
+
+        # Same bytes under another name: the same candidate, without parsing again
+        with mock.patch.object(self.llm, 'parse_resume') as parse:
+            second = self.upload(content, '/api/candidates/import_resume/', name='renamed.txt')
+        self.assertEqual((second.status_code, second.data['id']), (200, first.data['id']))
+        parse.assert_not_called()
+
+        third = self.upload(content + b' and Python', '/api/candidates/import_resume/', name='other.txt')
+        self.assertEqual(third.status_code, 201)
+        self.assertEqual(CandidateProfile.objects.count(), 2)
+
+
+class ReparseResumesCommandTests(TempBlobStoreMixin, TestCase):
+    def setUp(self):
+        self.use_temp_blob_store()
+        self.ann = self.candidate('Ann', b'Python Django developer')
+        self.bob = self.candidate('Bob', b'unparseable Go developer')
+        CandidateProfile.objects.create(name='Cy')
+
+    def candidate(self, name, content):
+        digest, _ = self.blob_store.put_chunks([content])
+        candidate = CandidateProfile.objects.create(name=name, resume_sha256=digest, resume_file_type='.txt')
+        store_resume_text(candidate, 'outdated text')
+        return candidate
+
+    def call(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch('candidates.management.commands.reparse_resumes.GroqLLMFunctions', FakeResumeLLM):
+            call_command('reparse_resumes', *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def text(self, candidate):
+        return ResumeDocument.objects.get(candidate=candidate).text
+
+    def test_reparse_with_llm(self):
+        stdout, stderr = self.call('--workers', '2')
+        self.assertIn('Re-parsed 1 resumes (1 failed)', stdout)
+        self.assertEqual(stderr, f'Failed to re-parse candidate {self.bob.id}: Groq API call failed\n')
+        self.ann.refresh_from_db()
+        self.assertEqual((self.ann.email, self.ann.parsed_skills), ('ann@example.com', ['Python', 'Django']))
+        self.assertEqual(self.text(self.ann), 'Python Django developer')
+        self.assertEqual(self.text(self.bob), 'outdated text')
+
+    def test_failed_llm_call_leaves_profiles_alone(self):
+        CandidateProfile.objects.filter(id=self.ann.id).update(
+            email='ann@example.com', parsed_skills=['Python'], parsed_education=['BSc'], parsed_work_experience=['Acme']
+        )
+
+        class FailingLLM:
+            # Like GroqLLMFunctions.parse_resume when the API call fails
+            def parse_resume(self, resume_text):
+                return RESUME_SCHEMA.defaults()
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch('candidates.management.commands.reparse_resumes.GroqLLMFunctions', FailingLLM):
+            call_command('reparse_resumes', stdout=stdout, stderr=stderr)
+        self.assertIn('Re-parsed 0 resumes (2 failed)', stdout.getvalue())
+        self.assertIn(f'Failed to re-parse candidate {self.ann.id}: Parsed resume did not contain an email address.', stderr.getvalue())
+        self.ann.refresh_from_db()
+        self.assertEqual(
+            (self.ann.parsed_skills, self.ann.parsed_education, self.ann.parsed_work_experience),
+            (['Python'], ['BSc'], ['Acme'])
+        )
+        self.assertEqual(self.text(self.ann), 'outdated text')
+
+    def test_text_only(self):
+        with mock.patch('candidates.management.commands.reparse_resumes.GroqLLMFunctions') as llm_class:
+            call_command('reparse_resumes', '--text-only', stdout=io.StringIO())
+        llm_class.assert_not_called()
+        self.assertEqual(self.text(self.bob), 'unparseable Go developer')
+        self.bob.refresh_from_db()
+        self.assertIsNone(self.bob.parsed_skills)
+
+    def test_selected_candidates_and_missing_blob(self):
+        self.blob_store.delete(self.ann.resume_sha256)
+        stdout, stderr = self.call('--candidate', str(self.ann.id))
+        self.assertIn('Re-parsed 0 resumes (1 failed)', stdout)
+        self.assertIn(f'Failed to re-parse candidate {self.ann.id}:', stderr)
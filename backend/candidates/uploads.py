@@ -0,0 +1,111 @@
+import hashlib
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+from rest_framework import status
+
+from utils.file_types import FileSniffer, FileTypeMismatch
+from .services import resume_file_type
+
+# Allowance for multipart boundaries, part headers and small form fields
+# when comparing a request's Content-Length with the resume size limit
+MULTIPART_OVERHEAD = 16 * 1024
+
+
+class HashedUploadedFile(UploadedFile):
+    """
+    Uploaded file with its SHA-256 and checked file type, computed while
+    the upload was received.
+    """
+
+    def __init__(self, file, name, content_type, size, charset, sha256, file_type, content_type_extra=None):
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.sha256 = sha256
+        self.file_type = file_type
+
+
+class ResumeUploadHandler(FileUploadHandler):
+    """
+    Receive resume uploads in a single streaming pass that hashes the
+    content (SHA-256), checks its magic bytes against the file extension
+    and enforces RESUME_UPLOAD_MAX_SIZE, spooling to memory or a temporary
+    file as Django's own handlers do (FILE_UPLOAD_MAX_MEMORY_SIZE).
+
+    Oversized requests are refused from their Content-Length before any
+    of the body is read; otherwise the upload stops at the first chunk
+    over the limit or that does not match the declared type. `error` and
+    `status_code` then say why, for the view to report.
+
+    Install it before the request body is parsed:
+        request.upload_handlers = [ResumeUploadHandler(request)]
+    """
+
+    def __init__(self, request=None, max_size=None):
+        super().__init__(request)
+        self.max_size = max_size if max_size is not None else settings.RESUME_UPLOAD_MAX_SIZE
+        self.error = None
+        self.status_code = None
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length > self.max_size + MULTIPART_OVERHEAD:
+            self.error = self._too_large_message()
+            self.status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            # Parsed as an empty form, without reading the body
+            return QueryDict(mutable=True), MultiValueDict()
+        return None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file_type = resume_file_type(self.file_name)
+        self.hasher = hashlib.sha256()
+        self.file = tempfile.SpooledTemporaryFile(
+            max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE, dir=settings.FILE_UPLOAD_TEMP_DIR
+        )
+        try:
+            self.sniffer = FileSniffer(self.file_type)
+        except FileTypeMismatch as e:
+            self._reject(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_size:
+            self._reject(self._too_large_message(), status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        try:
+            self.sniffer.update(raw_data)
+        except FileTypeMismatch as e:
+            self._reject(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.hasher.update(raw_data)
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        try:
+            self.sniffer.finish()
+        except FileTypeMismatch as e:
+            self._reject(str(e), status.HTTP_415_UNSUPPORTED_MEDIA_TYPE)
+        self.file.seek(0)
+        return HashedUploadedFile(
+            file=self.file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            sha256=self.hasher.hexdigest(),
+            file_type=self.file_type,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_interrupted(self):
+        if hasattr(self, 'file'):
+            self.file.close()
+
+    def _too_large_message(self) -> str:
+        return f"Resume is larger than the {self.max_size // 1024} KB limit"
+
+    def _reject(self, message: str, status_code: int) -> None:
+        self.error = message
+        self.status_code = status_code
+        # Stop reading the request body instead of draining it
+        raise StopUpload(connection_reset=True)
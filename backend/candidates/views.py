@@ -1,15 +1,22 @@
-import os
 import logging
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.authtoken.models import Token
 from .models import CandidateProfile
 from .serializers import CandidateProfileSerializer, UserRegistrationSerializer, UserLoginSerializer
-from utils.resume_parser import ResumeParser
+from .search import store_resume_text, search_resumes
+from .services import resume_blob_store, extract_resume, resolve_email, apply_parsed_resume
+from .uploads import ResumeUploadHandler
 from utils.llm_functions import GroqLLMFunctions
+from core.caching import CachedResponseMixin
+from core.admission import LLMRateThrottle, llm_admission
+from core.export import export_format, export_response
+from matching.exports import CANDIDATE_EXPORT_COLUMNS, parse_export_filters, candidate_export_rows
+from skills.services import parse_skill_filter, filter_candidates_by_skills
+from django.conf import settings
 from django.contrib.auth import login as django_login, logout as django_logout
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
@@ -40,55 +47,139 @@ class UserLoginView(APIView):
 
 class UserLogoutView(APIView):
     def post(self, request):
+        # Revoke the API token; deleting it also evicts it from the auth cache
+        if isinstance(request.auth, Token):
+            request.auth.delete()
         django_logout(request)
         return Response({'message': 'Logout successful'}, status=status.HTTP_200_OK)
 
 @method_decorator(csrf_exempt, name='dispatch')
-class CandidateProfileViewSet(viewsets.ModelViewSet):
-    queryset = CandidateProfile.objects.all()
+class CandidateProfileViewSet(CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = CandidateProfile.objects.select_related('user')
     serializer_class = CandidateProfileSerializer
     permission_classes = [IsAuthenticated]
-    
-    @action(detail=False, methods=['POST'])
+    pagination_ordering = ('-created_at', '-id')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        skills = parse_skill_filter(self.request.query_params.get('skills'))
+        return filter_candidates_by_skills(queryset, skills)
+
+    @action(detail=False, methods=['GET'])
+    def search(self, request):
+        """
+        Full-text search over raw resume text: `?q=keywords&limit=20`.
+        """
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {"error": "Query parameter q is required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), 100))
+        except ValueError:
+            return Response({"error": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            hits = search_resumes(query, limit)
+        except NotImplementedError as e:
+            # The resume text is stored compressed, so there is no plain
+            # column to fall back to a LIKE query on
+            return Response({"error": str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED)
+        return Response({"results": hits}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['GET'], permission_classes=[IsAdminUser])
+    def export(self, request):
+        """
+        Stream every matching candidate profile as a JSONL (default) or CSV
+        download: `?file_format=csv&created_after=2024-01-01&skills=python`.
+        `job_id`, `min_score` and `max_score` select candidates by their matches.
+        Staff only: rows include candidates' email addresses and phone numbers.
+        """
+        try:
+            file_format = export_format(request.query_params.get('file_format'))
+            filters = parse_export_filters(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = candidate_export_rows(filters, settings.EXPORT_CHUNK_SIZE)
+        return export_response(rows, CANDIDATE_EXPORT_COLUMNS, file_format, 'candidates')
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
     def upload_resume(self, request):
-        resume_file = request.FILES.get('resume')
+        """
+        Parse an uploaded `resume` into the requesting user's own profile.
+        """
+        resume_file, error = self._receive_resume(request)
+        if error is not None:
+            return error
+
         user = request.user
+        # Create a new profile if it doesn't exist for this user
+        candidate = CandidateProfile.objects.filter(user=user).first() or CandidateProfile(user=user)
+        return self._save_resume(candidate, resume_file)
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
+    def import_resume(self, request):
+        """
+        Create a candidate profile, not linked to any user, from an
+        uploaded `resume` (one file per request, for batch imports).
+
+        Importing a file again returns the candidate created from it the
+        first time, without parsing it again.
+        """
+        resume_file, error = self._receive_resume(request)
+        if error is not None:
+            return error
+
+        candidate = CandidateProfile.objects.filter(user__isnull=True, resume_sha256=resume_file.sha256).first()
+        if candidate is not None:
+            serializer = self.get_serializer(candidate)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        return self._save_resume(CandidateProfile(), resume_file)
+
+    def _receive_resume(self, request):
+        """
+        Read the `resume` upload, hashing, size-checking and type-checking
+        it while it is received.
+
+        Returns:
+            The uploaded HashedUploadedFile and None, or None and an error Response
+        """
+        # This has to happen before anything reads the request body
+        upload_handler = ResumeUploadHandler(request._request)
+        request._request.upload_handlers = [upload_handler]
+        resume_file = request.FILES.get('resume')
+
+        if upload_handler.error:
+            return None, Response({"error": upload_handler.error}, status=upload_handler.status_code)
 
         if not resume_file:
-            return Response(
+            return None, Response(
                 {"error": "No resume file uploaded"},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        return resume_file, None
 
-        os.makedirs('media/temp_resumes', exist_ok=True)
-        temp_path = f"media/temp_resumes/{resume_file.name}"
-
-        with open(temp_path, 'wb+') as destination:
-            for chunk in resume_file.chunks():
-                destination.write(chunk)
+    def _save_resume(self, candidate, resume_file):
+        """
+        Extract and parse `resume_file`, store it, and save the result to
+        `candidate` (created if it is not saved yet).
+        """
+        file_type = resume_file.file_type
 
         try:
-            resume_text = ResumeParser.extract_text(temp_path)
-            extracted_urls = ResumeParser.extract_urls(resume_text, temp_path)
+            resume_text, extracted_urls = extract_resume(resume_file.sha256, file_type, resume_file.file)
             logger.info(f"Extracted URLs: {extracted_urls}")
             llm_functions = GroqLLMFunctions()
             parsed_data = llm_functions.parse_resume(resume_text)
             logger.info(f"Parsed resume data: {parsed_data}")
 
-            # If email is a list, extract first valid email address containing '@'
-            if isinstance(parsed_data.get('email'), list):
-                email_candidates = [item for item in parsed_data['email'] if '@' in item]
-                parsed_data['email'] = email_candidates[0] if email_candidates else None
-
-            # Ensure the email is valid (contains '@'); if not, clear it to allow fallback:
-            if parsed_data.get('email') and '@' not in parsed_data.get('email'):
-                parsed_data['email'] = None
-
-            # Fall back to extracting mailto emails from clickable links if needed
-            if not parsed_data.get('email'):
-                mailto_emails = [url.replace('mailto:', '') for url in extracted_urls if url.startswith('mailto:')]
-                if mailto_emails:
-                    parsed_data['email'] = mailto_emails[0]
+            resolve_email(parsed_data, extracted_urls)
 
             if not parsed_data.get('email'):
                 logger.error(f"Parsed resume data missing email: {parsed_data}")
@@ -97,31 +188,22 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            try:
-                candidate = CandidateProfile.objects.get(user=user)
-                # Update existing profile
-                candidate.name = parsed_data.get('name', candidate.name) 
-                candidate.email = parsed_data.get('email', candidate.email)
-                candidate.parsed_skills = parsed_data.get('skills', [])
-                candidate.parsed_education = parsed_data.get('education', [])
-                candidate.parsed_work_experience = parsed_data.get('work_experience', [])
-                candidate.resume_text = resume_text
-                candidate.save()
-                serializer = self.get_serializer(candidate)
-                return Response(serializer.data, status=status.HTTP_200_OK)
-            except CandidateProfile.DoesNotExist:
-                # Create a new profile if it doesn't exist for this user
-                candidate = CandidateProfile.objects.create(
-                    user=user,
-                    name=parsed_data.get('name'),
-                    email=parsed_data.get('email'),
-                    parsed_skills=parsed_data.get('skills', []),
-                    parsed_education=parsed_data.get('education', []),
-                    parsed_work_experience=parsed_data.get('work_experience', []),
-                    resume_text=resume_text # Store the raw text
-                )
-                serializer = self.get_serializer(candidate)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # Keep the original file, keyed by content, so it can be re-parsed
+            # later. Stored only once extraction and parsing succeeded, so
+            # rejected uploads leave nothing behind; an already stored
+            # resume is not written again
+            resume_sha256, _ = resume_blob_store.put_chunks(resume_file.chunks(), digest=resume_file.sha256)
+
+            created = candidate._state.adding
+            apply_parsed_resume(candidate, parsed_data)
+            candidate.resume_sha256 = resume_sha256
+            candidate.resume_file_type = file_type
+            candidate.resume_filename = resume_file.name
+            candidate.save()
+            store_resume_text(candidate, resume_text)  # Store the raw text
+
+            serializer = self.get_serializer(candidate)
+            return Response(serializer.data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
         except Exception as e:
             logger.exception("Error during resume upload")
@@ -129,7 +211,3 @@ class CandidateProfileViewSet(viewsets.ModelViewSet):
                 {"error": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-    
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""
+Admission control for the LLM-backed endpoints.
+
+Each request to an LLM-backed action holds two slots for its whole
+duration, including a streamed response: one of LLM_USER_CONCURRENCY
+for its user (or client address, when anonymous) and one of
+LLM_GLOBAL_CONCURRENCY shared by everyone. Slots are cache keys taken
+with `cache.add` and given a lease timeout, so a worker that dies
+holding one only blocks it until the lease expires.
+
+A request that finds no free slot waits, for at most ADMISSION_MAX_WAIT
+seconds, in a bounded queue (ADMISSION_QUEUE_SIZE in total and
+ADMISSION_USER_QUEUE_SIZE per user). When the queue is full or the wait
+times out, it is answered 429 with a Retry-After header, instead of
+tying up a worker behind a saturated LLM. LLMRateThrottle also caps how
+often each user may call these actions (LLM_THROTTLE_RATE).
+
+Slots live in the `admission` cache (ADMISSION_CACHE_BACKEND), which
+every worker process shares and whose `add` and `delete_if_equal` are
+atomic: a table in the main database by default, created by migrate
+(core.cache_backends.AtomicDatabaseCache), or Redis.
+"""
+import functools
+import time
+import uuid
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import Throttled
+from rest_framework.throttling import BaseThrottle, UserRateThrottle
+
+KEY_PREFIX = 'admission'
+
+
+def _cache():
+    return caches[settings.ADMISSION_CACHE_ALIAS]
+
+
+class Slot:
+    def __init__(self, key: str, token: str):
+        self.key = key
+        self.token = token
+
+    def refresh(self) -> None:
+        _cache().touch(self.key, settings.ADMISSION_LEASE_SECONDS)
+
+    def release(self) -> None:
+        # Only free the slot if the lease is still ours (it may have expired
+        # and been taken by another request); checked and deleted atomically
+        _cache().delete_if_equal(self.key, self.token)
+
+
+class SlotPool:
+    """
+    Counting semaphore of `size` slots kept in the cache. A size of 0 or
+    less means unlimited.
+    """
+
+    def __init__(self, name: str, size: int):
+        self.name = name
+        self.size = size
+
+    def try_acquire(self) -> Optional[Slot]:
+        if self.size <= 0:
+            return Slot(f"{KEY_PREFIX}:{self.name}:unlimited", token='')
+        cache = _cache()
+        token = uuid.uuid4().hex
+        for index in range(self.size):
+            key = f"{KEY_PREFIX}:{self.name}:{index}"
+            if cache.add(key, token, timeout=settings.ADMISSION_LEASE_SECONDS):
+                return Slot(key, token)
+        return None
+
+
+class Lease:
+    """Slots held by one admitted request."""
+
+    def __init__(self, slots: List[Slot]):
+        self.slots = slots
+        self.refreshed_at = time.monotonic()
+
+    def refresh(self) -> None:
+        for slot in self.slots:
+            if slot.token:
+                slot.refresh()
+        self.refreshed_at = time.monotonic()
+
+    def release(self) -> None:
+        for slot in self.slots:
+            if slot.token:
+                slot.release()
+        self.slots = []
+
+
+def _acquire_all(pools: List[SlotPool]) -> Optional[Lease]:
+    slots = []
+    for pool in pools:
+        slot = pool.try_acquire()
+        if slot is None:
+            Lease(slots).release()
+            return None
+        slots.append(slot)
+    return Lease(slots)
+
+
+def _client_identity(request) -> str:
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    return f"ip:{BaseThrottle().get_ident(request)}"
+
+
+def acquire_llm_lease(request) -> Lease:
+    """
+    Admit a request to an LLM-backed action, waiting for capacity if needed.
+
+    Returns:
+        Lease: Slots to release once the response is complete
+
+    Raises:
+        Throttled: When the wait queue is full or no slot frees up in time
+    """
+    identity = _client_identity(request)
+    pools = [
+        SlotPool(f"{identity}:active", settings.LLM_USER_CONCURRENCY),
+        SlotPool('global:active', settings.LLM_GLOBAL_CONCURRENCY),
+    ]
+    lease = _acquire_all(pools)
+    if lease is not None:
+        return lease
+
+    place_in_queue = _acquire_all([
+        SlotPool(f"{identity}:queue", settings.ADMISSION_USER_QUEUE_SIZE),
+        SlotPool('global:queue', settings.ADMISSION_QUEUE_SIZE),
+    ])
+    if place_in_queue is None:
+        raise Throttled(
+            wait=settings.ADMISSION_RETRY_AFTER,
+            detail="Too many requests are waiting for the language model."
+        )
+    try:
+        deadline = time.monotonic() + settings.ADMISSION_MAX_WAIT
+        delay = 0.05
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.5)
+            lease = _acquire_all(pools)
+            if lease is not None:
+                return lease
+    finally:
+        place_in_queue.release()
+    raise Throttled(
+        wait=settings.ADMISSION_RETRY_AFTER,
+        detail="The language model is busy."
+    )
+
+
+class _LeasedContent:
+    """
+    Streaming content that holds a lease until it is exhausted or closed
+    (Django closes it when the response finishes, also when it is never
+    iterated).
+    """
+
+    def __init__(self, content: Iterable[bytes], lease: Lease):
+        self._content = iter(content)
+        self._lease = lease
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            chunk = next(self._content)
+        except BaseException:
+            self.close()
+            raise
+        # Long streams (bulk imports) keep their lease alive
+        if time.monotonic() - self._lease.refreshed_at > settings.ADMISSION_LEASE_SECONDS / 3:
+            self._lease.refresh()
+        return chunk
+
+    def close(self) -> None:
+        self._lease.release()
+        close = getattr(self._content, 'close', None)
+        if close is not None:
+            close()
+
+
+def llm_admission(view_method):
+    """
+    Run a viewset action under admission control (see acquire_llm_lease).
+
+    The lease is released when the action returns or, for streaming
+    responses, when the stream is exhausted or closed.
+
+    Example:
+        @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+        @llm_admission
+        def match_candidate_to_job(self, request):
+            ...
+    """
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        lease = acquire_llm_lease(request)
+        try:
+            response = view_method(self, request, *args, **kwargs)
+        except BaseException:
+            lease.release()
+            raise
+        if isinstance(response, StreamingHttpResponse):
+            response.streaming_content = _LeasedContent(response.streaming_content, lease)
+        else:
+            lease.release()
+        return response
+
+    return wrapper
+
+
+class LLMRateThrottle(UserRateThrottle):
+    """
+    Per-user (per client address when anonymous) request rate for the
+    LLM-backed actions, from the `llm` throttle rate (LLM_THROTTLE_RATE).
+    """
+    scope = 'llm'
@@ -0,0 +1,36 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.authentication import TokenAuthentication
+
+
+def _token_cache_key(key: str) -> str:
+    # Hash the key so raw tokens never end up in cache keys or file names
+    return 'auth-token:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def invalidate_token_cache(key: str) -> None:
+    """Drop a token's cached user, e.g. on logout or token deletion."""
+    caches[settings.AUTH_TOKEN_CACHE_ALIAS].delete(_token_cache_key(key))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication with the token -> user lookup cached for a short TTL.
+
+    The stock class joins authtoken_token to auth_user on every request.
+    Entries are dropped when the token is deleted or its user is saved,
+    and expire after AUTH_TOKEN_CACHE_TIMEOUT seconds otherwise.
+    """
+
+    def authenticate_credentials(self, key):
+        cache = caches[settings.AUTH_TOKEN_CACHE_ALIAS]
+        cache_key = _token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        user, token = super().authenticate_credentials(key)
+        cache.set(cache_key, (user, token), timeout=settings.AUTH_TOKEN_CACHE_TIMEOUT)
+        return user, token
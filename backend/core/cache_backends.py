@@ -0,0 +1,108 @@
+"""
+Cache backends for the admission slots (core/admission.py).
+
+Besides an atomic `add`, each provides `delete_if_equal(key, value)`,
+which deletes a key only while it still holds `value`, in one atomic
+step, so releasing an expired slot cannot free it for whoever took it
+over in the meantime.
+"""
+import base64
+import pickle
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import IntegrityError, connections, router, transaction
+from django.utils.timezone import now as tz_now
+
+
+class AtomicDatabaseCache(DatabaseCache):
+    """
+    Database cache whose `add` is atomic across processes and threads, on
+    any database, so it can back counting semaphores (core/admission.py).
+
+    Django's DatabaseCache takes over an expired key with a SELECT then an
+    UPDATE, which two concurrent callers can both win under READ COMMITTED.
+    Here an expired row is deleted first and the key is then INSERTed, so
+    the primary key lets exactly one caller through.
+
+    A missing table raises instead of failing the `add` silently (which
+    would refuse every request); create it with `manage.py createcachetable`.
+    """
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.get_backend_timeout(timeout)
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        quote_name = connection.ops.quote_name
+        table = quote_name(self._table)
+
+        if timeout is None:
+            expires = datetime.max
+        else:
+            expires = datetime.fromtimestamp(timeout, tz=timezone.utc if settings.USE_TZ else None)
+        expires = connection.ops.adapt_datetimefield_value(expires.replace(microsecond=0))
+        now = connection.ops.adapt_datetimefield_value(tz_now().replace(microsecond=0))
+        value = self._encode(value)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {table} WHERE {quote_name('cache_key')} = %s AND {quote_name('expires')} < %s",
+                [key, now]
+            )
+            try:
+                with transaction.atomic(using=db):
+                    cursor.execute(
+                        f"INSERT INTO {table} ({quote_name('cache_key')}, {quote_name('value')}, "
+                        f"{quote_name('expires')}) VALUES (%s, %s, %s)",
+                        [key, value, expires]
+                    )
+            except IntegrityError:
+                return False
+        return True
+
+    def delete_if_equal(self, key, value, version=None) -> bool:
+        """
+        Delete `key` if it holds `value`, which must pickle to the same
+        bytes every time (e.g. a string).
+        """
+        key = self.make_and_validate_key(key, version=version)
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {quote_name(self._table)} WHERE {quote_name('cache_key')} = %s AND {quote_name('value')} = %s",
+                [key, self._encode(value)]
+            )
+            return cursor.rowcount > 0
+
+    def _encode(self, value) -> str:
+        return base64.b64encode(pickle.dumps(value, self.pickle_protocol)).decode('latin1')
+
+
+class AtomicRedisCache(RedisCache):
+    """Redis cache with an atomic `delete_if_equal` (a server-side script)."""
+
+    _DELETE_IF_EQUAL = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) end return 0"
+
+    def delete_if_equal(self, key, value, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        client = self._cache.get_client(key, write=True)
+        return bool(client.eval(self._DELETE_IF_EQUAL, 1, key, self._cache._serializer.dumps(value)))
+
+
+class AtomicLocMemCache(LocMemCache):
+    """Local-memory cache with `delete_if_equal`; for development only (per process)."""
+
+    def delete_if_equal(self, key, value, version=None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        pickled = pickle.dumps(value, self.pickle_protocol)
+        with self._lock:
+            if self._has_expired(key) or self._cache.get(key) != pickled:
+                return False
+            return self._delete(key)
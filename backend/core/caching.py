@@ -0,0 +1,144 @@
+"""
+Response caching with ETag/Last-Modified for the API viewsets.
+
+Every cached model has a version stamp in the cache (plus one per object),
+bumped by post_save/post_delete. List and detail responses are keyed by
+those stamps, so a conditional GET whose ETag still matches is answered
+with 304 from the cache alone, and an unconditional GET is served from
+the cached payload until a write bumps a stamp.
+
+Stamps expire after API_CACHE_TIMEOUT like the responses keyed by them.
+With a per-process cache (locmem) a write only bumps the stamps of the
+worker that made it, so this bounds how long another worker keeps
+answering 304 or its cached copy; a cache shared by the workers
+(CACHE_BACKEND=file) sees every write at once.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_save, post_delete
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+KEY_PREFIX = 'api-cache'
+
+
+def _cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def _label(model) -> str:
+    return model._meta.label_lower
+
+
+def _version_key(model, pk=None) -> str:
+    key = f"{KEY_PREFIX}:version:{_label(model)}"
+    return f"{key}:{pk}" if pk is not None else key
+
+
+def get_version(model, pk=None) -> int:
+    """
+    Current version stamp (ns timestamp of the last write) of a model or object.
+
+    A missing stamp (first use, expired or evicted) is initialized to now,
+    which only ever causes a cache miss, never a stale hit.
+    """
+    cache = _cache()
+    key = _version_key(model, pk)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=settings.API_CACHE_TIMEOUT)
+        version = cache.get(key) or time.time_ns()
+    return version
+
+
+def invalidate_model_cache(model, pk=None) -> None:
+    """
+    Bump the version of a model (and of one object when `pk` is given).
+
+    Call this after writes that bypass model signals, such as
+    `bulk_create`/`bulk_update`/`QuerySet.update`.
+    """
+    now = time.time_ns()
+    keys = {_version_key(model): now}
+    if pk is not None:
+        keys[_version_key(model, pk)] = now
+    _cache().set_many(keys, timeout=settings.API_CACHE_TIMEOUT)
+
+
+def _invalidate_instance(sender, instance, **kwargs):
+    invalidate_model_cache(sender, instance.pk)
+
+
+def register_cache_invalidation(*models) -> None:
+    """Bump cache versions whenever an instance of `models` is saved or deleted."""
+    for model in models:
+        post_save.connect(_invalidate_instance, sender=model, dispatch_uid=f"{KEY_PREFIX}:save:{_label(model)}")
+        post_delete.connect(_invalidate_instance, sender=model, dispatch_uid=f"{KEY_PREFIX}:delete:{_label(model)}")
+
+
+class CachedResponseMixin:
+    """
+    ViewSet mixin caching `list` and `retrieve` responses.
+
+    `cache_dependencies` lists the models whose writes change the
+    representation (e.g. nested serializers); the viewset's own model is
+    always included.
+    """
+
+    cache_dependencies = ()
+
+    def _dependency_models(self):
+        model = self.queryset.model
+        return [model] + [m for m in self.cache_dependencies if m is not model]
+
+    def list(self, request, *args, **kwargs):
+        versions = [get_version(model) for model in self._dependency_models()]
+        return self._cached_response(request, 'list', versions, lambda: super(CachedResponseMixin, self).list(request, *args, **kwargs))
+
+    def retrieve(self, request, *args, **kwargs):
+        model, *dependencies = self._dependency_models()
+        pk = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        versions = [get_version(model, pk)] + [get_version(dependency) for dependency in dependencies]
+        return self._cached_response(request, 'retrieve', versions, lambda: super(CachedResponseMixin, self).retrieve(request, *args, **kwargs))
+
+    def _cached_response(self, request, scope, versions, compute):
+        fingerprint = hashlib.sha1(
+            repr((scope, request.get_full_path(), request.accepted_media_type, versions)).encode('utf-8')
+        ).hexdigest()
+        etag = f'"{fingerprint}"'
+        last_modified = max(versions) // 1_000_000_000
+
+        if self._not_modified(request, etag, last_modified):
+            return self._with_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+
+        cache = _cache()
+        key = f"{KEY_PREFIX}:response:{fingerprint}"
+        data = cache.get(key)
+        if data is not None:
+            return self._with_validators(Response(data), etag, last_modified)
+
+        response = compute()
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout=settings.API_CACHE_TIMEOUT)
+            self._with_validators(response, etag, last_modified)
+        return response
+
+    @staticmethod
+    def _not_modified(request, etag, last_modified):
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+        if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return if_modified_since is not None and last_modified <= if_modified_since
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -0,0 +1,34 @@
+"""
+SQLite backend that applies PRAGMAs to every new connection.
+
+Configured through `OPTIONS["pragmas"]`, e.g.::
+
+    "OPTIONS": {"pragmas": {"journal_mode": "WAL", "synchronous": "NORMAL"}}
+"""
+import re
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+_PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+_PRAGMA_VALUE = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_connection_params(self):
+        # settings_dict is shared by every thread's connection wrapper, so
+        # the pragmas are taken out of the returned kwargs (a copy) rather
+        # than out of OPTIONS; sqlite3.connect() rejects unknown arguments
+        kwargs = super().get_connection_params()
+        pragmas = kwargs.pop('pragmas', {})
+        for name, value in pragmas.items():
+            if not _PRAGMA_NAME.match(name) or not _PRAGMA_VALUE.match(str(value)):
+                raise ImproperlyConfigured(f"Invalid SQLite pragma: {name}={value}")
+        self.pragmas = pragmas
+        return kwargs
+
+    def get_new_connection(self, conn_params):
+        conn = super().get_new_connection(conn_params)
+        for name, value in self.pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        return conn
@@ -0,0 +1,85 @@
+import csv
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Sequence
+
+from django.http import StreamingHttpResponse
+
+from .renderers import dumps
+
+EXPORT_FORMATS = ('jsonl', 'csv')
+_CONTENT_TYPES = {
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+def export_format(value) -> str:
+    """
+    Validate a requested export format, defaulting to JSONL.
+
+    Raises:
+        ValueError: If the format is not one of EXPORT_FORMATS
+    """
+    value = (value or 'jsonl').lower()
+    if value not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format '{value}', expected one of: {', '.join(EXPORT_FORMATS)}.")
+    return value
+
+
+class _LineBuffer:
+    """Write target for csv.writer that hands each formatted line back."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return dumps(value).decode('utf-8')
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def stream_export(rows: Iterable[Dict[str, Any]], columns: Sequence[str], file_format: str) -> Iterator[bytes]:
+    """
+    Encode rows one at a time as JSONL or CSV.
+
+    Nothing is buffered beyond the current row, so memory stays flat
+    however many rows the (iterator-backed) source yields. In CSV,
+    list and dict values are written as JSON and datetimes as ISO 8601.
+
+    Args:
+        rows (Iterable[Dict]): Rows keyed by column name
+        columns (Sequence[str]): Columns to write, in order
+        file_format (str): 'jsonl' or 'csv'
+
+    Yields:
+        bytes: One encoded line (CSV starts with a header line)
+    """
+    if file_format == 'jsonl':
+        for row in rows:
+            yield dumps({column: row[column] for column in columns}) + b"\n"
+        return
+
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow(columns).encode('utf-8')
+    for row in rows:
+        yield writer.writerow([_csv_value(row[column]) for column in columns]).encode('utf-8')
+
+
+def export_response(
+    rows: Iterable[Dict[str, Any]],
+    columns: Sequence[str],
+    file_format: str,
+    filename: str
+) -> StreamingHttpResponse:
+    """
+    Stream rows to the client as a JSONL or CSV file download.
+    """
+    response = StreamingHttpResponse(
+        stream_export(rows, columns, file_format),
+        content_type=_CONTENT_TYPES[file_format]
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename}.{file_format}"'
+    return response
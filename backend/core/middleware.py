@@ -0,0 +1,188 @@
+import hmac
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.urls import Resolver404, resolve
+from django.utils import timezone
+from django.utils.regex_helper import _lazy_re_compile
+
+from utils.metrics import collect_timings, record_stage, registry
+from utils.profiling import PROFILE_MODES, Profiler, ProfileStore
+
+try:
+    import brotli
+except ImportError:  # optional dependency, gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+re_accepts_brotli = _lazy_re_compile(r'\bbr\b')
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Compress responses larger than COMPRESSION_MIN_SIZE bytes.
+
+    Uses brotli when the `brotli` package is installed and the client
+    accepts it, gzip otherwise. Streaming responses (NDJSON match results,
+    cover letter text) are sent as is: their chunks are small and each
+    would be flushed as its own compressed block, and compressed streams
+    may be held back by buffering proxies.
+    """
+
+    def process_response(self, request, response):
+        if response.streaming or len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        if (
+            brotli is None
+            or response.has_header('Content-Encoding')
+            or not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        compressed_content = brotli.compress(response.content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+        if len(compressed_content) >= len(response.content):
+            return response
+        response.content = compressed_content
+        response.headers['Content-Length'] = str(len(response.content))
+
+        # Compressed representations get a weak ETag (RFC 9110 8.8.1), as GZipMiddleware does
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
+
+
+def _time_query(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        name = 'db_read' if sql.lstrip()[:6].upper() == 'SELECT' else 'db_write'
+        record_stage(name, time.perf_counter() - start)
+
+
+class ServerTimingMiddleware:
+    """
+    Time every request together with the stages timed while handling it
+    (utils.metrics.stage, plus SQL queries split into db_read/db_write).
+
+    Durations feed the per-endpoint and per-stage histograms exposed at
+    /metrics and, with SERVER_TIMING_HEADER, a Server-Timing response
+    header. For streaming responses only the time to the first byte is
+    measured.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start = time.perf_counter()
+        with collect_timings() as timings, connection.execute_wrapper(_time_query):
+            response = self.get_response(request)
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        endpoint = match.view_name if match else 'unmatched'
+        registry.observe('ats_request_duration_seconds', duration, endpoint=endpoint, method=request.method)
+
+        if settings.SERVER_TIMING_HEADER:
+            entries = timings.server_timing()
+            total = f"total;dur={duration * 1000:.1f}"
+            response.headers['Server-Timing'] = f"{entries}, {total}" if entries else total
+        return response
+
+
+class ProfilerMiddleware:
+    """
+    Profile selected requests and keep the results in PROFILER_DIR.
+
+    A request is profiled when it sends `X-Profile: <PROFILER_TOKEN>`, or
+    at random, at PROFILER_SAMPLE_RATE, on the PROFILER_ENDPOINTS view
+    names (every endpoint when the list is empty). The token is only
+    accepted in the header: query strings end up in access logs, browser
+    history and Referer headers. `X-Profile-Mode` picks 'cprofile' or
+    'sample' for a requested profile; sampled requests use PROFILER_MODE. Profiled
+    responses carry an X-Profile-Id header. For streaming responses only
+    the time to the first byte is profiled.
+
+    Disabled unless a token or a sample rate is configured.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILER_TOKEN and settings.PROFILER_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.store = ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_CAPTURES)
+        self.endpoints = set(settings.PROFILER_ENDPOINTS)
+
+    def __call__(self, request):
+        selected = self.select(request)
+        if selected is None:
+            return self.get_response(request)
+        trigger, mode = selected
+
+        profiler = Profiler(mode, interval=settings.PROFILER_SAMPLE_INTERVAL_MS / 1000)
+        try:
+            profiler.start()
+        except ValueError:
+            # Another request in this process is already being profiled
+            return self.get_response(request)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.stop()
+        duration = time.perf_counter() - start
+
+        match = request.resolver_match
+        capture_id = self.store.new_id()
+        try:
+            self.store.save(profiler, capture_id, {
+                'name': f"{request.method} {request.path}",
+                'method': request.method,
+                'path': request.path,
+                'endpoint': match.view_name if match else 'unmatched',
+                'status': response.status_code,
+                'duration_ms': round(duration * 1000, 1),
+                'trigger': trigger,
+                'captured_at': timezone.now().isoformat(),
+            })
+        except OSError:
+            logger.exception("Could not save the profile of %s %s", request.method, request.path)
+            return response
+        response.headers['X-Profile-Id'] = capture_id
+        return response
+
+    def select(self, request):
+        """
+        Why and how to profile this request.
+
+        Returns:
+            Optional[Tuple[str, str]]: ('requested' or 'sampled', mode), or
+            None to leave the request alone
+        """
+        token = request.headers.get('X-Profile')
+        if token and settings.PROFILER_TOKEN and hmac.compare_digest(token, settings.PROFILER_TOKEN):
+            mode = request.headers.get('X-Profile-Mode')
+            return 'requested', mode if mode in PROFILE_MODES else settings.PROFILER_MODE
+
+        if settings.PROFILER_SAMPLE_RATE > 0 and random.random() < settings.PROFILER_SAMPLE_RATE:
+            if not self.endpoints:
+                return 'sampled', settings.PROFILER_MODE
+            try:
+                endpoint = resolve(request.path_info).view_name
+            except Resolver404:
+                return None
+            if endpoint in self.endpoints:
+                return 'sampled', settings.PROFILER_MODE
+        return None
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import BaseDatabaseCache
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_admission_cache_table(apps, schema_editor):
+    # The admission slots (core/admission.py) are kept in a database cache
+    # table by default; without it every LLM-backed endpoint fails.
+    # createcachetable leaves an existing table alone.
+    cache = caches[settings.ADMISSION_CACHE_ALIAS]
+    if isinstance(cache, BaseDatabaseCache):
+        call_command('createcachetable', cache._table, database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = []
+
+    operations = [
+        migrations.RunPython(create_admission_cache_table, migrations.RunPython.noop),
+    ]
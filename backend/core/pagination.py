@@ -0,0 +1,22 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over an indexed ordering key.
+
+    Pages are fetched with `WHERE key < cursor LIMIT n` instead of
+    `OFFSET`, and no `COUNT(*)` is issued, so every page costs the same
+    regardless of depth. Views set `pagination_ordering` to a unique,
+    indexed key, e.g. `('-created_at', '-id')`.
+    """
+
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, 'pagination_ordering', None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
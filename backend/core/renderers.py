@@ -0,0 +1,43 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+# Compact and unescaped, like JSONRenderer's output
+_fallback_encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps(data) -> bytes:
+    """
+    Serialize `data` to compact UTF-8 JSON, with orjson when available.
+
+    Types orjson does not handle natively (Decimal, lazy strings, ...)
+    go through DRF's encoder. UTC datetimes end in 'Z' as DRF writes
+    them, and data orjson rejects (integers wider than 64 bits) is
+    encoded by DRF's encoder instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_fallback_encoder.default, option=orjson.OPT_UTC_Z)
+        except orjson.JSONEncodeError:
+            pass
+    return _fallback_encoder.encode(data).encode('utf-8')
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson.
+
+    Falls back to the stdlib-based renderer when orjson is not installed
+    or when indented output is requested (e.g. `Accept: application/json; indent=4`).
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
@@ -0,0 +1,33 @@
+from rest_framework import serializers
+
+
+class SparseFieldsetMixin:
+    """
+    Let clients request a subset of fields with `?fields=a,b,c`.
+
+    Only applies to the top-level serializer of a response (or the child
+    of a top-level list), so nested serializers keep their full shape.
+    Unknown field names are ignored.
+    """
+
+    fields_query_param = 'fields'
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        if request is None or not self._is_response_root():
+            return fields
+
+        requested = request.query_params.get(self.fields_query_param)
+        if not requested:
+            return fields
+
+        wanted = {name.strip() for name in requested.split(',') if name.strip()}
+        selected = {name: field for name, field in fields.items() if name in wanted}
+        return selected or fields
+
+    def _is_response_root(self):
+        parent = self.parent
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
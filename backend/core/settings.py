@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 # Load environment variables
 load_dotenv()
@@ -49,13 +50,18 @@ INSTALLED_APPS = [
     'rest_framework.authtoken',
     
     # Project apps
+    'core',
     'candidates',
     'jobs',
     'matching',
+    'skills',
 ]
 
 MIDDLEWARE = [
+    "core.middleware.ProfilerMiddleware",
+    "core.middleware.ServerTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -76,7 +82,7 @@ ROOT_URLCONF = "core.urls"
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [],
+        "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -94,13 +100,67 @@ WSGI_APPLICATION = "core.wsgi.application"
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
-
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+#
+# DB_ENGINE selects the profile:
+# - "sqlite" (default): SQLite in WAL mode with tuned pragmas, so readers
+#   no longer block on the write lock and concurrent writers wait
+#   (busy_timeout) instead of failing with "database is locked".
+# - "postgres": PostgreSQL with persistent connections, or a psycopg
+#   connection pool when DB_POOL_MAX_SIZE is set (Django 5.1+, psycopg[pool]).
+
+DB_ENGINE = os.getenv('DB_ENGINE', 'sqlite')
+DB_CONN_MAX_AGE = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+
+if DB_ENGINE == 'postgres':
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": os.getenv('POSTGRES_DB', 'resume_ats'),
+            "USER": os.getenv('POSTGRES_USER', 'postgres'),
+            "PASSWORD": os.getenv('POSTGRES_PASSWORD', ''),
+            "HOST": os.getenv('POSTGRES_HOST', 'localhost'),
+            "PORT": os.getenv('POSTGRES_PORT', '5432'),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {},
+        }
     }
-}
+    if os.getenv('DB_POOL_MAX_SIZE'):
+        # Pooled connections are returned to the pool after each request,
+        # so Django's own persistent connections must be disabled.
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+            "max_size": int(os.getenv('DB_POOL_MAX_SIZE')),
+            "timeout": float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        }
+elif DB_ENGINE == 'sqlite':
+    DATABASES = {
+        "default": {
+            "ENGINE": "core.db.sqlite3",
+            "NAME": os.getenv('SQLITE_PATH', BASE_DIR / "db.sqlite3"),
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                # Take the write lock when a transaction starts, so a read-then-write
+                # transaction waits out busy_timeout instead of failing with
+                # "database is locked" when another writer got there first
+                "transaction_mode": os.getenv('SQLITE_TRANSACTION_MODE', 'IMMEDIATE'),
+                "pragmas": {
+                    "journal_mode": os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+                    # NORMAL is durable across application crashes in WAL mode
+                    "synchronous": os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+                    "busy_timeout": int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000')),
+                    # Negative values are KiB: 64 MiB page cache per connection
+                    "cache_size": int(os.getenv('SQLITE_CACHE_SIZE', '-65536')),
+                    "mmap_size": int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024))),
+                    "temp_store": "MEMORY",
+                },
+            },
+        }
+    }
+else:
+    raise ImproperlyConfigured(f"Unsupported DB_ENGINE: {DB_ENGINE!r} (expected 'sqlite' or 'postgres')")
 
 
 # Password validation
@@ -123,11 +183,65 @@ AUTH_PASSWORD_VALIDATORS = [
 
 # REST Framework Settings
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'core.authentication.CachedTokenAuthentication',
+    ],
+    # orjson-backed JSON, falling back to the stdlib when orjson is missing
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    # Used by core.admission.LLMRateThrottle on the LLM-backed actions
+    'DEFAULT_THROTTLE_RATES': {
+        'llm': os.getenv('LLM_THROTTLE_RATE', '60/min') or None,
+    },
+}
+
+# Responses at least this large (bytes) are brotli/gzip compressed
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '5'))
+
+# Per-request stage timings (see utils/metrics.py): send them to clients
+# in a Server-Timing header, and protect /metrics with a bearer token
+# (without one, /metrics is limited to logged-in staff users)
+SERVER_TIMING_HEADER = os.getenv('SERVER_TIMING_HEADER', 'True') == 'True'
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# Opt-in request profiling (see core/middleware.py ProfilerMiddleware):
+# requests sending `X-Profile: <PROFILER_TOKEN>`, plus a random sample of
+# PROFILER_SAMPLE_RATE on the PROFILER_ENDPOINTS view names (all when empty).
+# Captures are listed, slowest first, at /admin/profiles/
+PROFILER_TOKEN = os.getenv('PROFILER_TOKEN')
+PROFILER_SAMPLE_RATE = float(os.getenv('PROFILER_SAMPLE_RATE', '0'))
+PROFILER_ENDPOINTS = [name.strip() for name in os.getenv('PROFILER_ENDPOINTS', '').split(',') if name.strip()]
+# "cprofile": deterministic, saved as pstats; "sample": stack sampling, saved for speedscope
+PROFILER_MODE = os.getenv('PROFILER_MODE', 'cprofile')
+if PROFILER_MODE not in ('cprofile', 'sample'):
+    raise ImproperlyConfigured(f"Unsupported PROFILER_MODE: {PROFILER_MODE!r} (expected 'cprofile' or 'sample')")
+PROFILER_SAMPLE_INTERVAL_MS = float(os.getenv('PROFILER_SAMPLE_INTERVAL_MS', '5'))
+# Captures kept on disk; the oldest are deleted first
+PROFILER_DIR = Path(os.getenv('PROFILER_DIR', BASE_DIR / '.profiles'))
+PROFILER_MAX_CAPTURES = int(os.getenv('PROFILER_MAX_CAPTURES', '200'))
+
+# Logging
+# Application loggers at LOG_LEVEL on stderr, in the logging module's default format
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "basic": {"format": "%(levelname)s:%(name)s:%(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "basic"},
+    },
+    "root": {"handlers": ["console"], "level": os.getenv('LOG_LEVEL', 'INFO')},
 }
 
 # Internationalization
@@ -142,6 +256,49 @@ USE_I18N = True
 USE_TZ = True
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory is per process; use the file-based backend to share cached
+# responses (and invalidations) between worker processes. With locmem and
+# several workers, a write is seen by the other workers' response caches
+# only once their version stamps expire (API_CACHE_TIMEOUT).
+
+if os.getenv('CACHE_BACKEND', 'locmem') == 'file':
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')),
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        },
+        "auth": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv('CACHE_LOCATION', str(BASE_DIR / '.cache')) + '-auth',
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "resume-ats",
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        },
+        "auth": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "resume-ats-auth",
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        },
+    }
+
+# Cached list/detail API responses (see core/caching.py)
+API_CACHE_ALIAS = 'default'
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '300'))
+
+# Cached token -> user lookups (see core/authentication.py)
+AUTH_TOKEN_CACHE_ALIAS = 'auth'
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.getenv('AUTH_TOKEN_CACHE_TIMEOUT', '60'))
+
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 
@@ -151,7 +308,11 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 # Media files (for resume uploads)
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_ROOT = Path(os.getenv('MEDIA_ROOT', BASE_DIR / 'media'))
+# Content-addressed store for original resume files
+RESUME_BLOB_ROOT = MEDIA_ROOT / 'blobs'
+# Largest resume upload accepted (bytes); larger uploads are refused while being received
+RESUME_UPLOAD_MAX_SIZE = int(os.getenv('RESUME_UPLOAD_MAX_SIZE', str(10 * 1024 * 1024)))
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
@@ -159,4 +320,93 @@ MEDIA_ROOT = BASE_DIR / 'media'
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Groq API Configuration
-GROQ_API_KEY = os.getenv('GROQ_API_KEY')
\ No newline at end of file
+GROQ_API_KEY = os.getenv('GROQ_API_KEY')
+
+# Matching
+# Upper bound on candidate x job pairs accepted by the bulk match endpoint
+MATCH_BULK_MAX_PAIRS = int(os.getenv('MATCH_BULK_MAX_PAIRS', '500'))
+# Number of concurrent LLM calls made while scoring a bulk match request
+MATCH_BULK_CONCURRENCY = int(os.getenv('MATCH_BULK_CONCURRENCY', '4'))
+# Most jobs returned by the LLM-free prescores endpoint
+MATCH_PRESCORE_MAX_JOBS = int(os.getenv('MATCH_PRESCORE_MAX_JOBS', '5000'))
+
+# Precompute candidate rankings in the background whenever a job is posted
+MATCH_PRECOMPUTE_ENABLED = os.getenv('MATCH_PRECOMPUTE_ENABLED', 'False') == 'True'
+# Background threads shared by all precompute runs
+MATCH_PRECOMPUTE_WORKERS = int(os.getenv('MATCH_PRECOMPUTE_WORKERS', '1'))
+# Candidate rows read per chunk, and the pause between chunks (seconds);
+# the job's rankings are then replaced in one transaction
+MATCH_PRECOMPUTE_CHUNK_SIZE = int(os.getenv('MATCH_PRECOMPUTE_CHUNK_SIZE', '2000'))
+MATCH_PRECOMPUTE_CHUNK_PAUSE = float(os.getenv('MATCH_PRECOMPUTE_CHUNK_PAUSE', '0.05'))
+# Candidates per job, by local score, that are re-scored with the LLM
+MATCH_PRECOMPUTE_LLM_TOP_N = int(os.getenv('MATCH_PRECOMPUTE_LLM_TOP_N', '20'))
+# LLM calls in flight per job, which is also how many candidates each
+# queued re-scoring task handles before yielding to other jobs
+MATCH_PRECOMPUTE_LLM_CONCURRENCY = int(os.getenv('MATCH_PRECOMPUTE_LLM_CONCURRENCY', '2'))
+
+# Bulk job import
+# Job descriptions parsed by the LLM concurrently during an import
+JOB_IMPORT_CONCURRENCY = int(os.getenv('JOB_IMPORT_CONCURRENCY', '4'))
+# Rows parsed and inserted per batch; progress is checkpointed after each batch
+JOB_IMPORT_BATCH_SIZE = int(os.getenv('JOB_IMPORT_BATCH_SIZE', '50'))
+
+# Duplicate job descriptions (see jobs/dedup.py). Off by default: when on,
+# posting a known description answers 200 with the existing posting
+# ("link") instead of 201, and imports report the row as a duplicate.
+# Descriptions are indexed either way, so it can be turned on at any time.
+JOB_DEDUP_ENABLED = os.getenv('JOB_DEDUP_ENABLED', 'False') == 'True'
+# Minimum estimated shingle similarity for two descriptions to count as duplicates
+JOB_DEDUP_THRESHOLD = float(os.getenv('JOB_DEDUP_THRESHOLD', '0.85'))
+# "link": return the existing posting instead of creating a new one
+# "reuse": create a new posting with the existing posting's parsed fields
+JOB_DUPLICATE_ACTION = os.getenv('JOB_DUPLICATE_ACTION', 'link')
+if JOB_DUPLICATE_ACTION not in ('link', 'reuse'):
+    raise ImproperlyConfigured(f"Unsupported JOB_DUPLICATE_ACTION: {JOB_DUPLICATE_ACTION!r} (expected 'link' or 'reuse')")
+
+# Admission control for the LLM-backed actions (see core/admission.py)
+# Requests in flight at once, per user and overall (0: unlimited)
+LLM_USER_CONCURRENCY = int(os.getenv('LLM_USER_CONCURRENCY', '2'))
+LLM_GLOBAL_CONCURRENCY = int(os.getenv('LLM_GLOBAL_CONCURRENCY', '8'))
+# Requests allowed to wait for a slot, overall and per user, and for how long (seconds)
+ADMISSION_QUEUE_SIZE = int(os.getenv('ADMISSION_QUEUE_SIZE', '16'))
+ADMISSION_USER_QUEUE_SIZE = int(os.getenv('ADMISSION_USER_QUEUE_SIZE', '2'))
+ADMISSION_MAX_WAIT = float(os.getenv('ADMISSION_MAX_WAIT', '10'))
+# Retry-After (seconds) sent with a 429, and how long a slot is held if never released
+ADMISSION_RETRY_AFTER = int(os.getenv('ADMISSION_RETRY_AFTER', '5'))
+ADMISSION_LEASE_SECONDS = int(os.getenv('ADMISSION_LEASE_SECONDS', '300'))
+# Where the slots live. They must be shared by every worker process, and
+# taken and released atomically (see core/cache_backends.py):
+# - "db" (default): a table in the main database, created by migrate
+# - "redis": the server at ADMISSION_CACHE_LOCATION (needs the redis package)
+# - "locmem": each worker process enforces the limits on its own; only
+#   allowed with DEBUG
+# Memcached cannot release a slot atomically, so it is not offered.
+ADMISSION_CACHE_BACKEND = os.getenv('ADMISSION_CACHE_BACKEND', 'db')
+ADMISSION_CACHES = {
+    'db': {
+        "BACKEND": "core.cache_backends.AtomicDatabaseCache",
+        "LOCATION": "admission_cache",
+    },
+    'redis': {
+        "BACKEND": "core.cache_backends.AtomicRedisCache",
+        "LOCATION": os.getenv('ADMISSION_CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    },
+    'locmem': {
+        "BACKEND": "core.cache_backends.AtomicLocMemCache",
+        "LOCATION": "resume-ats-admission",
+    },
+}
+if ADMISSION_CACHE_BACKEND not in ADMISSION_CACHES:
+    raise ImproperlyConfigured(
+        f"Unsupported ADMISSION_CACHE_BACKEND: {ADMISSION_CACHE_BACKEND!r} (expected 'db', 'redis' or 'locmem')"
+    )
+if ADMISSION_CACHE_BACKEND == 'locmem' and not DEBUG:
+    raise ImproperlyConfigured(
+        "ADMISSION_CACHE_BACKEND='locmem' only limits each worker process separately; "
+        "use 'db' or 'redis' (or set DEBUG=True for local development)"
+    )
+CACHES['admission'] = ADMISSION_CACHES[ADMISSION_CACHE_BACKEND]
+ADMISSION_CACHE_ALIAS = 'admission'
+
+# Rows fetched per database round trip by the streaming exports
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '2000'))
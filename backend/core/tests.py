@@ -0,0 +1,552 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from importlib import import_module
+from io import BytesIO
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection, connections
+from django.db.backends.sqlite3 import base as sqlite3_base
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.timezone import now as timezone_now
+from django.utils.translation import gettext_lazy
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ParseError, Throttled
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from jobs.models import JobPosting
+from utils.metrics import registry
+from utils.profiling import Profiler, ProfileStore
+from .admission import SlotPool, llm_admission
+from .authentication import CachedTokenAuthentication
+from .cache_backends import AtomicDatabaseCache, AtomicLocMemCache
+from .middleware import CompressionMiddleware, ProfilerMiddleware, brotli
+from .parsers import FastJSONParser
+from .renderers import FastJSONRenderer, dumps
+
+
+@skipUnless(settings.DATABASES['default']['ENGINE'] == 'core.db.sqlite3', "SQLite pragma backend not in use")
+class SQLitePragmaBackendTests(TestCase):
+    def test_pragmas_applied_to_connection(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            busy_timeout = cursor.fetchone()[0]
+        expected = settings.DATABASES['default']['OPTIONS']['pragmas']['busy_timeout']
+        self.assertEqual(str(busy_timeout), str(expected))
+
+    def test_connection_params_do_not_touch_shared_options(self):
+        # Every thread gets its own wrapper around the same settings dict
+        options = connection.settings_dict['OPTIONS']
+        pragmas = options['pragmas']
+        wrappers = [connections.create_connection('default') for _ in range(8)]
+        results = []
+        django_connection_params = sqlite3_base.DatabaseWrapper.get_connection_params
+
+        def slow_connection_params(wrapper):
+            # Let the other threads run while this one is building its params
+            time.sleep(0.001)
+            return django_connection_params(wrapper)
+
+        def connection_params(wrapper):
+            for _ in range(20):
+                params = wrapper.get_connection_params()
+                results.append(('pragmas' not in params, wrapper.pragmas == pragmas))
+
+        with mock.patch.object(sqlite3_base.DatabaseWrapper, 'get_connection_params', slow_connection_params):
+            threads = [threading.Thread(target=connection_params, args=(wrapper,)) for wrapper in wrappers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertIs(connection.settings_dict['OPTIONS'], options)
+        self.assertEqual(options['pragmas'], pragmas)
+        self.assertTrue(all(ok for result in results for ok in result))
+
+
+class AtomicDatabaseCacheTests(TestCase):
+    def setUp(self):
+        self.cache = caches['admission']
+        self.cache.clear()
+
+    def test_admission_cache_is_shared(self):
+        self.assertIsInstance(self.cache, AtomicDatabaseCache)
+
+    def test_add_only_when_absent(self):
+        self.assertTrue(self.cache.add('slot', 'a', timeout=60))
+        self.assertFalse(self.cache.add('slot', 'b', timeout=60))
+        self.assertEqual(self.cache.get('slot'), 'a')
+
+        self.cache.delete('slot')
+        self.assertTrue(self.cache.add('slot', 'b', timeout=60))
+        self.assertEqual(self.cache.get('slot'), 'b')
+
+    def test_add_takes_over_expired_key(self):
+        self.assertTrue(self.cache.add('slot', 'a', timeout=60))
+        with mock.patch('core.cache_backends.tz_now', return_value=timezone_now() + timedelta(seconds=120)):
+            self.assertTrue(self.cache.add('slot', 'b', timeout=60))
+        self.assertEqual(self.cache.get('slot'), 'b')
+
+    def test_delete_if_equal(self):
+        self.cache.add('slot', 'a', timeout=60)
+        self.assertFalse(self.cache.delete_if_equal('slot', 'b'))
+        self.assertEqual(self.cache.get('slot'), 'a')
+        self.assertTrue(self.cache.delete_if_equal('slot', 'a'))
+        self.assertIsNone(self.cache.get('slot'))
+        self.assertFalse(self.cache.delete_if_equal('slot', 'a'))
+
+    def test_locmem_delete_if_equal(self):
+        cache = AtomicLocMemCache('admission-tests', {})
+        cache.add('slot', 'a', timeout=60)
+        self.assertFalse(cache.delete_if_equal('slot', 'b'))
+        self.assertTrue(cache.delete_if_equal('slot', 'a'))
+        self.assertFalse(cache.delete_if_equal('slot', 'a'))
+
+    def test_migration_creates_missing_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TABLE admission_cache')
+        self.assertNotIn('admission_cache', connection.introspection.table_names())
+        migration = import_module('core.migrations.0001_admission_cache_table')
+        migration.create_admission_cache_table(None, mock.Mock(connection=connection))
+        self.assertIn('admission_cache', connection.introspection.table_names())
+        self.assertTrue(self.cache.add('slot', 'a', timeout=60))
+
+    def test_touch_extends_lease(self):
+        self.cache.add('slot', 'a', timeout=1)
+        self.assertTrue(self.cache.touch('slot', 60))
+        with mock.patch('core.cache_backends.tz_now', return_value=timezone_now() + timedelta(seconds=30)):
+            self.assertFalse(self.cache.add('slot', 'b', timeout=60))
+
+
+@override_settings(
+    LLM_USER_CONCURRENCY=1, LLM_GLOBAL_CONCURRENCY=4,
+    ADMISSION_USER_QUEUE_SIZE=1, ADMISSION_QUEUE_SIZE=4, ADMISSION_MAX_WAIT=0.2, ADMISSION_RETRY_AFTER=7
+)
+class AdmissionControlTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def user_pool(self, kind):
+        return SlotPool(f"user:{self.user.pk}:{kind}", getattr(settings, {
+            'active': 'LLM_USER_CONCURRENCY', 'queue': 'ADMISSION_USER_QUEUE_SIZE'
+        }[kind]))
+
+    def assert_user_slot_free(self):
+        slot = self.user_pool('active').try_acquire()
+        self.assertIsNotNone(slot, "the user's slot is still held")
+        slot.release()
+
+    def match(self):
+        return self.client.post('/api/matches/match_candidate_to_job/', {}, format='json')
+
+    def test_release_keeps_a_slot_taken_over_after_expiry(self):
+        pool = self.user_pool('active')
+        slot = pool.try_acquire()
+        # The lease expired and another request took the slot
+        caches['admission'].delete(slot.key)
+        other = pool.try_acquire()
+        self.assertEqual(other.key, slot.key)
+
+        slot.release()
+        self.assertIsNone(pool.try_acquire())
+        other.release()
+        self.assertIsNotNone(pool.try_acquire())
+
+    def test_released_after_response(self):
+        self.assertEqual(self.match().status_code, 400)
+        self.assert_user_slot_free()
+
+    def test_busy_after_waiting(self):
+        held = self.user_pool('active').try_acquire()
+        started = time.monotonic()
+        response = self.match()
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '7')
+        # The queue place is given back
+        self.assertIsNotNone(self.user_pool('queue').try_acquire())
+        held.release()
+
+    def test_queue_full_is_refused_at_once(self):
+        held = [self.user_pool('active').try_acquire(), self.user_pool('queue').try_acquire()]
+        started = time.monotonic()
+        response = self.match()
+        self.assertLess(time.monotonic() - started, 0.2)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '7')
+        for slot in held:
+            slot.release()
+
+
+class StreamingAdmissionTests(AdmissionControlTests):
+    class View:
+        def __init__(self, content=(b'a', b'b'), error=None):
+            self.content = content
+            self.error = error
+
+        @llm_admission
+        def stream(self, request):
+            return StreamingHttpResponse(iter(self.content))
+
+        @llm_admission
+        def plain(self, request):
+            if self.error:
+                raise self.error
+            return HttpResponse('ok')
+
+    def request(self):
+        request = RequestFactory().post('/')
+        request.user = self.user
+        return request
+
+    def test_lease_held_until_stream_is_consumed(self):
+        response = self.View().stream(self.request())
+        with self.assertRaises(Throttled):
+            self.View().plain(self.request())
+        self.assertEqual(b''.join(response.streaming_content), b'ab')
+        self.assert_user_slot_free()
+
+    def test_lease_released_when_stream_closed_unread(self):
+        response = self.View().stream(self.request())
+        response.close()
+        self.assert_user_slot_free()
+
+    def test_lease_released_when_stream_closed_early(self):
+        response = self.View(content=(b'a', b'b', b'c')).stream(self.request())
+        self.assertEqual(next(iter(response.streaming_content)), b'a')
+        response.close()
+        self.assert_user_slot_free()
+
+    def test_lease_released_when_view_raises(self):
+        with self.assertRaises(ValueError):
+            self.View(error=ValueError('boom')).plain(self.request())
+        self.assert_user_slot_free()
+
+
+class ResponseCacheVersionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+        cls.job = JobPosting.objects.create(title='Engineer', company='Acme', description='Build things')
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def worker(self, cache):
+        return mock.patch('core.caching._cache', return_value=cache)
+
+    def test_version_stamps_expire_with_responses(self):
+        self.client.get('/api/jobs/')
+        cache = caches[settings.API_CACHE_ALIAS]
+        stamps = [key for key in cache._cache if ':api-cache:version:' in key]
+        self.assertTrue(stamps)
+        for key in stamps:
+            self.assertLessEqual(cache._expire_info[key], time.time() + settings.API_CACHE_TIMEOUT)
+
+    @override_settings(API_CACHE_TIMEOUT=1)
+    def test_write_in_another_worker_is_seen_after_timeout(self):
+        worker_a = LocMemCache('worker-a', {})
+        worker_b = LocMemCache('worker-b', {})
+        with self.worker(worker_a):
+            etag = self.client.get('/api/jobs/')['ETag']
+            self.assertEqual(self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.worker(worker_b):
+            self.job.title = 'Senior Engineer'
+            self.job.save()
+
+        time.sleep(1.1)
+        with self.worker(worker_a):
+            response = self.client.get('/api/jobs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['title'], 'Senior Engineer')
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_lookup_is_cached(self):
+        authentication = CachedTokenAuthentication()
+        with self.assertNumQueries(1):
+            user, token = authentication.authenticate_credentials(self.token.key)
+        with self.assertNumQueries(0):
+            self.assertEqual(authentication.authenticate_credentials(self.token.key), (user, token))
+        self.assertEqual((user, token), (self.user, self.token))
+
+        # Raw tokens never appear in cache keys
+        keys = list(caches[settings.AUTH_TOKEN_CACHE_ALIAS]._cache)
+        self.assertEqual(len(keys), 1)
+        self.assertNotIn(self.token.key, keys[0])
+
+    def test_logout_revokes_token(self):
+        self.assertEqual(self.client.get('/api/jobs/').status_code, 200)
+        self.assertEqual(self.client.post('/api/logout/').status_code, 200)
+        self.assertFalse(Token.objects.filter(key=self.token.key).exists())
+        self.assertEqual(self.client.get('/api/jobs/').status_code, 401)
+
+    def test_deleted_token_is_not_served_from_cache(self):
+        self.assertEqual(self.client.get('/api/jobs/').status_code, 200)
+        Token.objects.filter(key=self.token.key).delete()
+        self.assertEqual(self.client.get('/api/jobs/').status_code, 401)
+
+    def test_deactivated_user_is_not_served_from_cache(self):
+        self.assertEqual(self.client.get('/api/jobs/').status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        response = self.client.get('/api/jobs/')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(str(response.data['detail']), 'User inactive or deleted.')
+
+
+class FastJSONTests(TestCase):
+    def test_renders_like_drf(self):
+        data = {
+            'decimal': Decimal('12.50'),
+            'utc': datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=dt_timezone.utc),
+            'offset': datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt_timezone(timedelta(hours=2))),
+            'naive': datetime(2024, 1, 2, 3, 4, 5),
+            'date': date(2024, 1, 2),
+            'uuid': uuid.UUID(int=1),
+            'lazy': gettext_lazy('Resume'),
+            'text': 'Zoë \u2013 résumé',
+            'nested': [{'score': 88.5, 'skills': ['python']}, None, True],
+            'big': 2 ** 70,
+        }
+        expected = JSONRenderer().render(data)
+        self.assertEqual(FastJSONRenderer().render(data), expected)
+        self.assertEqual(dumps(data), expected)
+
+        del data['big']
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indented_output_uses_drf(self):
+        renderer = FastJSONRenderer()
+        self.assertEqual(renderer.render({'a': 1}, 'application/json; indent=2'), b'{\n  "a": 1\n}')
+        self.assertEqual(renderer.render(None), b'')
+
+    def test_parser(self):
+        parser = FastJSONParser()
+        self.assertEqual(parser.parse(BytesIO('{"name": "Zoë"}'.encode('utf-8'))), {'name': 'Zoë'})
+        latin1 = parser.parse(BytesIO('{"name": "Zoë"}'.encode('latin-1')), parser_context={'encoding': 'latin-1'})
+        self.assertEqual(latin1, {'name': 'Zoë'})
+        for body in (b'{"name": ', b'{"score": NaN}', b'\xff'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                parser.parse(BytesIO(body))
+
+    def test_malformed_body_is_rejected(self):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.post('/api/jobs/', '{"title": "Engineer",', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.data['detail'].startswith('JSON parse error'))
+        self.assertFalse(JobPosting.objects.exists())
+
+
+@override_settings(COMPRESSION_MIN_SIZE=1024)
+class CompressionMiddlewareTests(SimpleTestCase):
+    content = b'{"skills":["python","django"]}' * 100
+
+    def process(self, response, accept_encoding=None):
+        headers = {'HTTP_ACCEPT_ENCODING': accept_encoding} if accept_encoding else {}
+        request = RequestFactory().get('/api/matches/', **headers)
+        return CompressionMiddleware(lambda request: response)(request)
+
+    def json_response(self, content=None):
+        response = HttpResponse(content or self.content, content_type='application/json')
+        response['ETag'] = '"abc"'
+        return response
+
+    @skipUnless(brotli, 'brotli is not installed')
+    def test_brotli(self):
+        response = self.process(self.json_response(), 'gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(brotli.decompress(response.content), self.content)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+    def test_gzip(self):
+        response = self.process(self.json_response(), 'gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.content)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+        self.assertEqual(response['ETag'], 'W/"abc"')
+
+        with mock.patch('core.middleware.brotli', None):
+            response = self.process(self.json_response(), 'gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_not_accepted(self):
+        response = self.process(self.json_response())
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, self.content)
+        self.assertEqual(response['Vary'], 'Accept-Encoding')
+
+    def test_small_body_is_not_compressed(self):
+        response = self.process(self.json_response(b'{"ok":true}'), 'gzip, br')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, b'{"ok":true}')
+
+    def test_streaming_response_is_not_compressed(self):
+        chunks = [b'{"job_id":1}\n' * 200, b'{"job_id":2}\n' * 200]
+        response = self.process(StreamingHttpResponse(iter(chunks), content_type='application/x-ndjson'), 'gzip, br')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(list(response.streaming_content), chunks)
+
+
+class MetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+        cls.staff = User.objects.create_user('admin', 'admin@example.com', 'password', is_staff=True)
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        registry.reset()
+        self.client = APIClient()
+
+    def test_server_timing_header(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        response = self.client.get('/api/jobs/')
+        self.assertEqual(response.status_code, 200)
+        entries = dict(entry.split(';', 1) for entry in response['Server-Timing'].split(', '))
+        self.assertIn('db_read', entries)
+        self.assertEqual(list(entries)[-1], 'total')
+
+        with self.settings(SERVER_TIMING_HEADER=False):
+            self.assertFalse(self.client.get('/api/jobs/').has_header('Server-Timing'))
+
+        self.client.force_login(self.staff)
+        body = self.client.get('/metrics').content.decode()
+        self.assertIn('ats_request_duration_seconds_count{endpoint="jobposting-list",method="GET"} 2', body)
+        self.assertIn('ats_stage_duration_seconds_count{stage="db_read"}', body)
+
+    def test_metrics_staff_only_by_default(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+        self.client.force_login(self.staff)
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+        self.assertEqual(self.client.post('/metrics').status_code, 405)
+
+    @override_settings(METRICS_TOKEN='scrape-token')
+    def test_metrics_bearer_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 401)
+        # A token replaces the staff check
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-token').status_code, 200)
+
+
+@override_settings(PROFILER_TOKEN='secret-token', PROFILER_SAMPLE_RATE=0, PROFILER_MODE='cprofile')
+class ProfilerSelectTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with self.settings(PROFILER_DIR=directory.name):
+            self.middleware = ProfilerMiddleware(lambda request: HttpResponse('ok'))
+        self.factory = RequestFactory()
+
+    def test_token_in_header(self):
+        request = self.factory.get('/api/jobs/', HTTP_X_PROFILE='secret-token', HTTP_X_PROFILE_MODE='sample')
+        self.assertEqual(self.middleware.select(request), ('requested', 'sample'))
+        request = self.factory.get('/api/jobs/', HTTP_X_PROFILE='secret-token', HTTP_X_PROFILE_MODE='bogus')
+        self.assertEqual(self.middleware.select(request), ('requested', 'cprofile'))
+
+    def test_token_in_query_string_is_ignored(self):
+        request = self.factory.get('/api/jobs/', {'profile': 'secret-token', 'profile_mode': 'sample'})
+        self.assertIsNone(self.middleware.select(request))
+
+    def test_wrong_token(self):
+        self.assertIsNone(self.middleware.select(self.factory.get('/api/jobs/', HTTP_X_PROFILE='guess')))
+
+    def test_profiled_response_is_saved(self):
+        response = self.middleware(self.factory.get('/api/jobs/', HTTP_X_PROFILE='secret-token'))
+        (capture,) = self.middleware.store.captures()
+        self.assertEqual(response['X-Profile-Id'], capture['id'])
+        self.assertEqual((capture['trigger'], capture['mode'], capture['status']), ('requested', 'cprofile', 200))
+
+
+class ProfileStoreTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = ProfileStore(os.path.join(directory.name, 'profiles'), max_captures=3)
+
+    def capture(self, index, duration_ms=10):
+        profiler = Profiler('sample', interval=0.001)
+        profiler.start()
+        profiler.stop()
+        return self.store.save(profiler, f"20260101T00000{index}.000000-0000000{index}", {'duration_ms': duration_ms})
+
+    def test_rotation_keeps_newest(self):
+        for index in range(5):
+            self.capture(index, duration_ms=index)
+        self.assertEqual([meta['id'][-1] for meta in self.store.captures()], ['2', '3', '4'])
+        self.assertEqual(
+            sorted(path.name for path in self.store.directory.iterdir()),
+            sorted([f"{meta['id']}.json" for meta in self.store.captures()] + [meta['file'] for meta in self.store.captures()])
+        )
+        self.assertEqual([meta['duration_ms'] for meta in self.store.slowest(limit=2)], [4, 3])
+
+    def test_unreadable_metadata_is_skipped(self):
+        self.capture(1)
+        (self.store.directory / '20260101T000009.000000-broken.json').write_text('{', encoding='utf-8')
+        self.assertEqual(len(self.store.captures()), 1)
+
+    def test_file_path_only_serves_profile_files(self):
+        meta = self.capture(1)
+        self.assertEqual(self.store.file_path(meta['file']), self.store.directory / meta['file'])
+        for name in (f"{meta['id']}.json", 'missing.speedscope.json', '../' + meta['file'], '/etc/passwd', '', '.'):
+            self.assertIsNone(self.store.file_path(name), name)
+
+    def test_tampered_metadata_cannot_point_outside(self):
+        outside = self.store.directory.parent / 'secret.txt'
+        outside.write_text('secret', encoding='utf-8')
+        self.store.directory.mkdir(exist_ok=True)
+        (self.store.directory / '20260101T000000.000000-evil.json').write_text(
+            json.dumps({'id': '20260101T000000.000000-evil', 'file': '../secret.txt'}), encoding='utf-8'
+        )
+        self.assertIsNone(self.store.file_path('../secret.txt'))
+        self.store.max_captures = 0
+        self.store.rotate()
+        self.assertTrue(outside.exists())
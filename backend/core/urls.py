@@ -4,6 +4,7 @@ from rest_framework.routers import DefaultRouter
 from candidates.views import CandidateProfileViewSet, UserRegistrationView, UserLoginView, UserLogoutView
 from jobs.views import JobPostingViewSet
 from matching.views import JobMatchViewSet
+from core.views import metrics, profile_download, profiles
 
 router = DefaultRouter()
 router.register(r'candidates', CandidateProfileViewSet)
@@ -11,10 +12,13 @@ router.register(r'jobs', JobPostingViewSet)
 router.register(r'matches', JobMatchViewSet)
 
 urlpatterns = [
+    path('admin/profiles/', admin.site.admin_view(profiles), name='admin_profiles'),
+    path('admin/profiles/<str:name>', admin.site.admin_view(profile_download), name='admin_profile_download'),
     path('admin/', admin.site.urls),
     path('api/', include(router.urls)),
     path('api/register/', UserRegistrationView.as_view(), name='user_registration'),  # Added route
     path('api/login/', UserLoginView.as_view(), name='login'),
     path('api/logout/', UserLogoutView.as_view(), name='logout'),
+    path('metrics', metrics, name='metrics'),
 
 ]
\ No newline at end of file
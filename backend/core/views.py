@@ -0,0 +1,56 @@
+import hmac
+
+from django.conf import settings
+from django.contrib import admin
+from django.http import FileResponse, Http404, HttpResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_GET
+
+from utils.metrics import registry
+from utils.profiling import ProfileStore
+
+
+@require_GET
+def metrics(request):
+    """
+    Prometheus scrape endpoint: per-endpoint and per-stage latency
+    quantiles (p50/p95/p99) and LLM token counters for this process.
+
+    When METRICS_TOKEN is set, requests must send `Authorization: Bearer <token>`;
+    otherwise only staff users logged in to the admin may read it.
+    """
+    if settings.METRICS_TOKEN:
+        expected = f"Bearer {settings.METRICS_TOKEN}"
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), expected):
+            return HttpResponse(status=401)
+    elif not (request.user.is_active and request.user.is_staff):
+        return HttpResponse(status=403)
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@require_GET
+def profiles(request):
+    """
+    Admin page listing the slowest requests captured by ProfilerMiddleware.
+    """
+    store = ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_CAPTURES)
+    context = {
+        **admin.site.each_context(request),
+        'title': "Slowest profiled requests",
+        'captures': store.slowest(limit=100),
+        'profiler_dir': settings.PROFILER_DIR,
+    }
+    return render(request, 'admin/profiles.html', context)
+
+
+@require_GET
+def profile_download(request, name):
+    """
+    Download one captured profile (.prof for pstats/snakeviz, or
+    .speedscope.json for https://www.speedscope.app).
+    """
+    store = ProfileStore(settings.PROFILER_DIR, settings.PROFILER_MAX_CAPTURES)
+    path = store.file_path(name)
+    if path is None:
+        raise Http404("No such profile")
+    return FileResponse(path.open('rb'), as_attachment=True, filename=name)
@@ -7,6 +7,7 @@ For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/
 """
 
+import importlib
 import os
 
 from django.core.wsgi import get_wsgi_application
@@ -14,3 +15,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 application = get_wsgi_application()
+
+# Parsing and LLM libraries are imported on first use. Under a preloading
+# server (e.g. gunicorn --preload) set WSGI_PRELOAD=True to import them
+# once in the master process instead, so forked workers start warm.
+PRELOAD_MODULES = ("PyPDF2", "pdfplumber", "docx", "groq")
+
+if os.getenv("WSGI_PRELOAD", "False") == "True":
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
@@ -0,0 +1,95 @@
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+
+from utils.minhash import (
+    MinHasher, text_fingerprint, signature_similarity, lsh_keys,
+    pack_signature, unpack_signature
+)
+from .models import JobPosting, JobDescriptionBucket
+
+logger = logging.getLogger(__name__)
+
+# Changing either value invalidates every stored signature; re-run
+# `manage.py index_job_descriptions --all` afterwards.
+NUM_PERM = 128
+BANDS = 32
+
+minhasher = MinHasher(num_perm=NUM_PERM)
+
+
+def index_job_description(job: JobPosting, created: bool = False) -> None:
+    """
+    Store the description fingerprint, MinHash signature and LSH buckets
+    of a job posting. Existing postings whose description did not change
+    are left alone.
+    """
+    description_hash = text_fingerprint(job.description)
+    if not created and job.description_hash == description_hash and job.description_signature:
+        return
+
+    signature = minhasher.signature(job.description)
+    job.description_hash = description_hash
+    job.description_signature = pack_signature(signature)
+    with transaction.atomic():
+        # update() rather than save() so post_save does not fire again
+        JobPosting.objects.filter(pk=job.pk).update(
+            description_hash=job.description_hash,
+            description_signature=job.description_signature
+        )
+        JobDescriptionBucket.objects.filter(job=job).delete()
+        JobDescriptionBucket.objects.bulk_create(
+            JobDescriptionBucket(job=job, key=key) for key in lsh_keys(signature, BANDS)
+        )
+
+
+def find_duplicate_job(description: str) -> Optional[Tuple[JobPosting, float]]:
+    """
+    Find an existing job posting with the same or a nearly identical description.
+
+    Exact matches (after normalizing case, whitespace and punctuation)
+    are found by fingerprint. Otherwise postings sharing an LSH bucket
+    are compared by estimated Jaccard similarity of their shingles.
+
+    Args:
+        description (str): Job description about to be parsed
+
+    Returns:
+        Optional[Tuple[JobPosting, float]]: Oldest exact duplicate, or the
+        most similar posting at or above JOB_DEDUP_THRESHOLD, with its
+        similarity; None if there is none or detection is disabled
+    """
+    if not settings.JOB_DEDUP_ENABLED:
+        return None
+
+    exact = JobPosting.objects.filter(description_hash=text_fingerprint(description)).order_by('posted_date').first()
+    if exact is not None:
+        return exact, 1.0
+
+    signature = minhasher.signature(description)
+    candidate_ids = (
+        JobDescriptionBucket.objects.filter(key__in=lsh_keys(signature, BANDS))
+        .values_list('job_id', flat=True)
+        .distinct()
+    )
+    best = None
+    for job in JobPosting.objects.filter(id__in=candidate_ids).exclude(description_signature=None):
+        similarity = signature_similarity(signature, unpack_signature(job.description_signature))
+        if similarity >= settings.JOB_DEDUP_THRESHOLD and (best is None or similarity > best[1]):
+            best = (job, similarity)
+    return best
+
+
+def duplicate_parsed_data(job: JobPosting) -> Dict[str, Any]:
+    """
+    Parsed fields of an existing posting, in the shape parse_job_posting returns,
+    for reuse by a duplicate description instead of calling the LLM.
+    """
+    return {
+        'title': job.title,
+        'company': job.company,
+        'location': job.location,
+        'required_skills': job.required_skills or []
+    }
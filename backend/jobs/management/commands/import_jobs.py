@@ -0,0 +1,69 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.functional import SimpleLazyObject
+
+from jobs.services import job_import_format, read_job_rows, import_job_rows
+from utils.llm_functions import GroqLLMFunctions
+
+
+class Command(BaseCommand):
+    help = "Import job postings from a CSV or JSONL file, resuming where an earlier run stopped"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or JSONL file with one job posting per row")
+        parser.add_argument('--format', choices=['csv', 'jsonl'],
+                            help="File format (default: from the file extension)")
+        parser.add_argument('--concurrency', type=int, default=settings.JOB_IMPORT_CONCURRENCY,
+                            help="Job descriptions parsed concurrently")
+        parser.add_argument('--batch-size', type=int, default=settings.JOB_IMPORT_BATCH_SIZE,
+                            help="Rows parsed and inserted per batch")
+        parser.add_argument('--progress-file',
+                            help="Where progress is checkpointed (default: <path>.progress)")
+        parser.add_argument('--restart', action='store_true',
+                            help="Ignore saved progress and import from the first row")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        progress_file = options['progress_file'] or f"{path}.progress"
+        try:
+            file_format = job_import_format(path, options['format'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        start_row = 1
+        if not options['restart'] and os.path.exists(progress_file):
+            with open(progress_file) as f:
+                start_row = json.load(f)['next_row']
+            self.stdout.write(f"Resuming from row {start_row}")
+
+        created = linked = failed = 0
+        # Only built once a row needs parsing, so files whose rows carry
+        # their own fields (or duplicate existing postings) need no API key
+        llm_functions = SimpleLazyObject(GroqLLMFunctions)
+        with open(path, 'rb') as file:
+            for event in import_job_rows(
+                read_job_rows(file, file_format),
+                llm_functions,
+                options['concurrency'],
+                max(1, options['batch_size']),
+                start_row=start_row
+            ):
+                if 'error' in event:
+                    self.stderr.write(f"Row {event['row']}: {event['error']}")
+                elif 'next_row' in event:
+                    created, linked, failed = event['created'], event['linked'], event['failed']
+                    self._save_progress(progress_file, event['next_row'])
+                    self.stdout.write(f"Imported up to row {event['next_row'] - 1}")
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} job postings ({linked} linked to existing postings, {failed} failed)"))
+
+    @staticmethod
+    def _save_progress(progress_file, next_row):
+        # Write then rename so an interrupted run never leaves a torn checkpoint
+        tmp_path = f"{progress_file}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'next_row': next_row}, f)
+        os.replace(tmp_path, progress_file)
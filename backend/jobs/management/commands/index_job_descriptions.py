@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from jobs.dedup import index_job_description
+from jobs.models import JobPosting
+
+
+class Command(BaseCommand):
+    help = "Compute duplicate-detection signatures for job postings that do not have one yet"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--all', action='store_true',
+                            help="Recompute every signature, e.g. after changing the MinHash parameters")
+
+    def handle(self, *args, **options):
+        jobs = JobPosting.objects.only('id', 'description', 'description_hash', 'description_signature')
+        if not options['all']:
+            jobs = jobs.filter(description_signature__isnull=True)
+
+        count = 0
+        for job in jobs.iterator(chunk_size=options['chunk_size']):
+            index_job_description(job, created=options['all'])
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} job descriptions"))
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(fields=["posted_date", "id"], name="jobs_posted_id"),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jobs", "0002_keyset_pagination_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobposting",
+            name="description_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="description_signature",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="JobDescriptionBucket",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.BigIntegerField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="description_buckets",
+                        to="jobs.jobposting",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["key"], name="jobs_desc_bucket_key")],
+            },
+        ),
+    ]
@@ -15,5 +15,25 @@ class JobPosting(models.Model):
     posted_date = models.DateTimeField(auto_now_add=True)
     closing_date = models.DateTimeField(null=True, blank=True)
 
+    # Duplicate detection (see jobs/dedup.py)
+    description_hash = models.CharField(max_length=64, blank=True, default='', db_index=True, editable=False)
+    description_signature = models.BinaryField(null=True, blank=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['posted_date', 'id'], name='jobs_posted_id'),
+        ]
+
     def __str__(self):
-        return f"{self.title} at {self.company}"
\ No newline at end of file
+        return f"{self.title} at {self.company}"
+
+
+class JobDescriptionBucket(models.Model):
+    """LSH bucket of a job description's MinHash signature, one row per band"""
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='description_buckets')
+    key = models.BigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['key'], name='jobs_desc_bucket_key'),
+        ]
@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from .models import JobPosting
+from core.serializers import SparseFieldsetMixin
 
-class JobPostingSerializer(serializers.ModelSerializer):
+class JobPostingSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = JobPosting
         fields = [
@@ -0,0 +1,307 @@
+import csv
+import io
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from django.conf import settings
+from django.db import DatabaseError, router, transaction
+from django.db.models.signals import post_save
+
+from utils.minhash import text_fingerprint
+from .dedup import find_duplicate_job, duplicate_parsed_data
+from .models import JobPosting
+
+logger = logging.getLogger(__name__)
+
+JOB_IMPORT_FORMATS = ('csv', 'jsonl')
+
+# Columns a row may fill in itself instead of leaving them to the LLM
+_ROW_FIELDS = ('title', 'company', 'location', 'required_skills')
+_SKILL_SEPARATORS = re.compile(r'[,;|\n]')
+
+Row = Tuple[int, Union[Dict[str, Any], Exception]]
+
+
+def job_import_format(filename: str, file_format: Optional[str] = None) -> str:
+    """
+    Resolve the format of an import file from an explicit value or its extension.
+
+    Raises:
+        ValueError: If the format is not one of JOB_IMPORT_FORMATS
+    """
+    file_format = (file_format or os.path.splitext(filename or '')[1].lstrip('.')).lower()
+    if file_format == 'ndjson':
+        file_format = 'jsonl'
+    if file_format not in JOB_IMPORT_FORMATS:
+        raise ValueError(f"Unsupported import format '{file_format}', expected one of: {', '.join(JOB_IMPORT_FORMATS)}.")
+    return file_format
+
+
+def read_job_rows(file: IO[bytes], file_format: str) -> Iterator[Row]:
+    """
+    Stream records from a CSV or JSONL job import file.
+
+    Rows are numbered from 1: data records for CSV (the header is not
+    counted), lines for JSONL. A JSONL line that is not a JSON object is
+    yielded as a ValueError so the caller can report it and carry on.
+
+    Args:
+        file: Binary file object positioned at the start of the data
+        file_format (str): 'csv' or 'jsonl'
+
+    Yields:
+        Tuple[int, Dict | Exception]: (row number, record or error)
+    """
+    if file_format == 'csv':
+        text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        try:
+            for row_number, record in enumerate(csv.DictReader(text), start=1):
+                yield row_number, record
+        finally:
+            # Leave the underlying file open for its owner
+            text.detach()
+        return
+
+    for row_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield row_number, ValueError(f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield row_number, ValueError("Each line must be a JSON object.")
+            continue
+        yield row_number, record
+
+
+def build_job_posting(description: str, parsed_data: Dict[str, Any]) -> JobPosting:
+    """
+    Validate parsed job data and build an unsaved JobPosting from it.
+
+    Raises:
+        ValueError: If title or company is missing or too long
+    """
+    title = parsed_data.get('title')
+    company = parsed_data.get('company')
+    if not title or not company:
+        raise ValueError("Parsed job data missing required fields (title or company).")
+
+    job_posting = JobPosting(
+        title=title,
+        company=company,
+        description=description,
+        location=parsed_data.get('location'),
+        required_skills=parsed_data.get('required_skills', [])
+    )
+    for field in ('title', 'company', 'location'):
+        value = getattr(job_posting, field)
+        max_length = JobPosting._meta.get_field(field).max_length
+        if value is not None and len(str(value)) > max_length:
+            raise ValueError(f"{field} is longer than {max_length} characters.")
+    return job_posting
+
+
+def job_row_description(record: Dict[str, Any]) -> str:
+    """
+    Job description of an import record.
+
+    Raises:
+        ValueError: If the record has no description
+    """
+    description = record.get('description') or record.get('job_description') or ''
+    if not isinstance(description, str) or not description.strip():
+        raise ValueError("Job description is required.")
+    return description
+
+
+def parse_job_row(record: Dict[str, Any], llm_functions, duplicate: Optional[JobPosting] = None) -> JobPosting:
+    """
+    Turn one import record into an unsaved JobPosting.
+
+    The record must carry a `description`. Any of title, company, location
+    and required_skills it provides take precedence over the parsed
+    values. The LLM is not called when the record provides title, company
+    and required_skills, or when `duplicate` (an existing posting with
+    the same description) is given, whose parsed fields are reused.
+
+    Raises:
+        ValueError: If the record is missing a description or fails validation
+    """
+    description = job_row_description(record)
+
+    provided = {field: record[field] for field in _ROW_FIELDS if record.get(field)}
+    if isinstance(provided.get('required_skills'), str):
+        provided['required_skills'] = [
+            skill.strip() for skill in _SKILL_SEPARATORS.split(provided['required_skills']) if skill.strip()
+        ]
+
+    if {'title', 'company', 'required_skills'} <= provided.keys():
+        parsed_data = {}
+    elif duplicate is not None:
+        parsed_data = duplicate_parsed_data(duplicate)
+    else:
+        parsed_data = llm_functions.parse_job_posting(description)
+    parsed_data.update(provided)
+    return build_job_posting(description, parsed_data)
+
+
+def save_job_postings(job_postings: List[JobPosting]) -> List[Tuple[JobPosting, Optional[str]]]:
+    """
+    Insert job postings with one bulk statement, falling back to row by
+    row inserts when the batch is rejected so one bad row cannot sink it.
+
+    post_save is sent for every inserted posting so skill links, cached
+    responses and ranking precomputation stay in step with single creates.
+
+    Returns:
+        List[Tuple[JobPosting, Optional[str]]]: Each posting and its error, if any
+    """
+    using = router.db_for_write(JobPosting)
+    try:
+        with transaction.atomic(using=using):
+            JobPosting.objects.bulk_create(job_postings)
+            results = [(job_posting, None) for job_posting in job_postings]
+            _send_created(results, using)
+        return results
+    except DatabaseError:
+        logger.warning("Bulk insert of %d job postings failed, retrying row by row", len(job_postings), exc_info=True)
+
+    results = []
+    for job_posting in job_postings:
+        try:
+            with transaction.atomic(using=using):
+                job_posting.save(force_insert=True)
+            results.append((job_posting, None))
+        except DatabaseError as e:
+            results.append((job_posting, str(e)))
+    return results
+
+
+def _send_created(results, using):
+    for job_posting, error in results:
+        if error is None:
+            post_save.send(
+                sender=JobPosting, instance=job_posting, created=True,
+                update_fields=None, raw=False, using=using
+            )
+
+
+def import_job_rows(
+    rows: Iterable[Row],
+    llm_functions,
+    concurrency: int,
+    batch_size: int,
+    start_row: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse and insert job import rows batch by batch.
+
+    Every row is first checked against existing postings (jobs/dedup.py):
+    duplicates are linked to the existing posting or reuse its parsed
+    fields, per JOB_DUPLICATE_ACTION. The remaining descriptions in a
+    batch are parsed concurrently by at most `concurrency` LLM calls, and
+    the batch is then inserted at once. Failed rows are reported and
+    skipped without affecting the rest of the batch.
+
+    Args:
+        rows (Iterable): (row number, record or error) tuples, see read_job_rows
+        llm_functions (GroqLLMFunctions): LLM client shared by the workers
+        concurrency (int): Maximum number of concurrent LLM calls
+        batch_size (int): Rows parsed and inserted per batch
+        start_row (int): Rows numbered below this were imported by an
+            earlier run and are skipped
+
+    Yields:
+        Dict: `{"row", "job_id"}` for every created posting (plus
+        `"duplicate_of"` when its parsed fields were reused),
+        `{"row", "duplicate_of"}` for every row linked to an existing
+        posting, `{"row", "error"}` for every failed row, and after each
+        batch a checkpoint `{"next_row", "created", "linked", "failed"}`.
+        Resume an interrupted import by passing the last `next_row` as
+        `start_row`.
+    """
+    link_duplicates = settings.JOB_DUPLICATE_ACTION == 'link'
+    counts = {"created": 0, "linked": 0, "failed": 0}
+    batch, batch_fingerprints = [], set()
+
+    def parse(item):
+        _, record, duplicate = item
+        try:
+            return parse_job_row(record, llm_functions, duplicate), None
+        except Exception as e:
+            return None, str(e)
+
+    def flush(executor):
+        events, to_parse = {}, []
+        # Validation and duplicate lookups hit the database, so they stay on this thread
+        for row_number, record in batch:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                duplicate = find_duplicate_job(job_row_description(record))
+            except Exception as e:
+                events[row_number] = {"row": row_number, "error": str(e)}
+                continue
+            duplicate = duplicate[0] if duplicate else None
+            if duplicate is not None and link_duplicates:
+                events[row_number] = {"row": row_number, "duplicate_of": str(duplicate.id)}
+            else:
+                to_parse.append((row_number, record, duplicate))
+
+        parsed = list(executor.map(parse, to_parse))
+        to_save = [job_posting for job_posting, _ in parsed if job_posting is not None]
+        save_errors = {id(job_posting): error for job_posting, error in save_job_postings(to_save)} if to_save else {}
+        for (row_number, _, duplicate), (job_posting, error) in zip(to_parse, parsed):
+            if job_posting is not None:
+                error = save_errors[id(job_posting)]
+            if error is not None:
+                events[row_number] = {"row": row_number, "error": error}
+                continue
+            events[row_number] = {"row": row_number, "job_id": str(job_posting.id)}
+            if duplicate is not None:
+                events[row_number]["duplicate_of"] = str(duplicate.id)
+
+        for row_number, _ in batch:
+            event = events[row_number]
+            if "error" in event:
+                counts["failed"] += 1
+            elif "job_id" in event:
+                counts["created"] += 1
+            else:
+                counts["linked"] += 1
+            yield event
+        yield {"next_row": batch[-1][0] + 1, **counts}
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for row in rows:
+            if row[0] < start_row:
+                continue
+            fingerprint = _row_fingerprint(row[1])
+            if fingerprint is not None and fingerprint in batch_fingerprints:
+                # Insert the batch before an exact repeat of one of its rows,
+                # so the repeat is found in the database like any other duplicate
+                yield from flush(executor)
+                batch, batch_fingerprints = [], set()
+            batch.append(row)
+            if fingerprint is not None:
+                batch_fingerprints.add(fingerprint)
+            if len(batch) >= batch_size:
+                yield from flush(executor)
+                batch, batch_fingerprints = [], set()
+        if batch:
+            yield from flush(executor)
+
+
+def _row_fingerprint(record) -> Optional[str]:
+    if not settings.JOB_DEDUP_ENABLED or not isinstance(record, dict):
+        return None
+    try:
+        return text_fingerprint(job_row_description(record))
+    except ValueError:
+        return None
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.caching import register_cache_invalidation
+from .dedup import index_job_description
+from .models import JobPosting
+
+register_cache_invalidation(JobPosting)
+
+
+@receiver(post_save, sender=JobPosting)
+def index_description(sender, instance, created, raw=False, **kwargs):
+    if not raw:
+        index_job_description(instance, created=created)
@@ -1,3 +1,269 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from utils.minhash import text_fingerprint
+from .dedup import find_duplicate_job
+from .models import JobDescriptionBucket, JobPosting
+from .services import import_job_rows, job_import_format, read_job_rows
+
+DESCRIPTION = ' '.join(f'duty{i}' for i in range(200))
+
+
+@override_settings(JOB_DEDUP_ENABLED=True, JOB_DEDUP_THRESHOLD=0.85)
+class FindDuplicateJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.job = JobPosting.objects.create(title='Backend', company='Acme', description=DESCRIPTION)
+
+    def test_saved_postings_are_indexed(self):
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.description_hash, text_fingerprint(DESCRIPTION))
+        self.assertEqual(JobDescriptionBucket.objects.filter(job=self.job).count(), 32)
+
+    def test_exact_duplicate_by_fingerprint(self):
+        JobPosting.objects.create(title='Repost', company='Acme', description=DESCRIPTION)
+        # Found without comparing signatures; the oldest posting wins
+        with mock.patch('jobs.dedup.signature_similarity') as similarity:
+            self.assertEqual(find_duplicate_job(DESCRIPTION.upper() + '!'), (self.job, 1.0))
+        similarity.assert_not_called()
+
+    def test_near_duplicate_from_shared_bucket(self):
+        job, similarity = find_duplicate_job(DESCRIPTION.replace('duty100', 'task100'))
+        self.assertEqual(job, self.job)
+        self.assertGreaterEqual(similarity, 0.85)
+        self.assertLess(similarity, 1.0)
+
+    def test_similarity_below_threshold(self):
+        edited = DESCRIPTION.replace('duty100', 'task100')
+        with override_settings(JOB_DEDUP_THRESHOLD=0.999):
+            self.assertIsNone(find_duplicate_job(edited))
+
+    def test_only_bucket_candidates_are_compared(self):
+        JobDescriptionBucket.objects.filter(job=self.job).delete()
+        self.assertIsNone(find_duplicate_job(DESCRIPTION.replace('duty100', 'task100')))
+
+    def test_unrelated_description(self):
+        self.assertIsNone(find_duplicate_job(' '.join(f'task{i}' for i in range(200))))
+
+    @override_settings(JOB_DEDUP_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(find_duplicate_job(DESCRIPTION))
+
+
+class CreateFromDescriptionDedupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.job = JobPosting.objects.create(
+            title='Backend', company='Acme', description=DESCRIPTION, required_skills=['python']
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        patcher = mock.patch('jobs.views.GroqLLMFunctions')
+        self.llm_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.llm_class.return_value.parse_job_posting.return_value = {
+            'title': 'Parsed', 'company': 'Acme', 'location': None, 'required_skills': ['go']
+        }
+
+    def post(self):
+        return self.client.post('/api/jobs/create_from_description/', {'job_description': DESCRIPTION}, format='json')
+
+    def test_off_by_default(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['title'], 'Parsed')
+        self.assertEqual(JobPosting.objects.count(), 2)
+
+    @override_settings(JOB_DEDUP_ENABLED=True, JOB_DUPLICATE_ACTION='link')
+    def test_link_returns_existing_posting(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['id'], str(self.job.id))
+        self.assertEqual(JobPosting.objects.count(), 1)
+        self.llm_class.assert_not_called()
+
+    @override_settings(JOB_DEDUP_ENABLED=True, JOB_DUPLICATE_ACTION='reuse')
+    def test_reuse_copies_parsed_fields(self):
+        response = self.post()
+        self.assertEqual(response.status_code, 201)
+        self.assertNotEqual(response.data['id'], str(self.job.id))
+        self.assertEqual((response.data['title'], response.data['required_skills']), ('Backend', ['python']))
+        self.llm_class.assert_not_called()
+
+
+class FakeJobLLM:
+    """Stand-in for GroqLLMFunctions parsing job postings; descriptions containing 'unparseable' fail."""
+
+    def __init__(self):
+        self.calls = []
+
+    def parse_job_posting(self, description):
+        self.calls.append(description)
+        if 'unparseable' in description:
+            raise RuntimeError("Groq API call failed")
+        return {'title': 'Parsed', 'company': 'Acme', 'location': 'Remote', 'required_skills': ['python']}
+
+
+class ReadJobRowsTests(SimpleTestCase):
+    def test_format_from_extension_or_override(self):
+        self.assertEqual(job_import_format('jobs.CSV'), 'csv')
+        self.assertEqual(job_import_format('jobs.ndjson'), 'jsonl')
+        self.assertEqual(job_import_format('jobs.txt', 'jsonl'), 'jsonl')
+        with self.assertRaises(ValueError):
+            job_import_format('jobs.xlsx')
+
+    def test_csv_rows_numbered_from_first_record(self):
+        data = '\ufefftitle,description\nBackend,"Build, ship"\nFrontend,UI\n'.encode('utf-8')
+        file = io.BytesIO(data)
+        rows = list(read_job_rows(file, 'csv'))
+        self.assertEqual(rows, [(1, {'title': 'Backend', 'description': 'Build, ship'}), (2, {'title': 'Frontend', 'description': 'UI'})])
+        self.assertFalse(file.closed)
+
+    def test_jsonl_errors_are_rows(self):
+        data = b'{"description": "One"}\n\nnot json\n[1, 2]\n{"description": "Two"}\n'
+        rows = list(read_job_rows(io.BytesIO(data), 'jsonl'))
+        self.assertEqual([row_number for row_number, _ in rows], [1, 3, 4, 5])
+        self.assertEqual(rows[0][1], {'description': 'One'})
+        self.assertIsInstance(rows[1][1], ValueError)
+        self.assertEqual(str(rows[2][1]), "Each line must be a JSON object.")
+        self.assertEqual(rows[3][1], {'description': 'Two'})
+
+
+class ImportJobRowsTests(TestCase):
+    def run_import(self, records, batch_size=10, **kwargs):
+        self.llm = FakeJobLLM()
+        rows = [(i, record) for i, record in enumerate(records, start=1)]
+        return list(import_job_rows(rows, self.llm, 2, batch_size, **kwargs))
+
+    def test_rows_are_parsed_or_taken_as_given(self):
+        events = self.run_import([
+            {'description': 'Build APIs'},
+            {'description': 'Ship UIs', 'title': 'Frontend', 'company': 'Beta', 'required_skills': 'react; css'},
+        ])
+        self.assertEqual(self.llm.calls, ['Build APIs'])
+        first, second = (JobPosting.objects.get(id=event['job_id']) for event in events[:2])
+        self.assertEqual((first.title, first.location), ('Parsed', 'Remote'))
+        self.assertEqual((second.title, second.company, second.required_skills), ('Frontend', 'Beta', ['react', 'css']))
+        self.assertEqual(events[2], {'next_row': 3, 'created': 2, 'linked': 0, 'failed': 0})
+
+    def test_failed_rows_do_not_affect_the_rest(self):
+        events = self.run_import([
+            {'description': 'Build APIs'},
+            ValueError("Invalid JSON: Expecting value"),
+            {'title': 'No description'},
+            {'description': 'unparseable'},
+            {'description': 'Long title', 'title': 'x' * 300, 'company': 'Acme', 'required_skills': ['go']},
+            {'description': 'Ship UIs'},
+        ])
+        errors = {event['row']: event['error'] for event in events if 'error' in event}
+        self.assertEqual(errors, {
+            2: "Invalid JSON: Expecting value",
+            3: "Job description is required.",
+            4: "Groq API call failed",
+            5: "title is longer than 255 characters.",
+        })
+        self.assertEqual(events[-1], {'next_row': 7, 'created': 2, 'linked': 0, 'failed': 4})
+        self.assertEqual(JobPosting.objects.count(), 2)
+
+    def test_checkpoint_per_batch_and_resume(self):
+        records = [{'description': f'Role {i}'} for i in range(5)]
+        events = self.run_import(records, batch_size=2)
+        self.assertEqual([event['next_row'] for event in events if 'next_row' in event], [3, 5, 6])
+
+        JobPosting.objects.all().delete()
+        events = self.run_import(records, batch_size=2, start_row=4)
+        self.assertEqual([event['row'] for event in events if 'row' in event], [4, 5])
+        self.assertEqual(self.llm.calls, ['Role 3', 'Role 4'])
+
+    @override_settings(JOB_DEDUP_ENABLED=True, JOB_DUPLICATE_ACTION='link')
+    def test_duplicates_link_including_repeats_within_a_batch(self):
+        existing = JobPosting.objects.create(title='Backend', company='Acme', description=DESCRIPTION)
+        events = self.run_import([
+            {'description': DESCRIPTION.replace('duty100', 'task100')},
+            {'description': 'New role'},
+            {'description': 'new ROLE!'},
+        ])
+        created = JobPosting.objects.get(description='New role')
+        # The repeat starts a new batch, so it finds the posting just inserted
+        self.assertEqual([event for event in events if 'row' in event], [
+            {'row': 1, 'duplicate_of': str(existing.id)},
+            {'row': 2, 'job_id': str(created.id)},
+            {'row': 3, 'duplicate_of': str(created.id)},
+        ])
+        self.assertEqual(self.llm.calls, ['New role'])
+        self.assertEqual(events[-1], {'next_row': 4, 'created': 1, 'linked': 2, 'failed': 0})
+
+    @override_settings(JOB_DEDUP_ENABLED=True, JOB_DUPLICATE_ACTION='reuse')
+    def test_duplicates_reuse_parsed_fields(self):
+        existing = JobPosting.objects.create(
+            title='Backend', company='Acme', description=DESCRIPTION, required_skills=['python']
+        )
+        (event, checkpoint) = self.run_import([{'description': DESCRIPTION}])
+        self.assertEqual(event['duplicate_of'], str(existing.id))
+        self.assertEqual(JobPosting.objects.get(id=event['job_id']).title, 'Backend')
+        self.assertEqual(self.llm.calls, [])
+        self.assertEqual(checkpoint['created'], 1)
+
+
+class ImportJobsCommandTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'jobs.jsonl')
+
+    def write(self, *records):
+        with open(self.path, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+
+    def call(self, *args):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        call_command('import_jobs', self.path, *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_llm_client_built_only_when_needed(self):
+        self.write({'description': 'Ship UIs', 'title': 'Frontend', 'company': 'Beta', 'required_skills': ['react']})
+        with mock.patch('jobs.management.commands.import_jobs.GroqLLMFunctions') as llm_class:
+            stdout, _ = self.call()
+        llm_class.assert_not_called()
+        self.assertIn('Imported 1 job postings (0 linked to existing postings, 0 failed)', stdout)
+
+        self.write({'description': 'Build APIs'})
+        with mock.patch('jobs.management.commands.import_jobs.GroqLLMFunctions', FakeJobLLM):
+            self.call('--restart')
+        self.assertTrue(JobPosting.objects.filter(title='Parsed').exists())
+
+    def test_errors_reported_and_progress_resumed(self):
+        self.write({'description': 'Role 1'}, {'title': 'No description'}, {'description': 'Role 3'})
+        with mock.patch('jobs.management.commands.import_jobs.GroqLLMFunctions', FakeJobLLM):
+            stdout, stderr = self.call('--batch-size', '2')
+            self.assertEqual(stderr, 'Row 2: Job description is required.\n')
+            self.assertIn('Imported 2 job postings (0 linked to existing postings, 1 failed)', stdout)
+            with open(f'{self.path}.progress') as f:
+                self.assertEqual(json.load(f), {'next_row': 4})
+
+            # Nothing left to import on a second run
+            stdout, _ = self.call()
+        self.assertIn('Resuming from row 4', stdout)
+        self.assertEqual(JobPosting.objects.count(), 2)
+
+    def test_unknown_format(self):
+        with self.assertRaises(CommandError):
+            call_command('import_jobs', 'jobs.xml')
@@ -1,18 +1,45 @@
-from rest_framework import viewsets, status
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.functional import SimpleLazyObject
+from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import JobPosting
 from .serializers import JobPostingSerializer
+from .dedup import find_duplicate_job, duplicate_parsed_data
+from .services import build_job_posting, job_import_format, read_job_rows, import_job_rows
 from utils.llm_functions import GroqLLMFunctions
+from core.caching import CachedResponseMixin
+from core.admission import LLMRateThrottle, llm_admission
+from core.renderers import dumps
+from skills.services import parse_skill_filter, filter_jobs_by_skills, job_skill_coverage
 import logging
 
 logger = logging.getLogger(__name__)
 
-class JobPostingViewSet(viewsets.ModelViewSet):
+class JobPostingViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = JobPosting.objects.all()
     serializer_class = JobPostingSerializer
+    pagination_ordering = ('-posted_date', '-id')
+    # `?search=` matches title, company or location (used by the job picker)
+    filter_backends = [filters.SearchFilter]
+    search_fields = ['title', 'company', 'location']
 
-    @action(detail=False, methods=['POST'])
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        skills = parse_skill_filter(self.request.query_params.get('skills'))
+        return filter_jobs_by_skills(queryset, skills)
+
+    @action(detail=True, methods=['GET'])
+    def skill_coverage(self, request, pk=None):
+        """
+        Number of candidates having each skill this job requires.
+        """
+        job_posting = self.get_object()
+        return Response(job_skill_coverage(job_posting), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
     def create_from_description(self, request):
         job_description = request.data.get('job_description')
         if not job_description:
@@ -21,22 +48,66 @@ class JobPostingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        llm_functions = GroqLLMFunctions()
-        parsed_data = llm_functions.parse_job_posting(job_description)
-
-        if not parsed_data.get('title') or not parsed_data.get('company'):
-            return Response(
-                {"error": "Parsed job data missing required fields (title or company)."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Re-posted descriptions link to the existing posting or reuse its parsed fields
+        duplicate = find_duplicate_job(job_description)
+        if duplicate is not None:
+            existing, similarity = duplicate
+            logger.info(f"Job description duplicates posting {existing.id} (similarity {similarity:.2f})")
+            if settings.JOB_DUPLICATE_ACTION == 'link':
+                serializer = self.get_serializer(existing)
+                return Response(serializer.data, status=status.HTTP_200_OK)
+            parsed_data = duplicate_parsed_data(existing)
+        else:
+            llm_functions = GroqLLMFunctions()
+            parsed_data = llm_functions.parse_job_posting(job_description)
 
-        job_posting = JobPosting.objects.create(
-            title=parsed_data.get('title'),
-            company=parsed_data.get('company'),
-            description=job_description,
-            location=parsed_data.get('location'),
-            required_skills=parsed_data.get('required_skills', [])
-        )
+        try:
+            job_posting = build_job_posting(job_description, parsed_data)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        job_posting.save()
 
         serializer = self.get_serializer(job_posting)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
\ No newline at end of file
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
+    def bulk_import(self, request):
+        """
+        Import job postings from an uploaded CSV or JSONL `file`.
+
+        Each row needs a `description`; title, company, location and
+        required_skills columns are optional and override the parsed
+        values. Results are streamed back as newline-delimited JSON, with
+        a `next_row` checkpoint after every batch: re-upload the same file
+        with `start_row` set to the last checkpoint to resume.
+        """
+        file = request.FILES.get('file')
+        if not file:
+            return Response({"error": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            file_format = job_import_format(file.name, request.data.get('format'))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            start_row = int(request.data.get('start_row', 1))
+        except ValueError:
+            return Response({"error": "start_row must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        def stream():
+            try:
+                for event in import_job_rows(
+                    read_job_rows(file, file_format),
+                    SimpleLazyObject(GroqLLMFunctions),
+                    settings.JOB_IMPORT_CONCURRENCY,
+                    settings.JOB_IMPORT_BATCH_SIZE,
+                    start_row=start_row
+                ):
+                    yield dumps(event) + b"\n"
+            except Exception as e:
+                logger.exception("Error during job import")
+                yield dumps({"error": str(e)}) + b"\n"
+
+        return StreamingHttpResponse(stream(), content_type='application/x-ndjson')
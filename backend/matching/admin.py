@@ -1,5 +1,6 @@
 from django.contrib import admin
 
-from .models import JobMatch
+from .models import JobMatch, JobCandidateRanking
 
-admin.site.register(JobMatch)
\ No newline at end of file
+admin.site.register(JobMatch)
+admin.site.register(JobCandidateRanking)
\ No newline at end of file
@@ -0,0 +1,147 @@
+import uuid
+from datetime import datetime, time
+from typing import Any, Dict, Iterator, Mapping
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from candidates.models import CandidateProfile
+from skills.services import parse_skill_filter, filter_candidates_by_skills
+from .models import JobMatch
+
+MATCH_EXPORT_COLUMNS = [
+    'id', 'candidate_id', 'candidate_name', 'job_id', 'job_title', 'job_company',
+    'match_score', 'missing_skills', 'match_summary', 'created_at'
+]
+CANDIDATE_EXPORT_COLUMNS = [
+    'id', 'name', 'email', 'phone',
+    'parsed_skills', 'parsed_education', 'parsed_work_experience',
+    'created_at', 'updated_at'
+]
+
+
+def _parse_uuid(name: str, value):
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise ValueError(f"{name} must be a valid id.")
+
+
+def _parse_score(name: str, value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number.")
+
+
+def _parse_moment(name: str, value, end_of_day: bool = False) -> datetime:
+    # Checked first: parse_datetime also accepts a bare date (as midnight)
+    day = parse_date(value)
+    if day is not None:
+        # A bare date covers the whole day
+        moment = datetime.combine(day, time.max if end_of_day else time.min)
+    else:
+        moment = parse_datetime(value)
+        if moment is None:
+            raise ValueError(f"{name} must be an ISO 8601 date or datetime.")
+    if settings.USE_TZ and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def parse_export_filters(params: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Validate export filters from query parameters or command options.
+
+    Recognized keys: job_id, candidate_id, min_score, max_score,
+    created_after, created_before (ISO dates or datetimes, inclusive)
+    and skills (comma-separated, candidates only). Empty values are ignored.
+
+    Raises:
+        ValueError: If a filter value is malformed
+    """
+    filters = {}
+    for name in ('job_id', 'candidate_id'):
+        if params.get(name):
+            filters[name] = _parse_uuid(name, params[name])
+    for name in ('min_score', 'max_score'):
+        if params.get(name) not in (None, ''):
+            filters[name] = _parse_score(name, params[name])
+    if params.get('created_after'):
+        filters['created_after'] = _parse_moment('created_after', params['created_after'])
+    if params.get('created_before'):
+        filters['created_before'] = _parse_moment('created_before', params['created_before'], end_of_day=True)
+    if params.get('skills'):
+        filters['skills'] = parse_skill_filter(params['skills'])
+    return filters
+
+
+def _match_conditions(filters: Dict[str, Any]) -> Dict[str, Any]:
+    lookups = {
+        'job_id': 'job_id',
+        'candidate_id': 'candidate_id',
+        'min_score': 'match_score__gte',
+        'max_score': 'match_score__lte',
+    }
+    return {lookup: filters[name] for name, lookup in lookups.items() if name in filters}
+
+
+def _created_conditions(filters: Dict[str, Any]) -> Dict[str, Any]:
+    conditions = {}
+    if 'created_after' in filters:
+        conditions['created_at__gte'] = filters['created_after']
+    if 'created_before' in filters:
+        conditions['created_at__lte'] = filters['created_before']
+    return conditions
+
+
+def match_export_rows(filters: Dict[str, Any], chunk_size: int = 2000) -> Iterator[Dict[str, Any]]:
+    """
+    Stream JobMatch rows for export, oldest first.
+
+    Rows are plain dicts fetched with a server-side cursor (where the
+    database supports one) `chunk_size` rows at a time, so memory use
+    does not grow with the table.
+
+    Args:
+        filters (Dict): Output of parse_export_filters
+        chunk_size (int): Rows fetched per database round trip
+
+    Yields:
+        Dict: One row keyed by MATCH_EXPORT_COLUMNS
+    """
+    queryset = (
+        JobMatch.objects.filter(**_match_conditions(filters), **_created_conditions(filters))
+        .order_by('created_at', 'id')
+        .values(
+            'id', 'candidate_id', 'job_id', 'match_score', 'missing_skills', 'match_summary', 'created_at',
+            candidate_name=F('candidate__name'),
+            job_title=F('job__title'),
+            job_company=F('job__company')
+        )
+    )
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+def candidate_export_rows(filters: Dict[str, Any], chunk_size: int = 2000) -> Iterator[Dict[str, Any]]:
+    """
+    Stream CandidateProfile rows for export, oldest first.
+
+    Job and score filters select candidates with a match for that job
+    (or any job) in the score range.
+
+    Args:
+        filters (Dict): Output of parse_export_filters
+        chunk_size (int): Rows fetched per database round trip
+
+    Yields:
+        Dict: One row keyed by CANDIDATE_EXPORT_COLUMNS
+    """
+    queryset = CandidateProfile.objects.filter(**_created_conditions(filters))
+    match_conditions = _match_conditions(filters)
+    if match_conditions:
+        queryset = queryset.filter(id__in=JobMatch.objects.filter(**match_conditions).values('candidate_id'))
+    queryset = filter_candidates_by_skills(queryset, filters.get('skills'))
+    return queryset.order_by('created_at', 'id').values(*CANDIDATE_EXPORT_COLUMNS).iterator(chunk_size=chunk_size)
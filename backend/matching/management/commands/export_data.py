@@ -0,0 +1,56 @@
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from core.export import EXPORT_FORMATS, stream_export
+from matching.exports import (
+    MATCH_EXPORT_COLUMNS, CANDIDATE_EXPORT_COLUMNS,
+    parse_export_filters, match_export_rows, candidate_export_rows
+)
+
+EXPORTS = {
+    'matches': (MATCH_EXPORT_COLUMNS, match_export_rows),
+    'candidates': (CANDIDATE_EXPORT_COLUMNS, candidate_export_rows),
+}
+
+
+class Command(BaseCommand):
+    help = "Stream job matches or candidate profiles to a JSONL or CSV file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(EXPORTS))
+        parser.add_argument('--format', choices=EXPORT_FORMATS, default='jsonl')
+        parser.add_argument('--output', help="File to write (default: stdout)")
+        parser.add_argument('--job', dest='job_id', help="Only matches for this job id")
+        parser.add_argument('--candidate', dest='candidate_id', help="Only matches for this candidate id")
+        parser.add_argument('--min-score', dest='min_score', type=float)
+        parser.add_argument('--max-score', dest='max_score', type=float)
+        parser.add_argument('--created-after', dest='created_after', help="ISO date or datetime, inclusive")
+        parser.add_argument('--created-before', dest='created_before', help="ISO date or datetime, inclusive")
+        parser.add_argument('--skills', help="Comma-separated skills every exported candidate must have")
+        parser.add_argument('--chunk-size', type=int, default=settings.EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            filters = parse_export_filters(options)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        columns, export_rows = EXPORTS[options['kind']]
+        lines = stream_export(export_rows(filters, options['chunk_size']), columns, options['format'])
+
+        output = open(options['output'], 'wb') if options['output'] else sys.stdout.buffer
+        count = -1 if options['format'] == 'csv' else 0
+        try:
+            for line in lines:
+                output.write(line)
+                count += 1
+        finally:
+            if options['output']:
+                output.close()
+            else:
+                output.flush()
+
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f"Exported {count} {options['kind']} to {options['output']}"))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobmatch",
+            name="input_fingerprint",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0004_remove_candidateprofile_username_and_more"),
+        ("jobs", "0001_initial"),
+        ("matching", "0002_jobmatch_input_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobCandidateRanking",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("local_score", models.FloatField()),
+                ("llm_score", models.FloatField(blank=True, null=True)),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "candidate",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_rankings",
+                        to="candidates.candidateprofile",
+                    ),
+                ),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="candidate_rankings",
+                        to="jobs.jobposting",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["job", "-llm_score", "-local_score"],
+                        name="matching_ranking_job_score",
+                    )
+                ],
+                "unique_together": {("job", "candidate")},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("candidates", "0005_keyset_pagination_index"),
+        ("jobs", "0002_keyset_pagination_index"),
+        ("matching", "0003_jobcandidateranking"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobmatch",
+            index=models.Index(fields=["created_at", "id"], name="matching_created_id"),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0004_keyset_pagination_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobmatch",
+            name="cover_letter_fingerprint",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
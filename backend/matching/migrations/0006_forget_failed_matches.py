@@ -0,0 +1,22 @@
+from django.db import migrations
+
+# Summary of the placeholder result stored when the LLM call failed
+FAILED_MATCH_SUMMARY = "Unable to perform match analysis"
+
+
+def forget_failed_matches(apps, schema_editor):
+    # Placeholder results were stored with a valid fingerprint and so reused
+    # as real scores; without one they are recomputed on the next match
+    JobMatch = apps.get_model("matching", "JobMatch")
+    JobMatch.objects.filter(match_score=0, match_summary=FAILED_MATCH_SUMMARY).update(input_fingerprint=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("matching", "0005_jobmatch_cover_letter_fingerprint"),
+    ]
+
+    operations = [
+        migrations.RunPython(forget_failed_matches, migrations.RunPython.noop),
+    ]
@@ -14,11 +14,39 @@ class JobMatch(models.Model):
     missing_skills = models.JSONField(null=True, blank=True)
     match_summary = models.TextField(null=True, blank=True)
     cover_letter = models.TextField(null=True, blank=True)
+    # SHA-256 of the candidate/job inputs the match was computed from
+    input_fingerprint = models.CharField(max_length=64, null=True, blank=True)
+    # SHA-256 of the inputs the cover letter was generated from
+    cover_letter_fingerprint = models.CharField(max_length=64, null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         unique_together = ('candidate', 'job')
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='matching_created_id'),
+        ]
 
     def __str__(self):
-        return f"Match for {self.candidate.username} - {self.job.title}"
\ No newline at end of file
+        return f"Match for {self.candidate.username} - {self.job.title}"
+
+class JobCandidateRanking(models.Model):
+    """Precomputed ranking of candidates for a job posting"""
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='candidate_rankings')
+    candidate = models.ForeignKey(CandidateProfile, on_delete=models.CASCADE, related_name='job_rankings')
+
+    # Cheap skill-overlap score, computed for every eligible candidate
+    local_score = models.FloatField()
+    # LLM score, only computed for the top slice by local score
+    llm_score = models.FloatField(null=True, blank=True)
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('job', 'candidate')
+        indexes = [
+            models.Index(fields=['job', '-llm_score', '-local_score'], name='matching_ranking_job_score'),
+        ]
+
+    def __str__(self):
+        return f"Ranking for {self.candidate} - {self.job.title}"
@@ -1,7 +1,8 @@
 from rest_framework import serializers
-from .models import JobMatch
+from .models import JobMatch, JobCandidateRanking
 from candidates.serializers import CandidateProfileSerializer
 from jobs.serializers import JobPostingSerializer
+from core.serializers import SparseFieldsetMixin
 
 class JobMatchSerializer(serializers.ModelSerializer):
     candidate = CandidateProfileSerializer(read_only=True)
@@ -14,4 +15,41 @@ class JobMatchSerializer(serializers.ModelSerializer):
             'match_score', 'missing_skills',
             'match_summary', 'cover_letter'
         ]
-        read_only_fields = ['id']
\ No newline at end of file
+        read_only_fields = ['id']
+
+
+class JobMatchListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Slim match representation for list pages: ids and names instead of nested profiles"""
+    candidate_name = serializers.ReadOnlyField(source='candidate.name')
+    job_title = serializers.ReadOnlyField(source='job.title')
+    job_company = serializers.ReadOnlyField(source='job.company')
+
+    # Columns loaded for list pages; keep in sync with the fields above
+    list_only_fields = [
+        'id', 'candidate', 'job',
+        'match_score', 'missing_skills', 'match_summary', 'created_at',
+        'candidate__id', 'candidate__name',
+        'job__id', 'job__title', 'job__company',
+    ]
+
+    class Meta:
+        model = JobMatch
+        fields = [
+            'id', 'candidate', 'candidate_name',
+            'job', 'job_title', 'job_company',
+            'match_score', 'missing_skills',
+            'match_summary', 'created_at'
+        ]
+        read_only_fields = fields
+
+class JobCandidateRankingSerializer(serializers.ModelSerializer):
+    candidate_name = serializers.ReadOnlyField(source='candidate.name')
+
+    class Meta:
+        model = JobCandidateRanking
+        fields = [
+            'candidate', 'candidate_name',
+            'local_score', 'llm_score',
+            'computed_at'
+        ]
+        read_only_fields = fields
\ No newline at end of file
@@ -0,0 +1,382 @@
+import hashlib
+import heapq
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from core.caching import invalidate_model_cache
+from utils.background import BackgroundExecutor
+from utils.llm_functions import GroqLLMFunctions
+from utils.scoring import local_match_score, normalize_skills
+from skills.services import candidate_skill_overlaps, sync_job_skills
+from .models import JobMatch, JobCandidateRanking
+
+logger = logging.getLogger(__name__)
+
+
+def build_candidate_data(candidate) -> Dict[str, Any]:
+    """
+    Build the candidate payload sent to the matching LLM.
+
+    Args:
+        candidate (CandidateProfile): Candidate profile
+
+    Returns:
+        Dict: Candidate skills, education and work experience
+    """
+    return {
+        'skills': candidate.parsed_skills,
+        'education': candidate.parsed_education,
+        'work_experience': candidate.parsed_work_experience
+    }
+
+
+def build_job_data(job) -> Dict[str, Any]:
+    """
+    Build the job payload sent to the matching LLM.
+
+    Args:
+        job (JobPosting): Job posting
+
+    Returns:
+        Dict: Job title, company and required skills
+    """
+    return {
+        'title': job.title,
+        'company': job.company,
+        'required_skills': job.required_skills
+    }
+
+
+def match_fingerprint(candidate_data: Dict[str, Any], job_data: Dict[str, Any]) -> str:
+    """
+    Fingerprint the inputs of a match so stored results can be reused
+    until the candidate or job data they were computed from changes.
+
+    Args:
+        candidate_data (Dict): Candidate payload
+        job_data (Dict): Job payload
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON inputs
+    """
+    payload = json.dumps(
+        {'candidate': candidate_data, 'job': job_data},
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def candidate_prescores(candidate, jobs: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Score a candidate against job postings without calling the LLM.
+
+    Every job gets the local skill-overlap score and the required skills
+    the candidate lacks. A stored LLM match is included only if it was
+    computed from the current candidate and job data (see
+    match_fingerprint); otherwise its fields are None.
+
+    Args:
+        candidate (CandidateProfile): Candidate profile
+        jobs (Iterable[JobPosting]): Job postings to score against
+
+    Returns:
+        List[Dict]: One row per job, LLM-scored jobs first by LLM score,
+        then by local score
+    """
+    candidate_data = build_candidate_data(candidate)
+    candidate_skills = normalize_skills(candidate.parsed_skills)
+    stored = {
+        job_match.job_id: job_match
+        for job_match in JobMatch.objects.filter(candidate=candidate).only(
+            'job_id', 'match_score', 'missing_skills', 'match_summary', 'input_fingerprint'
+        )
+    }
+
+    rows = []
+    for job in jobs:
+        required = normalize_skills(job.required_skills)
+        job_match = stored.get(job.id)
+        if job_match and job_match.input_fingerprint != match_fingerprint(candidate_data, build_job_data(job)):
+            job_match = None
+        rows.append({
+            'job_id': str(job.id),
+            'title': job.title,
+            'company': job.company,
+            'location': job.location,
+            'local_score': local_match_score(candidate_skills, required),
+            'local_missing_skills': sorted(required - candidate_skills),
+            'match_score': job_match.match_score if job_match else None,
+            'missing_skills': job_match.missing_skills if job_match else None,
+            'summary': job_match.match_summary if job_match else None,
+        })
+
+    rows.sort(
+        key=lambda row: (row['match_score'] is not None, row['match_score'] or 0, row['local_score']),
+        reverse=True
+    )
+    return rows
+
+
+def build_cover_letter_data(job_match) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Build the candidate and job payloads a cover letter is written from.
+
+    Args:
+        job_match (JobMatch): Match with its candidate and job loaded
+
+    Returns:
+        Tuple[Dict, Dict]: Candidate and job payloads, the matching
+        payloads plus the candidate's name and the job's location
+    """
+    candidate, job = job_match.candidate, job_match.job
+    candidate_data = {'name': candidate.name, **build_candidate_data(candidate)}
+    job_data = {**build_job_data(job), 'location': job.location}
+    return candidate_data, job_data
+
+
+def save_cover_letter(job_match: JobMatch, cover_letter: str, fingerprint: str) -> JobMatch:
+    """
+    Store a generated cover letter along with the fingerprint of its inputs.
+    """
+    job_match.cover_letter = cover_letter
+    job_match.cover_letter_fingerprint = fingerprint
+    job_match.save(update_fields=['cover_letter', 'cover_letter_fingerprint'])
+    return job_match
+
+
+def score_pairs(
+    pairs: Iterable[Tuple[Any, Any]],
+    llm_functions,
+    max_workers: int
+) -> Iterator[Tuple[Any, Any, str, Dict[str, Any]]]:
+    """
+    Score candidate/job pairs with the LLM using a bounded thread pool.
+
+    Results are yielded in completion order, so callers can stream them
+    back as soon as each pair finishes. Pairs whose LLM call raises are
+    logged and yielded with a match_result of None; they must not be
+    stored.
+
+    Args:
+        pairs (Iterable): (candidate, job) tuples to score
+        llm_functions (GroqLLMFunctions): LLM client shared by the workers
+        max_workers (int): Maximum number of concurrent LLM calls
+
+    Yields:
+        Tuple: (candidate, job, fingerprint, match_result or None)
+    """
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {}
+        for candidate, job in pairs:
+            candidate_data = build_candidate_data(candidate)
+            job_data = build_job_data(job)
+            future = executor.submit(llm_functions.match_candidate_to_job, candidate_data, job_data)
+            futures[future] = (candidate, job, match_fingerprint(candidate_data, job_data))
+
+        for future in as_completed(futures):
+            candidate, job, fingerprint = futures[future]
+            try:
+                match_result = future.result()
+            except Exception as e:
+                logger.error(f"Matching candidate {candidate.id} to job {job.id} failed: {e}")
+                match_result = None
+            yield candidate, job, fingerprint, match_result
+
+
+def apply_match_result(job_match: JobMatch, match_result: Dict[str, Any], fingerprint: str) -> JobMatch:
+    """
+    Copy an LLM match result onto a JobMatch instance without saving it.
+    """
+    job_match.match_score = match_result.get('match_score', 0)
+    job_match.missing_skills = match_result.get('missing_skills', [])
+    job_match.match_summary = match_result.get('summary', '')
+    job_match.input_fingerprint = fingerprint
+    return job_match
+
+
+def save_job_matches(to_create: List[JobMatch], to_update: List[JobMatch], batch_size: int = 100) -> None:
+    """
+    Persist new and refreshed matches with one bulk statement per batch.
+    """
+    if to_create:
+        JobMatch.objects.bulk_create(to_create, batch_size=batch_size)
+    if to_update:
+        JobMatch.objects.bulk_update(
+            to_update,
+            ['match_score', 'missing_skills', 'match_summary', 'input_fingerprint'],
+            batch_size=batch_size
+        )
+    # Bulk writes do not send post_save, so bump the cached versions by hand
+    if to_create or to_update:
+        invalidate_model_cache(JobMatch)
+        for job_match in to_update:
+            invalidate_model_cache(JobMatch, job_match.pk)
+
+
+# Shared by every job posting. LLM re-scoring is queued in slices, so a
+# job posted while another is being scored waits for one slice of LLM
+# calls at most, not for the whole job.
+precompute_executor = BackgroundExecutor(settings.MATCH_PRECOMPUTE_WORKERS, 'match-precompute')
+
+
+def schedule_job_precompute(job_id):
+    """
+    Queue ranking precomputation for a job posting on the background pool.
+
+    The local ranking runs first; LLM re-scoring of its top candidates is
+    then queued MATCH_PRECOMPUTE_LLM_CONCURRENCY candidates at a time,
+    each slice behind whatever was queued meanwhile.
+    """
+    return precompute_executor.submit(_run_job_precompute, job_id)
+
+
+def _run_job_precompute(job_id):
+    close_old_connections()
+    try:
+        _, top_ids = rank_job_candidates(job_id)
+    finally:
+        close_old_connections()
+    if top_ids:
+        precompute_executor.submit(_run_llm_slice, job_id, top_ids)
+
+
+def _run_llm_slice(job_id, candidate_ids):
+    size = max(1, settings.MATCH_PRECOMPUTE_LLM_CONCURRENCY)
+    close_old_connections()
+    try:
+        score_top_candidates(job_id, candidate_ids[:size])
+    finally:
+        close_old_connections()
+    if candidate_ids[size:]:
+        precompute_executor.submit(_run_llm_slice, job_id, candidate_ids[size:])
+
+
+def precompute_job_rankings(job_id, llm_functions=None) -> int:
+    """
+    Rank every eligible candidate against a job posting, then LLM re-score the best.
+
+    Runs both steps in the calling thread; schedule_job_precompute splits
+    them into background tasks instead.
+
+    Args:
+        job_id: JobPosting primary key
+        llm_functions (GroqLLMFunctions, optional): LLM client to use
+
+    Returns:
+        int: Number of ranking rows written
+    """
+    written, top_ids = rank_job_candidates(job_id)
+    if top_ids:
+        score_top_candidates(job_id, top_ids, llm_functions)
+    return written
+
+
+def rank_job_candidates(job_id) -> Tuple[int, List[str]]:
+    """
+    Store the local skill-overlap score of every eligible candidate for a job.
+
+    Every candidate sharing at least one required skill is scored by an
+    indexed aggregate over the skill tables, read in chunks with a pause
+    between chunks. The job's rankings are then replaced in a single
+    transaction, so readers see either the old or the new rankings.
+
+    Args:
+        job_id: JobPosting primary key
+
+    Returns:
+        Tuple: Number of ranking rows written, and the ids of the top
+        MATCH_PRECOMPUTE_LLM_TOP_N candidates by local score, best first
+    """
+    job = JobPosting.objects.get(id=job_id)
+    chunk_size = settings.MATCH_PRECOMPUTE_CHUNK_SIZE
+    top_n = settings.MATCH_PRECOMPUTE_LLM_TOP_N
+
+    # The skill links are normally written by a post_save receiver, but
+    # that may run after this task is scheduled (receivers run in app
+    # order, and on_commit fires at once in autocommit) or not at all for
+    # bulk writes; syncing here makes the overlap counts below reliable
+    sync_job_skills(job)
+    required = normalize_skills(job.required_skills)
+
+    scores = []
+    top = []
+    if required:
+        overlaps = candidate_skill_overlaps(job).iterator(chunk_size=chunk_size)
+        for candidate_id, matched in overlaps:
+            score = round(100.0 * matched / len(required), 2)
+            scores.append((candidate_id, score))
+            if top_n > 0:
+                entry = (score, str(candidate_id))
+                if len(top) < top_n:
+                    heapq.heappush(top, entry)
+                elif entry > top[0]:
+                    heapq.heapreplace(top, entry)
+            if len(scores) % chunk_size == 0:
+                time.sleep(settings.MATCH_PRECOMPUTE_CHUNK_PAUSE)
+
+    with transaction.atomic():
+        JobCandidateRanking.objects.filter(job=job).delete()
+        for start in range(0, len(scores), chunk_size):
+            JobCandidateRanking.objects.bulk_create([
+                JobCandidateRanking(job=job, candidate_id=candidate_id, local_score=score)
+                for candidate_id, score in scores[start:start + chunk_size]
+            ])
+    return len(scores), [candidate_id for _, candidate_id in sorted(top, reverse=True)]
+
+
+def score_top_candidates(job_id, candidate_ids, llm_functions=None) -> None:
+    """
+    Store LLM match scores for ranked candidates of a job.
+
+    Stored matches whose inputs are unchanged are reused; failed LLM calls
+    leave the candidate with its local score only.
+
+    Args:
+        job_id: JobPosting primary key
+        candidate_ids (List[str]): Candidates to score
+        llm_functions (GroqLLMFunctions, optional): LLM client to use
+    """
+    job = JobPosting.objects.get(id=job_id)
+    top_candidates = CandidateProfile.objects.filter(id__in=candidate_ids)
+    existing = {str(m.candidate_id): m for m in JobMatch.objects.filter(job=job, candidate_id__in=candidate_ids)}
+    llm_scores = {}
+    pending = []
+    job_data = build_job_data(job)
+    for candidate in top_candidates:
+        job_match = existing.get(str(candidate.id))
+        if job_match and job_match.input_fingerprint == match_fingerprint(build_candidate_data(candidate), job_data):
+            llm_scores[str(candidate.id)] = job_match.match_score
+        else:
+            pending.append((candidate, job))
+
+    if pending:
+        llm_functions = llm_functions or GroqLLMFunctions()
+        to_create, to_update = [], []
+        for candidate, _, fingerprint, match_result in score_pairs(
+            pending, llm_functions, settings.MATCH_PRECOMPUTE_LLM_CONCURRENCY
+        ):
+            if match_result is None:
+                continue
+            job_match = existing.get(str(candidate.id))
+            if job_match:
+                to_update.append(apply_match_result(job_match, match_result, fingerprint))
+            else:
+                job_match = apply_match_result(JobMatch(candidate=candidate, job=job), match_result, fingerprint)
+                to_create.append(job_match)
+            llm_scores[str(candidate.id)] = job_match.match_score
+        save_job_matches(to_create, to_update)
+
+    ranked = list(JobCandidateRanking.objects.filter(job=job, candidate_id__in=llm_scores.keys()))
+    for ranking in ranked:
+        ranking.llm_score = llm_scores[str(ranking.candidate_id)]
+    JobCandidateRanking.objects.bulk_update(ranked, ['llm_score'])
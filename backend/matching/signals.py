@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from core.caching import register_cache_invalidation
+from jobs.models import JobPosting
+from .models import JobMatch
+from .services import schedule_job_precompute
+
+register_cache_invalidation(JobMatch)
+
+
+@receiver(post_save, sender=JobPosting)
+def precompute_rankings_for_new_job(sender, instance, created, **kwargs):
+    """Schedule candidate ranking for newly posted jobs once the insert commits."""
+    if created and settings.MATCH_PRECOMPUTE_ENABLED:
+        transaction.on_commit(lambda: schedule_job_precompute(instance.id))
@@ -1,3 +1,592 @@
-from django.test import TestCase
+import csv
+import json
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from .exports import CANDIDATE_EXPORT_COLUMNS, MATCH_EXPORT_COLUMNS
+from .models import JobMatch, JobCandidateRanking
+from .services import build_candidate_data, build_job_data, match_fingerprint, precompute_job_rankings
+
+
+class JobMatchListQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=cls.user)
+        for i in range(15):
+            user = User.objects.create(username=f'candidate{i}')
+            candidate = CandidateProfile.objects.create(user=user, name=f'Candidate {i}', parsed_skills=['python'])
+            job = JobPosting.objects.create(
+                title=f'Job {i}', company='Acme', description='A long description ' * 50,
+                required_skills=['python']
+            )
+            JobMatch.objects.create(
+                candidate=candidate, job=job, match_score=50 + i,
+                missing_skills=[], match_summary='Good fit', cover_letter='Dear hiring manager ' * 50
+            )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_list_page_query_count(self):
+        # Token lookup and page rows; cursor pagination issues no COUNT(*)
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/matches/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_list_uses_slim_representation(self):
+        response = self.client.get('/api/matches/')
+        row = response.data['results'][0]
+        self.assertNotIn('cover_letter', row)
+        self.assertNotIsInstance(row['candidate'], dict)
+        self.assertEqual(row['job_company'], 'Acme')
+
+    def test_sparse_fieldset(self):
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/matches/', {'fields': 'id,match_score'})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'match_score'})
+
+    def test_conditional_get_skips_queries(self):
+        response = self.client.get('/api/matches/')
+        etag = response['ETag']
+        # Token and page are both answered from the cache
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/matches/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        JobMatch.objects.first().save()
+        response = self.client.get('/api/matches/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_cursor_pagination_walks_all_rows(self):
+        seen = []
+        response = self.client.get('/api/matches/', {'page_size': 4})
+        while True:
+            self.assertNotIn('count', response.data)
+            seen.extend(row['id'] for row in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+        self.assertEqual(len(seen), 15)
+        self.assertEqual(len(set(seen)), 15)
+
+
+@override_settings(MATCH_PRECOMPUTE_ENABLED=True, MATCH_PRECOMPUTE_LLM_TOP_N=0, MATCH_PRECOMPUTE_CHUNK_PAUSE=0)
+class JobPrecomputeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.python_dev = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python', 'Django'])
+        cls.go_dev = CandidateProfile.objects.create(name='Bob', parsed_skills=['Go'])
+        CandidateProfile.objects.create(name='Cy', parsed_skills=['Excel'])
+
+    def rankings(self, job):
+        return dict(JobCandidateRanking.objects.filter(job=job).values_list('candidate__name', 'local_score'))
+
+    def test_precompute_before_skill_links_are_synced(self):
+        # As in autocommit: on_commit runs the task at once, from the
+        # matching receiver, before the skills receiver has linked the job
+        with mock.patch('matching.signals.transaction.on_commit', side_effect=lambda callback: callback()), \
+                mock.patch('matching.signals.schedule_job_precompute', side_effect=precompute_job_rankings):
+            job = JobPosting.objects.create(
+                title='Backend', company='Acme', description='...', required_skills=['python', 'django', 'go']
+            )
+        self.assertEqual(self.rankings(job), {'Ann': 66.67, 'Bob': 33.33})
+
+    def test_precompute_job_written_without_signals(self):
+        (job,) = JobPosting.objects.bulk_create([
+            JobPosting(title='Gopher', company='Acme', description='...', required_skills=['Go'])
+        ])
+        self.assertEqual(precompute_job_rankings(job.id), 1)
+        self.assertEqual(self.rankings(job), {'Bob': 100.0})
+
+    def test_failed_rerun_keeps_previous_rankings(self):
+        job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python', 'go'])
+        precompute_job_rankings(job.id)
+        create = JobCandidateRanking.objects.bulk_create
+        calls = []
+
+        def fail_second_chunk(rows, *args, **kwargs):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise DatabaseError('disk full')
+            return create(rows, *args, **kwargs)
+
+        with override_settings(MATCH_PRECOMPUTE_CHUNK_SIZE=1), \
+                mock.patch.object(JobCandidateRanking.objects, 'bulk_create', side_effect=fail_second_chunk):
+            with self.assertRaises(DatabaseError):
+                precompute_job_rankings(job.id)
+        self.assertEqual(self.rankings(job), {'Ann': 50.0, 'Bob': 50.0})
+
+    @override_settings(MATCH_PRECOMPUTE_LLM_TOP_N=1)
+    def test_llm_scores_top_candidates_only(self):
+        job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python', 'django', 'go'])
+        llm = FakeMatchLLM()
+        precompute_job_rankings(job.id, llm)
+        self.assertEqual(llm.calls, ['Backend'])
+        self.assertEqual(
+            dict(JobCandidateRanking.objects.filter(job=job).values_list('candidate__name', 'llm_score')),
+            {'Ann': 70, 'Bob': None}
+        )
+        self.assertTrue(JobMatch.objects.filter(job=job, candidate=self.python_dev, match_score=70).exists())
+
+        # Unchanged inputs reuse the stored match
+        precompute_job_rankings(job.id, llm)
+        self.assertEqual(llm.calls, ['Backend'])
+
+    @override_settings(MATCH_PRECOMPUTE_LLM_TOP_N=2)
+    def test_failed_llm_call_keeps_local_score(self):
+        job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python', 'go'])
+        precompute_job_rankings(job.id, FakeMatchLLM(fail_titles=['Backend']))
+        self.assertEqual(
+            list(JobCandidateRanking.objects.filter(job=job).values_list('llm_score', flat=True)), [None, None]
+        )
+        self.assertFalse(JobMatch.objects.filter(job=job).exists())
+
+
+class QueuedExecutor:
+    """Stand-in for the precompute pool: tasks queue FIFO and run on `drain`."""
+
+    def __init__(self):
+        self.queue = []
+
+    def submit(self, fn, *args):
+        self.queue.append((fn, args))
+
+    def drain(self):
+        while self.queue:
+            fn, args = self.queue.pop(0)
+            fn(*args)
+
+
+@override_settings(
+    MATCH_PRECOMPUTE_ENABLED=True, MATCH_PRECOMPUTE_LLM_TOP_N=3,
+    MATCH_PRECOMPUTE_LLM_CONCURRENCY=1, MATCH_PRECOMPUTE_CHUNK_PAUSE=0
+)
+class JobPrecomputeSchedulingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in ('Ann', 'Bob', 'Cy'):
+            CandidateProfile.objects.create(name=name, parsed_skills=['Python', 'Go'])
+
+    def setUp(self):
+        self.executor = QueuedExecutor()
+        self.llm = FakeMatchLLM()
+        for target, kwargs in (
+            ('matching.services.precompute_executor', {'new': self.executor}),
+            ('matching.services.GroqLLMFunctions', {'side_effect': lambda: self.llm}),
+            ('matching.services.close_old_connections', {}),
+        ):
+            patcher = mock.patch(target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def post_job(self, title, **fields):
+        with self.captureOnCommitCallbacks(execute=True):
+            return JobPosting.objects.create(
+                title=title, company='Acme', description='...', required_skills=['python', 'go'], **fields
+            )
+
+    def test_new_job_is_ranked_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python', 'go'])
+        self.assertEqual(self.executor.queue, [])
+        for callback in callbacks:
+            callback()
+        self.executor.drain()
+        self.assertEqual(JobCandidateRanking.objects.filter(job=job).count(), 3)
+        self.assertEqual(JobCandidateRanking.objects.filter(job=job, llm_score=70).count(), 3)
+
+    def test_updates_are_not_ranked(self):
+        job = self.post_job('Backend')
+        self.executor.queue.clear()
+        with self.captureOnCommitCallbacks(execute=True):
+            job.title = 'Platform'
+            job.save()
+        self.assertEqual(self.executor.queue, [])
+
+    @override_settings(MATCH_PRECOMPUTE_ENABLED=False)
+    def test_disabled(self):
+        self.post_job('Backend')
+        self.assertEqual(self.executor.queue, [])
+
+    def test_jobs_take_turns_for_llm_scoring(self):
+        first = self.post_job('First')
+        second = self.post_job('Second')
+        self.executor.drain()
+        # One LLM call per queued slice: the second job is ranked and scored
+        # alongside the first instead of after all of its calls
+        self.assertEqual(self.llm.calls, ['First', 'Second', 'First', 'Second', 'First', 'Second'])
+        for job in (first, second):
+            self.assertEqual(JobCandidateRanking.objects.filter(job=job, llm_score=70).count(), 3)
+
+
+class FakeMatchLLM:
+    """Stand-in for GroqLLMFunctions: scores by job title, failing for `fail_titles`."""
+
+    def __init__(self, fail_titles=()):
+        self.fail_titles = set(fail_titles)
+        self.calls = []
+
+    def match_candidate_to_job(self, candidate_data, job_data):
+        self.calls.append(job_data['title'])
+        if job_data['title'] in self.fail_titles:
+            raise RuntimeError("Groq API call failed")
+        return {'match_score': 70, 'missing_skills': ['go'], 'summary': f"Fit for {job_data['title']}"}
+
+
+class BulkMatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.candidate = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python'])
+        cls.jobs = [
+            JobPosting.objects.create(title=title, company='Acme', description='...', required_skills=['python', 'go'])
+            for title in ('Stored', 'Stale', 'New', 'Broken')
+        ]
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        stored, stale = self.jobs[0], self.jobs[1]
+        JobMatch.objects.create(
+            candidate=self.candidate, job=stored, match_score=88, missing_skills=[], match_summary='Stored fit',
+            input_fingerprint=match_fingerprint(build_candidate_data(self.candidate), build_job_data(stored))
+        )
+        JobMatch.objects.create(
+            candidate=self.candidate, job=stale, match_score=10, missing_skills=[], match_summary='Old fit',
+            input_fingerprint='computed-from-older-data'
+        )
+        # Patched for the whole test: streamed responses build the client
+        # while they are consumed
+        self.llm = FakeMatchLLM()
+        patcher = mock.patch('matching.views.GroqLLMFunctions', side_effect=lambda: self.llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def bulk(self, llm, jobs):
+        self.llm = llm
+        data = {'candidate_ids': [str(self.candidate.id)], 'job_ids': [str(job.id) for job in jobs]}
+        response = self.client.post('/api/matches/bulk/', data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        return response
+
+    def lines(self, response):
+        return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+
+    def stored(self, job):
+        return JobMatch.objects.filter(candidate=self.candidate, job=job).first()
+
+    def test_cached_and_new_results(self):
+        llm = FakeMatchLLM()
+        lines = {line['job_id']: line for line in self.lines(self.bulk(llm, self.jobs[:3]))}
+        stored, stale, new = self.jobs[:3]
+
+        self.assertEqual(sorted(llm.calls), ['New', 'Stale'])
+        self.assertEqual(lines[str(stored.id)]['match_score'], 88)
+        self.assertIs(lines[str(stored.id)]['cached'], True)
+        self.assertEqual(lines[str(stale.id)]['match_score'], 70)
+        self.assertIs(lines[str(stale.id)]['cached'], False)
+        self.assertIs(lines[str(new.id)]['cached'], False)
+
+        # The stale match is updated, the new one created, both reusable
+        for job in (stale, new):
+            job_match = self.stored(job)
+            self.assertEqual(job_match.match_score, 70)
+            self.assertEqual(job_match.input_fingerprint, match_fingerprint(build_candidate_data(self.candidate), build_job_data(job)))
+        self.assertEqual(self.lines(self.bulk(FakeMatchLLM(), self.jobs[:3]))[0]['cached'], True)
+
+    def test_failed_pair_is_reported_and_not_stored(self):
+        llm = FakeMatchLLM(fail_titles={'Broken'})
+        broken = self.jobs[3]
+        lines = self.lines(self.bulk(llm, [broken]))
+
+        self.assertEqual(lines, [{'candidate_id': str(self.candidate.id), 'job_id': str(broken.id), 'error': 'Matching failed'}])
+        self.assertIsNone(self.stored(broken))
+
+        # Retried on the next request
+        lines = self.lines(self.bulk(FakeMatchLLM(), [broken]))
+        self.assertEqual(lines[0]['match_score'], 70)
+        self.assertIsNotNone(self.stored(broken))
+
+    def test_results_streamed_before_close_are_saved(self):
+        new, broken = self.jobs[2], self.jobs[3]
+        response = self.bulk(FakeMatchLLM(), [new, broken])
+        first = json.loads(next(iter(response.streaming_content)))
+        response.close()
+
+        self.assertEqual(JobMatch.objects.filter(job__in=[new, broken]).count(), 1)
+        self.assertEqual(str(self.stored(new if first['job_id'] == str(new.id) else broken).job_id), first['job_id'])
+
+    def test_single_match_failure_is_not_stored(self):
+        broken = self.jobs[3]
+        data = {'candidate_id': str(self.candidate.id), 'job_id': str(broken.id)}
+        self.llm = FakeMatchLLM(fail_titles={'Broken'})
+        response = self.client.post('/api/matches/match_candidate_to_job/', data, format='json')
+        self.assertEqual(response.status_code, 500)
+        self.assertIsNone(self.stored(broken))
+
+
+class PrescoreTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.candidate = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python', 'JS'])
+        cls.stored, cls.stale, cls.partial, cls.unrelated = [
+            JobPosting.objects.create(title=title, company='Acme', description='...', required_skills=skills)
+            for title, skills in (
+                ('Stored', ['python', 'go']),
+                ('Stale', ['python', 'go']),
+                ('Partial', ['python', 'javascript', 'rust']),
+                ('Unrelated', ['cobol']),
+            )
+        ]
+        JobPosting.objects.create(
+            title='Closed', company='Acme', description='...', required_skills=['python'],
+            closing_date=datetime(2020, 1, 1, tzinfo=dt_timezone.utc)
+        )
+        JobMatch.objects.create(
+            candidate=cls.candidate, job=cls.stored, match_score=40, missing_skills=['go'], match_summary='Stored fit',
+            input_fingerprint=match_fingerprint(build_candidate_data(cls.candidate), build_job_data(cls.stored))
+        )
+        JobMatch.objects.create(
+            candidate=cls.candidate, job=cls.stale, match_score=95, missing_skills=[], match_summary='Old fit',
+            input_fingerprint='computed-from-older-data'
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def prescores(self, **params):
+        return self.client.get('/api/matches/prescores/', params)
+
+    def test_scores_open_jobs(self):
+        response = self.prescores(candidate_id=str(self.candidate.id))
+        self.assertEqual(response.status_code, 200)
+        rows = response.data['results']
+        self.assertEqual([row['title'] for row in rows], ['Stored', 'Partial', 'Stale', 'Unrelated'])
+
+        stored, partial, stale, unrelated = rows
+        self.assertEqual(
+            (stored['match_score'], stored['missing_skills'], stored['summary'], stored['local_score']),
+            (40, ['go'], 'Stored fit', 50.0)
+        )
+        self.assertEqual((partial['local_score'], partial['local_missing_skills']), (66.67, ['rust']))
+        # A match computed from older data is not reported
+        self.assertEqual(
+            (stale['match_score'], stale['missing_skills'], stale['summary'], stale['local_score']),
+            (None, None, None, 50.0)
+        )
+        self.assertEqual((unrelated['local_score'], unrelated['local_missing_skills']), (0.0, ['cobol']))
+
+    def test_limit(self):
+        response = self.prescores(candidate_id=str(self.candidate.id), limit=2)
+        self.assertEqual([row['title'] for row in response.data['results']], ['Stored', 'Partial'])
+        self.assertEqual(len(self.prescores(candidate_id=str(self.candidate.id), limit=0).data['results']), 1)
+        self.assertEqual(self.prescores(candidate_id=str(self.candidate.id), limit='all').status_code, 400)
+
+    def test_invalid_candidate(self):
+        self.assertEqual(self.prescores().status_code, 400)
+        self.assertEqual(self.prescores(candidate_id='not-a-uuid').status_code, 400)
+        response = self.prescores(candidate_id='00000000-0000-0000-0000-000000000000')
+        self.assertEqual(response.status_code, 404)
+
+
+class FakeCoverLetterLLM:
+    """Stand-in for GroqLLMFunctions writing cover letters, optionally failing after `fail_after` pieces."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.calls = 0
+
+    def generate_cover_letter(self, candidate_data, job_data):
+        self.calls += 1
+        return f"Dear Acme, {candidate_data['name']} would love to join."
+
+    def stream_cover_letter(self, candidate_data, job_data):
+        self.calls += 1
+        for i, part in enumerate(['Dear Acme, ', f"{candidate_data['name']} ", 'would love to join.']):
+            if i == self.fail_after:
+                raise RuntimeError("Groq API call failed")
+            yield part
+
+
+class CoverLetterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.candidate = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python'])
+        job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python'])
+        cls.job_match = JobMatch.objects.create(
+            candidate=cls.candidate, job=job, match_score=80, missing_skills=[], match_summary='Good fit'
+        )
+        cls.url = f'/api/matches/{cls.job_match.id}/cover_letter/'
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.llm = FakeCoverLetterLLM()
+        patcher = mock.patch('matching.views.GroqLLMFunctions', side_effect=lambda: self.llm)
+        self.llm_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def stored(self):
+        return JobMatch.objects.get(id=self.job_match.id).cover_letter
+
+    def test_get_does_not_generate(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.llm_class.assert_not_called()
+        self.assertIsNone(self.stored())
+
+    def test_post_generates_once_and_get_reads_it(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'cover_letter': 'Dear Acme, Ann would love to join.', 'cached': False})
+        self.assertEqual(self.stored(), 'Dear Acme, Ann would love to join.')
+
+        self.assertTrue(self.client.post(self.url).data['cached'])
+        self.assertEqual(self.llm.calls, 1)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['cover_letter'], 'Dear Acme, Ann would love to join.')
+        self.assertFalse(response.data['stale'])
+
+        CandidateProfile.objects.filter(id=self.candidate.id).update(name='Ann Lee')
+        self.assertTrue(self.client.get(self.url).data['stale'])
+        self.assertEqual(self.llm.calls, 1)
+
+    def test_streamed_letter_is_stored(self):
+        response = self.client.post(f'{self.url}?stream=true')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content).decode(), 'Dear Acme, Ann would love to join.')
+        self.assertEqual(self.stored(), 'Dear Acme, Ann would love to join.')
+
+    def test_stream_failing_at_once_returns_error_status(self):
+        self.llm = FakeCoverLetterLLM(fail_after=0)
+        response = self.client.post(f'{self.url}?stream=true')
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.json(), {'error': 'Groq API call failed'})
+        self.assertIsNone(self.stored())
+
+    def test_stream_failing_part_way_ends_with_error_marker(self):
+        from .views import COVER_LETTER_STREAM_ERROR
+
+        self.llm = FakeCoverLetterLLM(fail_after=2)
+        response = self.client.post(f'{self.url}?stream=true')
+        self.assertEqual(response.status_code, 200)
+        body = b''.join(response.streaming_content).decode()
+        self.assertEqual(body, 'Dear Acme, Ann ' + COVER_LETTER_STREAM_ERROR)
+        self.assertIsNone(self.stored())
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        staff = User.objects.create_user('admin', 'admin@example.com', 'password', is_staff=True)
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.staff_token = Token.objects.create(user=staff)
+        cls.user_token = Token.objects.create(user=user)
+        cls.ann = CandidateProfile.objects.create(
+            name='Ann', email='ann@example.com', phone='555-0100', parsed_skills=['Python', 'Django']
+        )
+        cls.bob = CandidateProfile.objects.create(name='Bob', email='bob@example.com', parsed_skills=['Go'])
+        cls.job = JobPosting.objects.create(title='Backend', company='Acme', description='...', required_skills=['python'])
+        cls.strong = JobMatch.objects.create(
+            candidate=cls.ann, job=cls.job, match_score=90, missing_skills=['go'], match_summary='Strong'
+        )
+        cls.weak = JobMatch.objects.create(
+            candidate=cls.bob, job=cls.job, match_score=40, missing_skills=['python'], match_summary='Weak'
+        )
+        JobMatch.objects.filter(id=cls.weak.id).update(created_at=datetime(2020, 1, 1, 12, tzinfo=dt_timezone.utc))
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.staff_token.key}')
+
+    def export(self, path, **params):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def jsonl(self, path, **params):
+        return [json.loads(line) for line in self.export(path, **params).splitlines()]
+
+    def test_exports_are_staff_only(self):
+        for path in ('/api/matches/export/', '/api/candidates/export/'):
+            self.client.credentials()
+            self.assertEqual(self.client.get(path).status_code, 401)
+            self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.user_token.key}')
+            self.assertEqual(self.client.get(path).status_code, 403)
+
+    def test_match_export_jsonl(self):
+        rows = self.jsonl('/api/matches/export/')
+        self.assertEqual([row['match_summary'] for row in rows], ['Weak', 'Strong'])
+        self.assertEqual(list(rows[1]), MATCH_EXPORT_COLUMNS)
+        self.assertEqual(rows[1]['candidate_name'], 'Ann')
+        self.assertEqual(rows[1]['missing_skills'], ['go'])
+
+    def test_match_export_csv(self):
+        response = self.client.get('/api/matches/export/', {'file_format': 'csv', 'min_score': 50})
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="matches.csv"')
+        rows = list(csv.reader(b''.join(response.streaming_content).decode('utf-8').splitlines()))
+        self.assertEqual(rows[0], MATCH_EXPORT_COLUMNS)
+        self.assertEqual(len(rows), 2)
+        row = dict(zip(rows[0], rows[1]))
+        self.assertEqual(row['match_summary'], 'Strong')
+        self.assertEqual(json.loads(row['missing_skills']), ['go'])
+
+    def test_match_export_filters(self):
+        def summaries(**params):
+            return [row['match_summary'] for row in self.jsonl('/api/matches/export/', **params)]
+
+        self.assertEqual(summaries(max_score=50), ['Weak'])
+        self.assertEqual(summaries(candidate_id=self.ann.id), ['Strong'])
+        self.assertEqual(summaries(job_id=self.job.id, min_score=40, max_score=90), ['Weak', 'Strong'])
+        self.assertEqual(summaries(created_before='2020-01-01'), ['Weak'])
+        self.assertEqual(summaries(created_after='2020-01-02'), ['Strong'])
+
+    def test_invalid_filters(self):
+        for params in ({'file_format': 'xml'}, {'min_score': 'high'}, {'job_id': 'abc'}, {'created_after': 'May'}):
+            response = self.client.get('/api/matches/export/', params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertIn('error', response.data)
+
+    def test_candidate_export(self):
+        rows = self.jsonl('/api/candidates/export/')
+        self.assertEqual([row['name'] for row in rows], ['Ann', 'Bob'])
+        self.assertEqual(list(rows[0]), CANDIDATE_EXPORT_COLUMNS)
+        self.assertEqual(rows[0]['email'], 'ann@example.com')
+
+        self.assertEqual([row['name'] for row in self.jsonl('/api/candidates/export/', skills='django')], ['Ann'])
+        self.assertEqual([row['name'] for row in self.jsonl('/api/candidates/export/', max_score=50)], ['Bob'])
+        lines = self.export('/api/candidates/export/', file_format='csv', job_id=self.job.id, min_score=80).splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[1].split(',')[1], 'Ann')
@@ -1,17 +1,61 @@
+import logging
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
-from .models import JobMatch
-from .serializers import JobMatchSerializer
+from .models import JobMatch, JobCandidateRanking
+from .serializers import JobMatchSerializer, JobMatchListSerializer, JobCandidateRankingSerializer
+from .services import (
+    build_candidate_data, build_job_data, match_fingerprint,
+    score_pairs, apply_match_result, save_job_matches, candidate_prescores,
+    build_cover_letter_data, save_cover_letter
+)
 from candidates.models import CandidateProfile
 from jobs.models import JobPosting
 from utils.llm_functions import GroqLLMFunctions
+from core.caching import CachedResponseMixin
+from core.admission import LLMRateThrottle, llm_admission
+from core.renderers import dumps
+from core.export import export_format, export_response
+from .exports import MATCH_EXPORT_COLUMNS, parse_export_filters, match_export_rows
 
-class JobMatchViewSet(viewsets.ModelViewSet):
+logger = logging.getLogger(__name__)
+
+# Ends a streamed cover letter whose generation failed part way
+COVER_LETTER_STREAM_ERROR = "\n\n[Cover letter generation failed; the letter above is incomplete.]\n"
+
+class JobMatchViewSet(CachedResponseMixin, viewsets.ModelViewSet):
     queryset = JobMatch.objects.all()
     serializer_class = JobMatchSerializer
+    cache_dependencies = (CandidateProfile, JobPosting)
+    pagination_ordering = ('-created_at', '-id')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            return (
+                queryset.select_related('candidate', 'job')
+                .only(*JobMatchListSerializer.list_only_fields)
+            )
+        return queryset.select_related('candidate__user', 'job')
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return JobMatchListSerializer
+        return super().get_serializer_class()
 
-    @action(detail=False, methods=['POST'])
+    def get_throttles(self):
+        # Only generating a cover letter calls the LLM; reading one does not
+        if self.action == 'generate_cover_letter':
+            return [LLMRateThrottle()]
+        return super().get_throttles()
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
     def match_candidate_to_job(self, request):
         candidate_id = request.data.get('candidate_id')
         job_id = request.data.get('job_id')
@@ -27,24 +71,13 @@ class JobMatchViewSet(viewsets.ModelViewSet):
             job = JobPosting.objects.get(id=job_id)
 
             # Prepare data for matching
-            candidate_data = {
-                'skills': candidate.parsed_skills,
-                'education': candidate.parsed_education,
-                'work_experience': candidate.parsed_work_experience
-            }
-            job_data = {
-                'title': job.title,
-                'company': job.company,
-                'required_skills': job.required_skills
-            }
-
-            # Use Groq LLM for matching
+            candidate_data = build_candidate_data(candidate)
+            job_data = build_job_data(job)
+
+            # Use Groq LLM for matching; cover letters are generated on demand
             llm_functions = GroqLLMFunctions()
             match_result = llm_functions.match_candidate_to_job(candidate_data, job_data)
 
-            # Generate cover letter
-            cover_letter = llm_functions.generate_cover_letter(candidate_data, job_data)
-
             # Create or update job match
             job_match, created = JobMatch.objects.get_or_create(
                 candidate=candidate,
@@ -53,7 +86,7 @@ class JobMatchViewSet(viewsets.ModelViewSet):
                     'match_score': match_result.get('match_score', 0),
                     'missing_skills': match_result.get('missing_skills', []),
                     'match_summary': match_result.get('summary', ''),
-                    'cover_letter': cover_letter
+                    'input_fingerprint': match_fingerprint(candidate_data, job_data)
                 }
             )
 
@@ -69,4 +102,269 @@ class JobMatchViewSet(viewsets.ModelViewSet):
         except JobPosting.DoesNotExist:
             return Response({"error": f"Job with id {job_id} not found."}, status=status.HTTP_404_NOT_FOUND)
         except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @action(detail=True, methods=['GET'])
+    def cover_letter(self, request, pk=None):
+        """
+        Stored cover letter for this match; POST to generate one.
+
+        `stale` is true when the candidate or job data changed since the
+        letter was written.
+        """
+        job_match = self.get_object()
+        if not job_match.cover_letter:
+            return Response(
+                {"error": "No cover letter has been generated for this match."}, status=status.HTTP_404_NOT_FOUND
+            )
+        fingerprint = match_fingerprint(*build_cover_letter_data(job_match))
+        return Response({
+            "cover_letter": job_match.cover_letter,
+            "cached": True,
+            "stale": job_match.cover_letter_fingerprint != fingerprint
+        }, status=status.HTTP_200_OK)
+
+    @cover_letter.mapping.post
+    @llm_admission
+    def generate_cover_letter(self, request, pk=None):
+        """
+        Generate the cover letter for this match and store it.
+
+        A stored letter is returned as is until the candidate or job data
+        it was written from changes. Pass `stream=true` to receive the
+        letter as plain text while it is being generated; if generation
+        fails part way, the stream ends with COVER_LETTER_STREAM_ERROR and
+        nothing is stored.
+        """
+        job_match = self.get_object()
+        candidate_data, job_data = build_cover_letter_data(job_match)
+        fingerprint = match_fingerprint(candidate_data, job_data)
+        stream = request.query_params.get('stream', '').lower() in ('1', 'true', 'yes')
+
+        if job_match.cover_letter and job_match.cover_letter_fingerprint == fingerprint:
+            if stream:
+                return StreamingHttpResponse(iter([job_match.cover_letter]), content_type='text/plain; charset=utf-8')
+            return Response({"cover_letter": job_match.cover_letter, "cached": True}, status=status.HTTP_200_OK)
+
+        try:
+            llm_functions = GroqLLMFunctions()
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        if stream:
+            # The status line is only sent once the first piece arrived, so
+            # a request that fails outright still gets an error status
+            parts = llm_functions.stream_cover_letter(candidate_data, job_data)
+            try:
+                first = next(parts, '')
+            except Exception as e:
+                logger.exception(f"Streaming cover letter for match {job_match.id} failed")
+                return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+            def generate():
+                text = [first]
+                yield first
+                try:
+                    for part in parts:
+                        text.append(part)
+                        yield part
+                except Exception:
+                    # A partial letter is not stored; the next request starts over
+                    logger.exception(f"Streaming cover letter for match {job_match.id} failed")
+                    yield COVER_LETTER_STREAM_ERROR
+                    return
+                save_cover_letter(job_match, ''.join(text).strip(), fingerprint)
+
+            return StreamingHttpResponse(generate(), content_type='text/plain; charset=utf-8')
+
+        try:
+            cover_letter = llm_functions.generate_cover_letter(candidate_data, job_data)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        save_cover_letter(job_match, cover_letter, fingerprint)
+        return Response({"cover_letter": cover_letter, "cached": False}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['POST'], throttle_classes=[LLMRateThrottle])
+    @llm_admission
+    def bulk(self, request):
+        """
+        Match every candidate in `candidate_ids` against every job in `job_ids`.
+
+        Pairs with a stored result computed from the current inputs are
+        returned as-is; the rest are scored concurrently and streamed back
+        as newline-delimited JSON in completion order. A pair that could not
+        be scored gets a line with an `error` instead of a score.
+        """
+        candidate_ids = request.data.get('candidate_ids')
+        job_ids = request.data.get('job_ids')
+
+        if not isinstance(candidate_ids, list) or not isinstance(job_ids, list) or not candidate_ids or not job_ids:
+            return Response(
+                {"error": "candidate_ids and job_ids must be non-empty lists."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        candidate_ids = list(dict.fromkeys(str(candidate_id) for candidate_id in candidate_ids))
+        job_ids = list(dict.fromkeys(str(job_id) for job_id in job_ids))
+
+        if len(candidate_ids) * len(job_ids) > settings.MATCH_BULK_MAX_PAIRS:
+            return Response(
+                {"error": f"At most {settings.MATCH_BULK_MAX_PAIRS} candidate/job pairs can be matched per request."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            candidates = {str(c.id): c for c in CandidateProfile.objects.filter(id__in=candidate_ids)}
+            jobs = {str(j.id): j for j in JobPosting.objects.filter(id__in=job_ids)}
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        missing_candidates = [c for c in candidate_ids if c not in candidates]
+        missing_jobs = [j for j in job_ids if j not in jobs]
+        if missing_candidates or missing_jobs:
+            return Response(
+                {
+                    "error": "Some candidates or jobs were not found.",
+                    "missing_candidate_ids": missing_candidates,
+                    "missing_job_ids": missing_jobs
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        existing = {
+            (str(m.candidate_id), str(m.job_id)): m
+            for m in JobMatch.objects.filter(candidate_id__in=candidates.keys(), job_id__in=jobs.keys())
+        }
+
+        def stream():
+            pending = []
+            for candidate_id in candidate_ids:
+                for job_id in job_ids:
+                    candidate, job = candidates[candidate_id], jobs[job_id]
+                    job_match = existing.get((candidate_id, job_id))
+                    fingerprint = match_fingerprint(build_candidate_data(candidate), build_job_data(job))
+                    if job_match and job_match.input_fingerprint == fingerprint:
+                        yield self._bulk_line(job_match, cached=True)
+                    else:
+                        pending.append((candidate, job))
+
+            if not pending:
+                return
+
+            to_create, to_update = [], []
+            try:
+                llm_functions = GroqLLMFunctions()
+                for candidate, job, fingerprint, match_result in score_pairs(
+                    pending, llm_functions, settings.MATCH_BULK_CONCURRENCY
+                ):
+                    if match_result is None:
+                        # Reported, but not stored, so the pair is retried next time
+                        yield dumps({
+                            "candidate_id": str(candidate.id),
+                            "job_id": str(job.id),
+                            "error": "Matching failed"
+                        }) + b"\n"
+                        continue
+                    job_match = existing.get((str(candidate.id), str(job.id)))
+                    if job_match:
+                        to_update.append(apply_match_result(job_match, match_result, fingerprint))
+                    else:
+                        job_match = apply_match_result(JobMatch(candidate=candidate, job=job), match_result, fingerprint)
+                        to_create.append(job_match)
+                    yield self._bulk_line(job_match, cached=False)
+            except Exception as e:
+                logger.exception("Error during bulk matching")
+                yield dumps({"error": str(e)}) + b"\n"
+            finally:
+                save_job_matches(to_create, to_update)
+
+        return StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+
+    @action(detail=False, methods=['GET'])
+    def rankings(self, request):
+        """
+        Return the precomputed candidate ranking for `job_id`, best first.
+
+        LLM-scored candidates come first, ordered by LLM score; the rest
+        follow ordered by local score.
+        """
+        job_id = request.query_params.get('job_id')
+        if not job_id:
+            return Response({"error": "job_id is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+        except ValueError:
+            return Response({"error": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            rankings = list(
+                JobCandidateRanking.objects.filter(job_id=job_id)
+                .select_related('candidate')
+                .order_by(F('llm_score').desc(nulls_last=True), '-local_score')[:limit]
+            )
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = JobCandidateRankingSerializer(rankings, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['GET'])
+    def prescores(self, request):
+        """
+        Score `candidate_id` against every open job instantly, without the LLM.
+
+        Each job has its local skill-overlap score and locally computed
+        missing skills, plus the stored LLM match if it is still valid.
+        Best first, at most `limit` jobs (default 500).
+        """
+        candidate_id = request.query_params.get('candidate_id')
+        if not candidate_id:
+            return Response({"error": "candidate_id is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 500)), settings.MATCH_PRESCORE_MAX_JOBS))
+        except ValueError:
+            return Response({"error": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            candidate = CandidateProfile.objects.get(id=candidate_id)
+        except CandidateProfile.DoesNotExist:
+            return Response({"error": f"Candidate with id {candidate_id} not found."}, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        open_jobs = (
+            JobPosting.objects.filter(Q(closing_date__isnull=True) | Q(closing_date__gt=timezone.now()))
+            .only('id', 'title', 'company', 'location', 'required_skills')
+        )
+        rows = candidate_prescores(candidate, open_jobs.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE))
+        return Response({"results": rows[:limit]}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['GET'], permission_classes=[IsAdminUser])
+    def export(self, request):
+        """
+        Stream every matching job match as a JSONL (default) or CSV download:
+        `?file_format=csv&job_id=...&min_score=70&created_after=2024-01-01`.
+        Staff only, like the candidate export.
+        """
+        try:
+            file_format = export_format(request.query_params.get('file_format'))
+            filters = parse_export_filters(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = match_export_rows(filters, settings.EXPORT_CHUNK_SIZE)
+        return export_response(rows, MATCH_EXPORT_COLUMNS, file_format, 'matches')
+
+    @staticmethod
+    def _bulk_line(job_match, cached):
+        return dumps({
+            "candidate_id": str(job_match.candidate_id),
+            "job_id": str(job_match.job_id),
+            "match_score": job_match.match_score,
+            "missing_skills": job_match.missing_skills,
+            "summary": job_match.match_summary,
+            "cached": cached
+        }) + b"\n"
@@ -0,0 +1,6 @@
+from django.contrib import admin
+from .models import Skill, CandidateSkill, JobSkill
+
+admin.site.register(Skill)
+admin.site.register(CandidateSkill)
+admin.site.register(JobSkill)
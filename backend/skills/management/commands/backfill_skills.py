@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from skills.services import sync_candidate_skills, sync_job_skills
+
+
+class Command(BaseCommand):
+    help = "Populate the normalized skill tables from parsed_skills and required_skills"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+
+        candidates = CandidateProfile.objects.only('id', 'parsed_skills')
+        count = 0
+        for candidate in candidates.iterator(chunk_size=chunk_size):
+            sync_candidate_skills(candidate)
+            count += 1
+        self.stdout.write(f"Synced skills for {count} candidates")
+
+        jobs = JobPosting.objects.only('id', 'required_skills')
+        count = 0
+        for job in jobs.iterator(chunk_size=chunk_size):
+            sync_job_skills(job)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Synced skills for {count} job postings"))
@@ -0,0 +1,42 @@
+from django.db import models
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from utils.scoring import MAX_SKILL_LENGTH
+
+
+class Skill(models.Model):
+    """Normalized skill name shared by candidates and job postings"""
+    name = models.CharField(max_length=MAX_SKILL_LENGTH, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class CandidateSkill(models.Model):
+    """Skill listed in a candidate's parsed resume"""
+    candidate = models.ForeignKey(CandidateProfile, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='candidate_links')
+
+    class Meta:
+        unique_together = ('candidate', 'skill')
+        indexes = [
+            models.Index(fields=['skill', 'candidate'], name='skills_candidate_by_skill'),
+        ]
+
+    def __str__(self):
+        return f"{self.candidate} - {self.skill}"
+
+
+class JobSkill(models.Model):
+    """Skill required by a job posting"""
+    job = models.ForeignKey(JobPosting, on_delete=models.CASCADE, related_name='skill_links')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='job_links')
+
+    class Meta:
+        unique_together = ('job', 'skill')
+        indexes = [
+            models.Index(fields=['skill', 'job'], name='skills_job_by_skill'),
+        ]
+
+    def __str__(self):
+        return f"{self.job} - {self.skill}"
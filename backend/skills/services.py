@@ -0,0 +1,111 @@
+from typing import Any, Dict, Iterable, List, Set
+
+from django.db.models import Count
+
+from utils.scoring import normalize_skills
+from .models import Skill, CandidateSkill, JobSkill
+
+
+def parse_skill_filter(value: str) -> Set[str]:
+    """
+    Parse a `?skills=python,django` query parameter into normalized names.
+    """
+    if not value:
+        return set()
+    return normalize_skills(value.split(','))
+
+
+def get_or_create_skills(names: Iterable[str]) -> Dict[str, int]:
+    """
+    Ensure a Skill row exists for every normalized name.
+
+    Args:
+        names (Iterable[str]): Normalized skill names
+
+    Returns:
+        Dict[str, int]: Skill id by name
+    """
+    names = set(names)
+    if not names:
+        return {}
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    return dict(Skill.objects.filter(name__in=names).values_list('name', 'id'))
+
+
+def _sync_links(link_model, owner_field: str, owner_id, skills: Any) -> None:
+    skill_ids = get_or_create_skills(normalize_skills(skills))
+    wanted = set(skill_ids.values())
+    links = link_model.objects.filter(**{owner_field: owner_id})
+    current = set(links.values_list('skill_id', flat=True))
+
+    if current - wanted:
+        links.filter(skill_id__in=current - wanted).delete()
+    if wanted - current:
+        link_model.objects.bulk_create(
+            [link_model(**{owner_field: owner_id, 'skill_id': skill_id}) for skill_id in wanted - current],
+            ignore_conflicts=True
+        )
+
+
+def sync_candidate_skills(candidate) -> None:
+    """Mirror a candidate's parsed_skills into CandidateSkill rows."""
+    _sync_links(CandidateSkill, 'candidate_id', candidate.id, candidate.parsed_skills)
+
+
+def sync_job_skills(job) -> None:
+    """Mirror a job's required_skills into JobSkill rows."""
+    _sync_links(JobSkill, 'job_id', job.id, job.required_skills)
+
+
+def _having_all_skills(link_model, owner_field: str, names: Set[str]):
+    return (
+        link_model.objects.filter(skill__name__in=names)
+        .values(owner_field)
+        .annotate(matched=Count('skill', distinct=True))
+        .filter(matched=len(names))
+        .values(owner_field)
+    )
+
+
+def filter_candidates_by_skills(queryset, names: Set[str]):
+    """Restrict a CandidateProfile queryset to candidates with every skill in `names`."""
+    if not names:
+        return queryset
+    return queryset.filter(id__in=_having_all_skills(CandidateSkill, 'candidate', names))
+
+
+def filter_jobs_by_skills(queryset, names: Set[str]):
+    """Restrict a JobPosting queryset to jobs requiring every skill in `names`."""
+    if not names:
+        return queryset
+    return queryset.filter(id__in=_having_all_skills(JobSkill, 'job', names))
+
+
+def candidate_skill_overlaps(job):
+    """
+    Count, per candidate, how many of a job's required skills they have.
+
+    Candidates without any overlapping skill are not returned.
+
+    Returns:
+        QuerySet: (candidate_id, matched) tuples
+    """
+    return (
+        CandidateSkill.objects.filter(skill__job_links__job=job)
+        .values_list('candidate_id')
+        .annotate(matched=Count('skill', distinct=True))
+        .order_by()
+    )
+
+
+def job_skill_coverage(job) -> List[Dict[str, Any]]:
+    """
+    Number of candidates having each skill a job requires, most common first.
+    """
+    rows = (
+        Skill.objects.filter(job_links__job=job)
+        .annotate(candidates=Count('candidate_links', distinct=True))
+        .order_by('-candidates', 'name')
+        .values('name', 'candidates')
+    )
+    return [{'skill': row['name'], 'candidates': row['candidates']} for row in rows]
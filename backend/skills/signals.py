@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from .services import sync_candidate_skills, sync_job_skills
+
+
+@receiver(post_save, sender=CandidateProfile)
+def sync_candidate_skill_links(sender, instance, **kwargs):
+    sync_candidate_skills(instance)
+
+
+@receiver(post_save, sender=JobPosting)
+def sync_job_skill_links(sender, instance, **kwargs):
+    sync_job_skills(instance)
@@ -0,0 +1,141 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from candidates.models import CandidateProfile
+from jobs.models import JobPosting
+from utils.scoring import MAX_SKILL_LENGTH, local_match_score, normalize_skill, normalize_skills
+from .models import CandidateSkill, JobSkill, Skill
+
+
+class NormalizeSkillTests(SimpleTestCase):
+    def test_case_and_whitespace(self):
+        self.assertEqual(normalize_skill('  Machine\tLearning '), 'machine learning')
+
+    def test_aliases(self):
+        self.assertEqual(normalize_skill('JS'), 'javascript')
+        self.assertEqual(normalize_skill('Golang'), 'go')
+        self.assertEqual(normalize_skill('React.js'), 'react')
+        self.assertEqual(normalize_skill('Postgres'), 'postgresql')
+
+    def test_dict_entries(self):
+        self.assertEqual(normalize_skill({'name': 'Python', 'level': 'expert'}), 'python')
+        self.assertEqual(normalize_skill({'skill': 'SQL'}), 'sql')
+
+    def test_unusable_entries(self):
+        for value in (None, 3, {}, '   ', 'x' * (MAX_SKILL_LENGTH + 1)):
+            with self.subTest(value=value):
+                self.assertEqual(normalize_skill(value), '')
+        self.assertEqual(normalize_skill('x' * MAX_SKILL_LENGTH), 'x' * MAX_SKILL_LENGTH)
+
+    def test_normalize_skills(self):
+        self.assertEqual(normalize_skills(['Python', 'python ', 'PY', None, 'Django']), {'python', 'django'})
+        self.assertEqual(normalize_skills('Python'), {'python'})
+        self.assertEqual(normalize_skills(None), set())
+
+    def test_local_match_score(self):
+        self.assertEqual(local_match_score(['Python', 'JS'], ['python', 'javascript', 'go']), 66.67)
+        self.assertEqual(local_match_score({'python', 'go'}, normalize_skills(['Golang', 'Py'])), 100.0)
+        self.assertEqual(local_match_score(['Python'], []), 0.0)
+        self.assertEqual(local_match_score(None, ['python']), 0.0)
+
+
+class SkillSyncTests(TestCase):
+    def skill_names(self, link_model, **owner):
+        return set(link_model.objects.filter(**owner).values_list('skill__name', flat=True))
+
+    def test_candidate_links_follow_parsed_skills(self):
+        candidate = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python', 'JS', 'python'])
+        self.assertEqual(self.skill_names(CandidateSkill, candidate=candidate), {'python', 'javascript'})
+
+        candidate.parsed_skills = ['Python', 'Go']
+        candidate.save()
+        self.assertEqual(self.skill_names(CandidateSkill, candidate=candidate), {'python', 'go'})
+
+    def test_job_links_follow_required_skills(self):
+        job = JobPosting.objects.create(title='Dev', company='Acme', description='...', required_skills=['K8s'])
+        self.assertEqual(self.skill_names(JobSkill, job=job), {'kubernetes'})
+
+        job.required_skills = None
+        job.save()
+        self.assertEqual(self.skill_names(JobSkill, job=job), set())
+
+    def test_skills_shared_between_owners(self):
+        CandidateProfile.objects.create(name='Ann', parsed_skills=['Python'])
+        JobPosting.objects.create(title='Dev', company='Acme', description='...', required_skills=['PYTHON'])
+        self.assertEqual(Skill.objects.filter(name='python').count(), 1)
+
+    def test_overlong_skill_is_skipped(self):
+        candidate = CandidateProfile.objects.create(
+            name='Ann', parsed_skills=['Python', 'Led a team of ' + 'many ' * 60 + 'engineers']
+        )
+        self.assertEqual(self.skill_names(CandidateSkill, candidate=candidate), {'python'})
+
+
+class SkillFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user('recruiter', 'recruiter@example.com', 'password')
+        cls.token = Token.objects.create(user=user)
+        cls.ann = CandidateProfile.objects.create(name='Ann', parsed_skills=['Python', 'Django'])
+        cls.bob = CandidateProfile.objects.create(name='Bob', parsed_skills=['Python'])
+        cls.cy = CandidateProfile.objects.create(name='Cy', parsed_skills=['Go'])
+        cls.backend = JobPosting.objects.create(
+            title='Backend', company='Acme', description='...', required_skills=['Python', 'Django']
+        )
+        cls.platform = JobPosting.objects.create(
+            title='Platform', company='Acme', description='...', required_skills=['Golang']
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def ids(self, path, skills):
+        response = self.client.get(path, {'skills': skills})
+        self.assertEqual(response.status_code, 200)
+        return {str(row['id']) for row in response.data['results']}
+
+    def test_candidates_need_every_skill(self):
+        self.assertEqual(self.ids('/api/candidates/', 'python'), {str(self.ann.id), str(self.bob.id)})
+        self.assertEqual(self.ids('/api/candidates/', 'Python, DJANGO'), {str(self.ann.id)})
+        self.assertEqual(self.ids('/api/candidates/', 'python,rust'), set())
+
+    def test_jobs_filter_resolves_aliases(self):
+        self.assertEqual(self.ids('/api/jobs/', 'go'), {str(self.platform.id)})
+        self.assertEqual(self.ids('/api/jobs/', 'django,py'), {str(self.backend.id)})
+
+    def test_empty_filter_lists_everything(self):
+        self.assertEqual(len(self.ids('/api/candidates/', '')), 3)
+
+
+class BackfillSkillsCommandTests(TestCase):
+    def test_backfill_links_rows_written_without_signals(self):
+        (candidate,) = CandidateProfile.objects.bulk_create([CandidateProfile(name='Ann', parsed_skills=['Python'])])
+        (job,) = JobPosting.objects.bulk_create([
+            JobPosting(title='Dev', company='Acme', description='...', required_skills=['python', 'SQL'])
+        ])
+        self.assertFalse(CandidateSkill.objects.exists())
+
+        out = StringIO()
+        call_command('backfill_skills', chunk_size=1, stdout=out)
+
+        self.assertIn('1 candidates', out.getvalue())
+        self.assertIn('1 job postings', out.getvalue())
+        self.assertEqual(
+            set(CandidateSkill.objects.filter(candidate=candidate).values_list('skill__name', flat=True)), {'python'}
+        )
+        self.assertEqual(set(JobSkill.objects.filter(job=job).values_list('skill__name', flat=True)), {'python', 'sql'})
+
+    def test_backfill_is_idempotent(self):
+        CandidateProfile.objects.create(name='Ann', parsed_skills=['Python'])
+        call_command('backfill_skills', stdout=StringIO())
+        call_command('backfill_skills', stdout=StringIO())
+        self.assertEqual(CandidateSkill.objects.count(), 1)
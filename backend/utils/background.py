@@ -0,0 +1,42 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundExecutor:
+    """
+    Small in-process worker pool for work that should not block a request.
+
+    The pool is created lazily and sized once, so a burst of scheduled
+    tasks queues behind a fixed number of workers instead of spawning a
+    thread per task.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = 'background'):
+        self.max_workers = max(1, max_workers)
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Schedule `fn(*args, **kwargs)` on the pool, logging any exception it raises.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=self.thread_name_prefix
+                )
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    @staticmethod
+    def _log_failure(future: Future) -> None:
+        exception = future.exception()
+        if exception is not None:
+            logger.error("Background task failed", exc_info=exception)
@@ -0,0 +1,166 @@
+import hashlib
+import io
+import mmap
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+_DIGEST = re.compile(r'^[0-9a-f]{64}$')
+CHUNK_SIZE = 64 * 1024
+
+
+class MappedFile(io.RawIOBase):
+    """
+    Read-only, seekable file object over a memory map.
+
+    `mmap.mmap` already has read/seek/tell, but not the full io interface
+    (e.g. `seekable()`), which zipfile-based readers such as python-docx need.
+    """
+
+    def __init__(self, buffer: mmap.mmap):
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        data = self._buffer[self._position:self._position + len(b)]
+        b[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+
+class BlobStore:
+    """
+    Content-addressed file store.
+
+    Blobs are keyed by the SHA-256 of their content and stored under
+    sharded directories (`ab/cd/abcd...`), so identical uploads are kept
+    once and no directory grows unboundedly.
+    """
+
+    def __init__(self, root: str):
+        self.root = str(root)
+
+    @staticmethod
+    def _validate(digest: str) -> str:
+        if not isinstance(digest, str) or not _DIGEST.match(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return digest
+
+    def path(self, digest: str) -> str:
+        """
+        Filesystem path of a blob.
+
+        Args:
+            digest (str): SHA-256 hex digest
+
+        Returns:
+            str: Path under the sharded directory layout
+        """
+        digest = self._validate(digest)
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def exists(self, digest: str) -> bool:
+        return os.path.exists(self.path(digest))
+
+    def put_chunks(self, chunks: Iterable[bytes], digest: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Store a blob from an iterable of byte chunks.
+
+        The content is streamed to a temporary file while being hashed and
+        then atomically renamed into place. If the blob already exists the
+        temporary copy is discarded. When `digest` is given (already
+        computed by the caller) and the blob exists, the chunks are not
+        read at all.
+
+        Args:
+            chunks (Iterable[bytes]): Blob content
+            digest (str, optional): Known SHA-256 of the content
+
+        Returns:
+            Tuple[str, int]: SHA-256 hex digest and size in bytes
+        """
+        if digest is not None and self.exists(digest):
+            return digest, os.path.getsize(self.path(digest))
+
+        tmp_dir = os.path.join(self.root, 'tmp')
+        os.makedirs(tmp_dir, exist_ok=True)
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=tmp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    tmp.write(chunk)
+                    size += len(chunk)
+            actual = hasher.hexdigest()
+            if digest is not None and digest != actual:
+                raise ValueError(f"Blob content does not match digest {digest}")
+
+            final_path = self.path(actual)
+            if os.path.exists(final_path):
+                os.remove(tmp_path)
+            else:
+                os.makedirs(os.path.dirname(final_path), exist_ok=True)
+                os.replace(tmp_path, final_path)
+            return actual, size
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def put_file(self, fileobj: BinaryIO, digest: Optional[str] = None) -> Tuple[str, int]:
+        """
+        Store a blob from a binary file object (see `put_chunks`).
+        """
+        return self.put_chunks(iter(lambda: fileobj.read(CHUNK_SIZE), b''), digest=digest)
+
+    @contextmanager
+    def open(self, digest: str) -> Iterator[BinaryIO]:
+        """
+        Open a blob for reading through a read-only memory map.
+
+        Yields:
+            BinaryIO: Seekable file object over the mapped blob
+
+        Raises:
+            FileNotFoundError: If the blob does not exist
+        """
+        with open(self.path(digest), 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                # Zero-length files cannot be memory-mapped
+                yield io.BytesIO(b'')
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield MappedFile(mapped)
+
+    def delete(self, digest: str) -> None:
+        try:
+            os.remove(self.path(digest))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,96 @@
+import codecs
+from typing import Dict, Tuple
+
+ZIP_SIGNATURE = b'PK\x03\x04'
+OLE_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# Leading bytes each resume file type may start with. PDF readers accept
+# the header anywhere in the first kilobyte, so PDFs are checked there.
+SIGNATURES: Dict[str, Tuple[bytes, ...]] = {
+    '.pdf': (b'%PDF-',),
+    '.docx': (ZIP_SIGNATURE,),
+    '.doc': (ZIP_SIGNATURE, OLE_SIGNATURE),
+}
+TEXT_TYPES = ('.txt',)
+SUPPORTED_TYPES = tuple(SIGNATURES) + TEXT_TYPES
+
+HEAD_SIZE = 1024
+
+
+class FileTypeMismatch(ValueError):
+    pass
+
+
+class FileSniffer:
+    """
+    Incrementally check that a file's content matches its declared type,
+    chunk by chunk as it arrives, so a mismatch is caught from the first
+    kilobyte instead of after the whole file has been received.
+
+    Binary types are recognized by their magic bytes. Text files must be
+    valid UTF-8 without NUL bytes throughout.
+
+    Example:
+        sniffer = FileSniffer('.pdf')
+        for chunk in chunks:
+            sniffer.update(chunk)  # raises FileTypeMismatch
+        sniffer.finish()
+    """
+
+    def __init__(self, file_type: str):
+        if file_type not in SUPPORTED_TYPES:
+            raise FileTypeMismatch(
+                f"Unsupported file type {file_type or '(none)'!r} (expected one of {', '.join(SUPPORTED_TYPES)})"
+            )
+        self.file_type = file_type
+        self._head = b''
+        self._verified = False
+        self._decoder = codecs.getincrementaldecoder('utf-8')() if file_type in TEXT_TYPES else None
+
+    def update(self, chunk: bytes) -> None:
+        """
+        Raises:
+            FileTypeMismatch: As soon as the content cannot be of the declared type
+        """
+        if self._decoder is not None:
+            if b'\x00' in chunk:
+                raise FileTypeMismatch("File is not a text file")
+            try:
+                self._decoder.decode(chunk)
+            except UnicodeDecodeError:
+                raise FileTypeMismatch("Text file is not valid UTF-8")
+            return
+
+        if not self._verified:
+            self._head = (self._head + chunk)[:HEAD_SIZE]
+            self._check_head(final=False)
+
+    def finish(self) -> None:
+        """
+        Raises:
+            FileTypeMismatch: If the complete content is not of the declared type
+        """
+        if self._decoder is not None:
+            try:
+                self._decoder.decode(b'', final=True)
+            except UnicodeDecodeError:
+                raise FileTypeMismatch("Text file is not valid UTF-8")
+        elif not self._verified:
+            self._check_head(final=True)
+
+    def _check_head(self, final: bool) -> None:
+        head = self._head
+        if self.file_type == '.pdf':
+            if b'%PDF-' in head:
+                self._verified = True
+            elif final or len(head) >= HEAD_SIZE:
+                raise FileTypeMismatch("File content is not a PDF")
+            return
+
+        signatures = SIGNATURES[self.file_type]
+        longest = max(len(signature) for signature in signatures)
+        if any(head.startswith(signature) for signature in signatures):
+            self._verified = True
+        elif final or len(head) >= longest:
+            raise FileTypeMismatch(f"File content is not a {self.file_type.lstrip('.').upper()} document")
+
@@ -1,17 +1,27 @@
 import os
 import json
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List
 
-from groq import Groq
-from dotenv import load_dotenv
+from utils.llm_schemas import JOB_POSTING_SCHEMA, MATCH_SCHEMA, RESUME_SCHEMA, Schema
+from utils.metrics import stage, record_llm_usage
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
+
+@lru_cache(maxsize=4)
+def _groq_client(api_key: str):
+    """
+    Groq client for an API key, shared by every GroqLLMFunctions instance
+    so its HTTP connection pool is reused across requests.
+
+    groq is imported here, on first use, because importing it takes
+    longer than the rest of the backend's startup.
+    """
+    from groq import Groq
+
+    return Groq(api_key=api_key)
 
 class GroqLLMFunctions:
     def __init__(self, api_key: str = None):
@@ -26,7 +36,7 @@ class GroqLLMFunctions:
         if not self.api_key:
             raise ValueError("Groq API key is required. Set GROQ_API_KEY in .env file.")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = _groq_client(self.api_key)
         self.model = "llama-3.1-8b-instant"  # Default model
 
     def _call_groq_api(
@@ -45,16 +55,99 @@ class GroqLLMFunctions:
             str: API response content
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                response_format=response_format or {"type": "text"}
-            )
+            with stage('llm'):
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format=response_format or {"type": "text"}
+                )
+            record_llm_usage(self.model, getattr(response, 'usage', None))
             return response.choices[0].message.content
         except Exception as e:
             logger.error(f"Groq API call failed: {e}")
             raise
 
+    def _stream_groq_api(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """
+        Call Groq API with a streamed text response.
+        
+        Args:
+            messages (List[Dict]): Conversation messages
+        
+        Yields:
+            str: Pieces of the response content as they arrive
+        """
+        try:
+            # Time to the start of the stream; the rest is spent by the consumer
+            with stage('llm_stream_start'):
+                stream = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True
+                )
+            for chunk in stream:
+                # Groq reports usage on the final chunk
+                x_groq = getattr(chunk, 'x_groq', None)
+                record_llm_usage(self.model, getattr(x_groq, 'usage', None))
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if content:
+                    yield content
+        except Exception as e:
+            logger.error(f"Groq API streaming call failed: {e}")
+            raise
+
+    def _call_structured(self, messages: List[Dict[str, str]], schema: Schema) -> Dict[str, Any]:
+        """
+        Call Groq API for a JSON response and validate it against a schema.
+        
+        Malformed or truncated JSON is repaired locally and fields are
+        coerced to their types. Only when that fails (or a required field
+        is missing) is the model re-asked, once, to correct its own answer;
+        the re-ask sends just that answer, not the original document.
+        
+        Args:
+            messages (List[Dict]): Conversation messages
+            schema (Schema): Expected response shape
+        
+        Returns:
+            Dict: Validated response, with every schema field present
+        
+        Raises:
+            ValueError: If the response is still unusable after the re-ask
+        """
+        result = self._call_groq_api(messages, response_format={"type": "json_object"})
+        data, problems = schema.parse(result)
+        if not problems:
+            return data
+
+        logger.warning(f"Invalid structured response ({'; '.join(problems)}), asking for a correction")
+        with stage('llm_reask'):
+            result = self._call_groq_api(
+                self._correction_messages(result, schema, problems),
+                response_format={"type": "json_object"}
+            )
+        data, problems = schema.parse(result)
+        if problems:
+            raise ValueError(f"Invalid structured response: {'; '.join(problems)}")
+        return data
+
+    @staticmethod
+    def _correction_messages(result: str, schema: Schema, problems: List[str]) -> List[Dict[str, str]]:
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You fix JSON documents. Return only a JSON object with exactly these keys:\n"
+                    f"{schema.describe()}\n"
+                    "Keep every value from the document that fits; use null or [] when a value is unknown."
+                )
+            },
+            {
+                "role": "user",
+                "content": f"Problems: {'; '.join(problems)}\n\nDocument:\n{result[:8000]}"
+            }
+        ]
+
     def parse_resume(self, resume_text: str) -> Dict[str, Any]:
         """
         Parse resume text into structured JSON.
@@ -86,21 +179,10 @@ class GroqLLMFunctions:
         ]
 
         try:
-            result = self._call_groq_api(
-                messages, 
-                response_format={"type": "json_object"}
-            )
-            return json.loads(result)
+            return self._call_structured(messages, RESUME_SCHEMA)
         except Exception as e:
             logger.error(f"Resume parsing failed: {e}")
-            return {
-                "name": None,
-                "email": None,
-                "phone": None,
-                "skills": [],
-                "education": [],
-                "work_experience": []
-            }
+            return RESUME_SCHEMA.defaults()
 
     def parse_job_posting(self, job_text: str) -> Dict[str, Any]:
         """
@@ -133,21 +215,10 @@ class GroqLLMFunctions:
         ]
 
         try:
-            result = self._call_groq_api(
-                messages, 
-                response_format={"type": "json_object"}
-            )
-            return json.loads(result)
+            return self._call_structured(messages, JOB_POSTING_SCHEMA)
         except Exception as e:
             logger.error(f"Job posting parsing failed: {e}")
-            return {
-                "title": None,
-                "company": None,
-                "location": None,
-                "required_skills": [],
-                "responsibilities": [],
-                "qualifications": []
-            }
+            return JOB_POSTING_SCHEMA.defaults()
 
     def match_candidate_to_job(
         self,
@@ -163,6 +234,11 @@ class GroqLLMFunctions:
 
         Returns:
             Dict: Matching results with score, missing skills, etc.
+
+        Raises:
+            Exception: If the API call fails or no valid score comes back;
+            unlike parsing, there is no meaningful default to fall back to
+            and a made-up score must not be stored as a real one
         """
         messages = [
             {
@@ -190,15 +266,68 @@ class GroqLLMFunctions:
         ]
 
         try:
-            result = self._call_groq_api(
-                messages,
-                response_format={"type": "json_object"}
-            )
-            return json.loads(result)
+            return self._call_structured(messages, MATCH_SCHEMA)
         except Exception as e:
             logger.error(f"Job matching failed: {e}")
-            return {
-                "match_score": 0,
-                "missing_skills": [],
-                "summary": "Unable to perform match analysis"
-            }
\ No newline at end of file
+            raise
+
+    def _cover_letter_messages(
+        self,
+        candidate_data: Dict[str, Any],
+        job_data: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
+        return [
+            {
+                "role": "system",
+                "content": """
+                    You are an expert career coach. Write a concise, professional cover letter
+                    for the candidate applying to the job. Highlight the candidate's relevant
+                    skills and experience, do not invent qualifications, and keep it under
+                    350 words. Return only the letter text.
+                    """
+            },
+            {
+                "role": "user",
+                "content": f"""
+                    Candidate Profile:
+                    {json.dumps(candidate_data, indent=2)}
+
+                    Job Posting:
+                    {json.dumps(job_data, indent=2)}
+                    """
+            }
+        ]
+
+    def generate_cover_letter(
+        self,
+        candidate_data: Dict[str, Any],
+        job_data: Dict[str, Any]
+    ) -> str:
+        """
+        Generate a cover letter for a candidate applying to a job.
+
+        Args:
+            candidate_data (Dict): Candidate's profile data
+            job_data (Dict): Job posting data
+
+        Returns:
+            str: Cover letter text
+        """
+        return self._call_groq_api(self._cover_letter_messages(candidate_data, job_data)).strip()
+
+    def stream_cover_letter(
+        self,
+        candidate_data: Dict[str, Any],
+        job_data: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Generate a cover letter, yielding the text as it is produced.
+
+        Args:
+            candidate_data (Dict): Candidate's profile data
+            job_data (Dict): Job posting data
+
+        Yields:
+            str: Pieces of the cover letter text
+        """
+        yield from self._stream_groq_api(self._cover_letter_messages(candidate_data, job_data))
@@ -0,0 +1,332 @@
+import copy
+import json
+import math
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# JSON repair
+
+_FENCE = re.compile(r'```(?:json)?\s*(.*?)(?:```|$)', re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+# Any run of letters, including non-ASCII ones (str.isalpha() starts a word)
+_WORD = re.compile(r'[^\W\d_]+')
+_PYTHON_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null'}
+_CLOSERS = {'{': '}', '[': ']'}
+MAX_TRUNCATION_RETRIES = 20
+
+
+def _scan(text: str) -> Tuple[str, bool, List[str], List[int]]:
+    """
+    Walk JSON-ish text outside of strings: replace Python literals
+    (True/False/None) and track what is still open at the end.
+
+    Returns:
+        Tuple[str, bool, List[str], List[int]]: The rewritten text, whether
+        it ends inside a string, the stack of open brackets, and the
+        positions of commas outside strings (in the rewritten text)
+    """
+    out = []
+    size = 0
+    stack = []
+    commas = []
+    in_string = escaped = False
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+            out.append(char)
+            size += 1
+            i += 1
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+        elif char in '}]':
+            if stack and _CLOSERS[stack[-1]] == char:
+                stack.pop()
+        elif char == ',':
+            commas.append(size)
+        elif char.isalpha():
+            word = _WORD.match(text, i).group(0)
+            i += len(word)
+            word = _PYTHON_LITERALS.get(word, word)
+            out.append(word)
+            size += len(word)
+            continue
+        out.append(char)
+        size += 1
+        i += 1
+    return ''.join(out), in_string, stack, commas
+
+
+def _close(text: str) -> str:
+    """
+    Terminate a truncated JSON document: close an open string, drop a
+    dangling comma or key separator, then close open arrays and objects.
+    """
+    text, in_string, stack, _ = _scan(text)
+    if in_string:
+        if text.endswith('\\'):
+            text = text[:-1]
+        text += '"'
+    text = text.rstrip()
+    if text.endswith(','):
+        text = text[:-1]
+    elif text.endswith(':'):
+        text += ' null'
+    return text + ''.join(_CLOSERS[bracket] for bracket in reversed(stack))
+
+
+def repair_json(text: str) -> Any:
+    """
+    Parse the JSON in an LLM response, repairing common defects locally.
+
+    Handles Markdown code fences and prose around the JSON, trailing
+    commas, Python literals (True/False/None) and output truncated
+    mid-document (arrays and objects are closed; a trailing member that
+    cannot be completed is dropped).
+
+    Args:
+        text (str): Raw model output
+
+    Returns:
+        Any: The decoded JSON value
+
+    Raises:
+        ValueError: If no JSON document can be recovered
+    """
+    if not isinstance(text, str):
+        raise ValueError(f"Expected text, got {type(text).__name__}")
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+
+    fenced = _FENCE.search(text)
+    candidate = fenced.group(1) if fenced else text
+    starts = [index for index in (candidate.find('{'), candidate.find('[')) if index >= 0]
+    if not starts:
+        raise ValueError("No JSON object found in the response")
+    candidate = candidate[min(starts):].strip()
+
+    # Almost-valid JSON, possibly followed by prose
+    rewritten, _, stack, _ = _scan(candidate)
+    if not stack:
+        end = max(rewritten.rfind('}'), rewritten.rfind(']'))
+        try:
+            return json.loads(_TRAILING_COMMA.sub(r'\1', rewritten[:end + 1]))
+        except ValueError:
+            pass
+
+    # Truncated JSON: close it, cutting back one member at a time if the
+    # last one cannot be completed. A string cut short is dropped rather
+    # than kept half-written, unless it is the only member.
+    candidate, in_string, _, commas = _scan(candidate)
+    if in_string and commas:
+        candidate = candidate[:commas[-1]]
+    for _ in range(MAX_TRUNCATION_RETRIES):
+        try:
+            return json.loads(_TRAILING_COMMA.sub(r'\1', _close(candidate)))
+        except ValueError:
+            pass
+        candidate, _, _, commas = _scan(candidate)
+        if not commas:
+            break
+        candidate = candidate[:commas[-1]]
+    raise ValueError("Response is not valid JSON and could not be repaired")
+
+
+# Field coercion
+
+_EMAIL = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+_LIST_SEPARATORS = re.compile(r'[,;\n]')
+
+
+def as_text(value: Any) -> Optional[str]:
+    """First non-empty string in `value` (lists are searched in order), or None."""
+    if isinstance(value, list):
+        return next((text for text in map(as_text, value) if text), None)
+    if isinstance(value, bool) or value is None or isinstance(value, dict):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def as_email(value: Any) -> Optional[str]:
+    """First email address found in `value` (a string or list), or None."""
+    if isinstance(value, list):
+        return next((email for email in map(as_email, value) if email), None)
+    text = as_text(value)
+    match = _EMAIL.search(text) if text else None
+    return match.group(0) if match else None
+
+
+def as_string_list(value: Any) -> List[str]:
+    """
+    List of distinct non-empty strings. A single string is split on
+    commas, semicolons and newlines; objects contribute their `name`.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        items = _LIST_SEPARATORS.split(value)
+    elif isinstance(value, list):
+        items = value
+    else:
+        items = [value]
+
+    strings = []
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get('name') or item.get('skill')
+        text = as_text(item)
+        if text and text not in strings:
+            strings.append(text)
+    return strings
+
+
+def as_list(value: Any) -> List[Any]:
+    """`value` as a list of non-empty items (a single item is wrapped)."""
+    if value is None or value == '':
+        return []
+    items = value if isinstance(value, list) else [value]
+    return [item for item in items if item not in (None, '', {}, [])]
+
+
+def as_score(value: Any) -> Optional[int]:
+    """
+    Integer score clamped to 0-100. Strings such as "85", "85%" or
+    "85/100" give their first number; fractions below 1 (e.g. 0.85) are
+    read as percentages. None if no number can be found.
+    """
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        match = _NUMBER.search(str(value))
+        if not match:
+            return None
+        number = float(match.group(0))
+    if not math.isfinite(number):
+        return None
+    if 0 < number < 1:
+        number *= 100
+    return int(min(100, max(0, round(number))))
+
+
+class Field(NamedTuple):
+    coerce: Callable[[Any], Any]
+    default: Any
+    description: str
+
+
+def _normalize_key(key: str) -> str:
+    key = re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', str(key))
+    return re.sub(r'[^a-z0-9]+', '_', key.lower()).strip('_')
+
+
+class Schema:
+    """
+    Expected shape of a JSON response from the LLM.
+
+    Each field has a coercion function that turns whatever the model
+    returned into the expected type (or None when it cannot), and a
+    default for absent or unusable values. A response is only unusable
+    when one of the `required` fields is missing.
+
+    Example:
+        schema = Schema({'score': Field(as_score, None, 'integer 0-100')}, required=('score',))
+        data, problems = schema.validate({'Score': '85%'})  # {'score': 85}, []
+    """
+
+    def __init__(self, fields: Dict[str, Field], required: Tuple[str, ...] = ()):
+        self.fields = fields
+        self.required = required
+
+    def validate(self, data: Any) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Coerce a decoded response to the schema.
+
+        Keys are matched case- and style-insensitively ("matchScore",
+        "Match Score" and "match_score" are the same field), and a
+        response wrapped in a single top-level object is unwrapped.
+
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Every schema field with its
+            coerced value or default, and a list of problems (empty if
+            the response is usable)
+        """
+        if isinstance(data, list) and len(data) == 1:
+            data = data[0]
+        if not isinstance(data, dict):
+            return self.defaults(), [f"Expected a JSON object, got {type(data).__name__}"]
+
+        values = {_normalize_key(key): value for key, value in data.items()}
+        if not values.keys() & self.fields.keys() and len(values) == 1:
+            (inner,) = values.values()
+            if isinstance(inner, dict):
+                values = {_normalize_key(key): value for key, value in inner.items()}
+
+        result, problems = {}, []
+        for name, field in self.fields.items():
+            value = field.coerce(values.get(name))
+            if value is None or value == []:
+                if name in self.required:
+                    problems.append(f"Missing or invalid {name!r} ({field.description})")
+                value = copy.deepcopy(field.default)
+            result[name] = value
+        return result, problems
+
+    def defaults(self) -> Dict[str, Any]:
+        return {name: copy.deepcopy(field.default) for name, field in self.fields.items()}
+
+    def describe(self) -> str:
+        """The fields as a bullet list, for prompts."""
+        return '\n'.join(f'- "{name}": {field.description}' for name, field in self.fields.items())
+
+    def parse(self, text: str) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Repair, decode and validate a raw response (see repair_json and validate).
+        """
+        try:
+            data = repair_json(text)
+        except ValueError as e:
+            return self.defaults(), [str(e)]
+        return self.validate(data)
+
+
+RESUME_SCHEMA = Schema({
+    'name': Field(as_text, None, "string, full name of the candidate"),
+    'email': Field(as_email, None, "string, email address"),
+    'phone': Field(as_text, None, "string, phone number"),
+    'skills': Field(as_string_list, [], "list of strings, professional skills"),
+    'education': Field(as_list, [], "list of educational qualifications"),
+    'work_experience': Field(as_list, [], "list of work experiences"),
+})
+
+JOB_POSTING_SCHEMA = Schema({
+    'title': Field(as_text, None, "string, job title"),
+    'company': Field(as_text, None, "string, company name"),
+    'location': Field(as_text, None, "string, job location"),
+    'required_skills': Field(as_string_list, [], "list of strings, required skills"),
+    'responsibilities': Field(as_list, [], "list of key responsibilities"),
+    'qualifications': Field(as_list, [], "list of required qualifications"),
+}, required=('title',))
+
+MATCH_SCHEMA = Schema({
+    'match_score': Field(as_score, 0, "integer from 0 to 100"),
+    'missing_skills': Field(as_string_list, [], "list of strings"),
+    'summary': Field(as_text, '', "string"),
+}, required=('match_score',))
@@ -0,0 +1,200 @@
+import contextvars
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class Summary:
+    """
+    Running count and sum of observations, plus a window of the most
+    recent ones from which quantiles are computed on demand.
+    """
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.samples.append(value)
+
+    def quantiles(self) -> Dict[float, float]:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {q: 0.0 for q in QUANTILES}
+        # Nearest-rank percentiles
+        return {q: ordered[max(0, math.ceil(q * len(ordered)) - 1)] for q in QUANTILES}
+
+
+class MetricsRegistry:
+    """
+    In-process metrics: summaries (durations) and counters, keyed by
+    metric name and labels, rendered in the Prometheus text format.
+
+    Values are per process; with several worker processes each one
+    exposes its own numbers.
+    """
+
+    def __init__(self, window: int = 1024):
+        self.window = window
+        self._lock = threading.Lock()
+        self._summaries: Dict[str, Dict[Labels, Summary]] = defaultdict(dict)
+        self._counters: Dict[str, Dict[Labels, float]] = defaultdict(lambda: defaultdict(float))
+        self._help: Dict[str, str] = {}
+
+    def describe(self, name: str, help_text: str) -> None:
+        self._help[name] = help_text
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            summary = self._summaries[name].get(key)
+            if summary is None:
+                summary = self._summaries[name][key] = Summary(self.window)
+            summary.observe(value)
+
+    def increment(self, name: str, amount: float = 1, **labels) -> None:
+        with self._lock:
+            self._counters[name][_labels(**labels)] += amount
+
+    def reset(self) -> None:
+        with self._lock:
+            self._summaries.clear()
+            self._counters.clear()
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format (0.0.4).
+        """
+        lines = []
+        with self._lock:
+            for name in sorted(self._summaries):
+                self._header(lines, name, 'summary')
+                for labels, summary in sorted(self._summaries[name].items()):
+                    for q, value in summary.quantiles().items():
+                        lines.append(f"{name}{_format_labels(labels + (('quantile', str(q)),))} {value:.6f}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {summary.total:.6f}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {summary.count}")
+            for name in sorted(self._counters):
+                self._header(lines, name, 'counter')
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+    def _header(self, lines: List[str], name: str, kind: str) -> None:
+        if name in self._help:
+            lines.append(f"# HELP {name} {self._help[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    pairs = (
+        '{}="{}"'.format(key, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return '{' + ','.join(pairs) + '}'
+
+
+registry = MetricsRegistry()
+registry.describe('ats_stage_duration_seconds', "Time spent in an instrumented stage")
+registry.describe('ats_request_duration_seconds', "Time to produce a response, per endpoint")
+registry.describe('ats_llm_tokens_total', "LLM tokens used, per model and token kind")
+
+
+class RequestTimings:
+    """Stage durations collected while handling one request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stages: Dict[str, List[float]] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self.stages.setdefault(name, []).append(seconds)
+
+    def server_timing(self) -> str:
+        """
+        Format the collected stages as a Server-Timing header value, one
+        entry per stage with the summed duration in milliseconds.
+        """
+        with self._lock:
+            entries = []
+            for name, durations in self.stages.items():
+                entry = f"{name};dur={sum(durations) * 1000:.1f}"
+                if len(durations) > 1:
+                    entry += f';desc="{len(durations)}x"'
+                entries.append(entry)
+        return ', '.join(entries)
+
+
+_current_timings: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    'current_timings', default=None
+)
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    """
+    Collect the stages timed by the current thread (or task) until the
+    block exits. Stages timed on other threads only feed the histograms.
+    """
+    timings = RequestTimings()
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """
+    Record a stage duration in the histograms and, inside
+    collect_timings(), in the current request's timings.
+    """
+    registry.observe('ats_stage_duration_seconds', seconds, stage=name)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time the enclosed block as stage `name`.
+
+    Example:
+        with stage('extract_text'):
+            text = extract(...)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+def record_llm_usage(model: str, usage) -> None:
+    """
+    Count the tokens reported in an LLM response's `usage` block.
+    """
+    if usage is None:
+        return
+    for kind in ('prompt', 'completion'):
+        tokens = getattr(usage, f'{kind}_tokens', None)
+        if tokens:
+            registry.increment('ats_llm_tokens_total', tokens, model=model, kind=kind)
@@ -0,0 +1,131 @@
+import hashlib
+import random
+import re
+from array import array
+from typing import List, Sequence, Set
+
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def normalize_text(text: str) -> str:
+    """
+    Reduce text to lower-cased word tokens separated by single spaces,
+    so whitespace, punctuation and case edits do not change it.
+    """
+    return ' '.join(_TOKEN.findall((text or '').lower()))
+
+
+def text_fingerprint(text: str) -> str:
+    """
+    Fingerprint text for exact-duplicate detection.
+
+    Args:
+        text (str): Raw text
+
+    Returns:
+        str: SHA-256 hex digest of the normalized text
+    """
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def _hash64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """
+    Hash the overlapping `size`-word windows of normalized text.
+
+    Args:
+        text (str): Raw text
+        size (int): Words per shingle
+
+    Returns:
+        Set[int]: 64-bit shingle hashes (one for texts shorter than `size`)
+    """
+    tokens = normalize_text(text).split(' ')
+    if len(tokens) <= size:
+        return {_hash64(' '.join(tokens).encode('utf-8'))}
+    return {
+        _hash64(' '.join(tokens[i:i + size]).encode('utf-8'))
+        for i in range(len(tokens) - size + 1)
+    }
+
+
+class MinHasher:
+    """
+    MinHash signatures estimating the Jaccard similarity of shingle sets.
+
+    The permutations are derived from `seed`, so signatures computed by
+    different processes (or before a restart) stay comparable as long as
+    `num_perm` and `seed` do not change.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> List[int]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text (str): Raw text
+
+        Returns:
+            List[int]: `num_perm` 32-bit minimum hash values
+        """
+        values = shingles(text, self.shingle_size)
+        return [
+            min((a * value + b) % _MERSENNE_PRIME for value in values) & _MAX_HASH
+            for a, b in self._permutations
+        ]
+
+
+def signature_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """
+    Estimated Jaccard similarity of the texts two signatures were computed from.
+    """
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+def lsh_keys(signature: Sequence[int], bands: int) -> List[int]:
+    """
+    Split a signature into `bands` bands and hash each one into a bucket key.
+
+    Two signatures sharing any key are near-duplicate candidates. The
+    band index is part of the hash, so keys of different bands never
+    collide by construction.
+
+    Args:
+        signature (Sequence[int]): MinHash signature
+        bands (int): Number of bands; must divide the signature length
+
+    Returns:
+        List[int]: One signed 64-bit key per band (fits a BIGINT column)
+    """
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        data = array('I', [band, *signature[band * rows:(band + 1) * rows]]).tobytes()
+        keys.append(_hash64(data) - (1 << 63))
+    return keys
+
+
+def pack_signature(signature: Sequence[int]) -> bytes:
+    """Pack a signature into bytes for storage (4 bytes per value)."""
+    return array('I', signature).tobytes()
+
+
+def unpack_signature(data: bytes) -> List[int]:
+    """Inverse of pack_signature."""
+    return array('I', bytes(data)).tolist()
@@ -0,0 +1,244 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ('cprofile', 'sample')
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+Frame = Tuple[str, str, int]
+
+
+class StackSampler:
+    """
+    Statistical profiler for one thread: a background thread records the
+    target thread's Python stack every `interval` seconds.
+
+    Much cheaper than cProfile on call-heavy code, at the cost of missing
+    anything shorter than the interval. The result is exported in the
+    speedscope format (https://www.speedscope.app).
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples: List[Tuple[Frame, ...]] = []
+        self.weights: List[float] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is None:
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append(tuple(stack))
+            self.weights.append(now - last)
+            last = now
+
+    def speedscope(self, name: str) -> Dict[str, Any]:
+        """
+        Export the samples as a speedscope "sampled" profile.
+
+        Args:
+            name (str): Profile name shown by speedscope
+
+        Returns:
+            Dict[str, Any]: JSON-serializable speedscope document
+        """
+        frame_index: Dict[Frame, int] = {}
+        frames = []
+        samples = []
+        for stack in self.samples:
+            indexes = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+                indexes.append(frame_index[frame])
+            samples.append(indexes)
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'name': name,
+            'exporter': 'resume-ats',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(self.weights),
+                'samples': samples,
+                'weights': self.weights,
+            }],
+        }
+
+
+class Profiler:
+    """
+    Profile the current thread with cProfile ('cprofile', deterministic,
+    saved as a pstats file) or a StackSampler ('sample', saved as a
+    speedscope file).
+
+    Example:
+        profiler = Profiler('sample')
+        profiler.start()
+        handle(request)
+        profiler.stop()
+        profiler.save(path_without_suffix, name='GET /api/jobs/')
+    """
+
+    def __init__(self, mode: str = 'cprofile', interval: float = 0.005):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unsupported profile mode: {mode!r} (expected one of {PROFILE_MODES})")
+        self.mode = mode
+        self.interval = interval
+        self._profiler = None
+
+    @property
+    def suffix(self) -> str:
+        return '.prof' if self.mode == 'cprofile' else '.speedscope.json'
+
+    def start(self) -> None:
+        """
+        Raises:
+            ValueError: If another profiler is already active (Python 3.12+
+            allows a single cProfile at a time per process)
+        """
+        if self.mode == 'cprofile':
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._profiler = StackSampler(interval=self.interval)
+            self._profiler.start()
+
+    def stop(self) -> None:
+        if self.mode == 'cprofile':
+            self._profiler.disable()
+        else:
+            self._profiler.stop()
+
+    def save(self, path: Path, name: str) -> Path:
+        """
+        Write the profile to `path` plus the mode's suffix.
+
+        Returns:
+            Path: The written file
+        """
+        path = Path(str(path) + self.suffix)
+        if self.mode == 'cprofile':
+            self._profiler.dump_stats(path)
+        else:
+            path.write_text(json.dumps(self._profiler.speedscope(name)), encoding='utf-8')
+        return path
+
+
+class ProfileStore:
+    """
+    Directory of captured profiles, each stored as a profile file plus a
+    `<id>.json` metadata file, keeping at most `max_captures` captures
+    (the oldest are deleted first).
+
+    Several processes may share the directory; files that disappear
+    under a concurrent rotation are skipped.
+    """
+
+    def __init__(self, directory: Path, max_captures: int = 200):
+        self.directory = Path(directory)
+        self.max_captures = max_captures
+
+    def new_id(self) -> str:
+        # Sortable by capture time, so rotation can go by name
+        now = time.time()
+        return f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(now))}.{int(now % 1 * 1e6):06d}-{uuid.uuid4().hex[:8]}"
+
+    def save(self, profiler: Profiler, capture_id: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write a finished profile and its metadata, then rotate.
+
+        Args:
+            profiler (Profiler): A stopped profiler
+            capture_id (str): From new_id()
+            meta (Dict[str, Any]): Request details, stored alongside the profile
+
+        Returns:
+            Dict[str, Any]: The stored metadata, including `id` and `file`
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        profile_path = profiler.save(self.directory / capture_id, name=meta.get('name', capture_id))
+        meta = {**meta, 'id': capture_id, 'mode': profiler.mode, 'file': profile_path.name}
+        tmp_path = self.directory / f".{capture_id}.json.tmp"
+        tmp_path.write_text(json.dumps(meta), encoding='utf-8')
+        os.replace(tmp_path, self.directory / f"{capture_id}.json")
+        self.rotate()
+        return meta
+
+    def captures(self) -> List[Dict[str, Any]]:
+        """
+        Metadata of every stored capture, oldest first.
+        """
+        if not self.directory.is_dir():
+            return []
+        captures = []
+        for path in sorted(self.directory.glob('*.json')):
+            if path.name.endswith('.speedscope.json'):
+                continue
+            try:
+                captures.append(json.loads(path.read_text(encoding='utf-8')))
+            except (OSError, ValueError):
+                continue
+        return captures
+
+    def slowest(self, limit: int = 50) -> List[Dict[str, Any]]:
+        return sorted(self.captures(), key=lambda meta: meta.get('duration_ms', 0), reverse=True)[:limit]
+
+    def file_path(self, name: str) -> Optional[Path]:
+        """
+        Path of a stored profile file by name, or None for names that are
+        not a capture's profile file (including any path traversal).
+        """
+        if not _is_file_name(name):
+            return None
+        for meta in self.captures():
+            if meta.get('file') == name:
+                path = self.directory / name
+                return path if path.is_file() else None
+        return None
+
+    def rotate(self) -> None:
+        captures = self.captures()
+        for meta in captures[:max(0, len(captures) - self.max_captures)]:
+            for name in (meta.get('file'), f"{meta.get('id')}.json"):
+                if _is_file_name(name):
+                    try:
+                        (self.directory / name).unlink()
+                    except FileNotFoundError:
+                        pass
+
+
+def _is_file_name(name) -> bool:
+    # A bare file name in the store directory: no separators, no "..", not hidden
+    return isinstance(name, str) and bool(name) and os.path.basename(name) == name and not name.startswith('.')
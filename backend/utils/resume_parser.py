@@ -1,29 +1,50 @@
 import os
 import logging
-import PyPDF2
-import docx
-import pdfplumber
 import re
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterator, List, Optional, Union
+
+from utils.metrics import stage
 
 logger = logging.getLogger(__name__)
 
+# PyPDF2, pdfplumber and python-docx are imported on first use: they are
+# slow to import and most processes (management commands, workers that
+# never see an upload) do not need them
+
+# A path on disk or an open, seekable binary file object
+FileSource = Union[str, os.PathLike, BinaryIO]
+
+
+@contextmanager
+def _open_binary(source: FileSource) -> Iterator[BinaryIO]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield file
+    else:
+        source.seek(0)
+        yield source
+
+
 class ResumeParser:
     
     @staticmethod
-    def extract_text_from_pdf(file_path: str) -> str:
+    def extract_text_from_pdf(file_path: FileSource) -> str:
         """
         Extract text from PDF file using multiple methods.
         
         Args:
-            file_path (str): Path to the PDF file
+            file_path (FileSource): Path to the PDF file, or a binary file object
         
         Returns:
             str: Extracted text from the PDF
         """
+        import PyPDF2
+        import pdfplumber
+
         try:
             # Method 1: PyPDF2
-            with open(file_path, 'rb') as file:
+            with _open_binary(file_path) as file:
                 reader = PyPDF2.PdfReader(file)
                 pdf_text = " ".join([
                     page.extract_text() or "" for page in reader.pages
@@ -33,7 +54,7 @@ class ResumeParser:
                     return pdf_text
             
             # Method 2: pdfplumber (fallback)
-            with pdfplumber.open(file_path) as pdf:
+            with _open_binary(file_path) as file, pdfplumber.open(file) as pdf:
                 plumber_text = " ".join([
                     page.extract_text() or "" for page in pdf.pages
                 ])
@@ -45,18 +66,21 @@ class ResumeParser:
             return ""
 
     @staticmethod
-    def extract_text_from_docx(file_path: str) -> str:
+    def extract_text_from_docx(file_path: FileSource) -> str:
         """
         Extract text from DOCX file.
         
         Args:
-            file_path (str): Path to the DOCX file
+            file_path (FileSource): Path to the DOCX file, or a binary file object
         
         Returns:
             str: Extracted text from the document
         """
+        import docx
+
         try:
-            doc = docx.Document(file_path)
+            with _open_binary(file_path) as file:
+                doc = docx.Document(file)
             return " ".join([
                 paragraph.text for paragraph in doc.paragraphs if paragraph.text
             ])
@@ -65,30 +89,32 @@ class ResumeParser:
             return ""
 
     @staticmethod
-    def extract_text_from_txt(file_path: str) -> str:
+    def extract_text_from_txt(file_path: FileSource) -> str:
         """
         Extract text from plain text file.
         
         Args:
-            file_path (str): Path to the text file
+            file_path (FileSource): Path to the text file, or a binary file object
         
         Returns:
             str: Text content of the file
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                return file.read()
+            with _open_binary(file_path) as file:
+                return file.read().decode('utf-8')
         except Exception as e:
             logger.error(f"Error reading text file {file_path}: {e}")
             return ""
 
     @staticmethod
-    def extract_text(file_path: str) -> str:
+    def extract_text(file_path: FileSource, file_extension: Optional[str] = None) -> str:
         """
         Determine file type and extract text.
         
         Args:
-            file_path (str): Path to the file
+            file_path (FileSource): Path to the file, or a binary file object
+            file_extension (str, optional): File type such as '.pdf'; required
+                for file objects, inferred from the path otherwise
         
         Returns:
             str: Extracted text from the file
@@ -96,7 +122,7 @@ class ResumeParser:
         Raises:
             ValueError: If unsupported file type is provided
         """
-        file_extension = os.path.splitext(file_path)[1].lower()
+        file_extension = (file_extension or os.path.splitext(str(file_path))[1]).lower()
         
         extraction_methods = {
             '.pdf': ResumeParser.extract_text_from_pdf,
@@ -108,7 +134,8 @@ class ResumeParser:
         extraction_method = extraction_methods.get(file_extension)
         
         if extraction_method:
-            return extraction_method(file_path)
+            with stage('extract_text'):
+                return extraction_method(file_path)
         else:
             raise ValueError(f"Unsupported file type: {file_extension}")
 
@@ -128,19 +155,21 @@ class ResumeParser:
         
         return text
     @staticmethod
-    def extract_clickable_links_from_pdf(file_path: str) -> List[str]:
+    def extract_clickable_links_from_pdf(file_path: FileSource) -> List[str]:
         """
         Extract clickable hyperlinks from PDF annotations.
         
         Args:
-            file_path (str): Path to the PDF file
+            file_path (FileSource): Path to the PDF file, or a binary file object
         
         Returns:
             List[str]: List of URLs extracted from annotations.
         """
+        import PyPDF2
+
         links = []
         try:
-            with open(file_path, 'rb') as file:
+            with _open_binary(file_path) as file:
                 reader = PyPDF2.PdfReader(file)
                 for page in reader.pages:
                     if "/Annots" in page:
@@ -153,13 +182,14 @@ class ResumeParser:
             logger.error(f"Error extracting clickable links from PDF {file_path}: {e}")
         return links
     @staticmethod
-    def extract_urls(text: str, file_path: str = None) -> List[str]:
+    def extract_urls(text: str, file_path: FileSource = None, file_extension: Optional[str] = None) -> List[str]:
         """
         Extract all URLs from text and, for PDFs, from clickable annotations.
         
         Args:
             text (str): Text containing embedded links.
-            file_path (str, optional): Path to the file (used for PDFs).
+            file_path (FileSource, optional): Path to the file or a binary file object (used for PDFs).
+            file_extension (str, optional): File type, inferred from the path if omitted.
         
         Returns:
             List[str]: List of extracted URLs.
@@ -168,8 +198,10 @@ class ResumeParser:
         urls = re.findall(url_pattern, text)
         
         # If file_path is provided and is a PDF, extract clickable links from annotations
-        if file_path and os.path.splitext(file_path)[1].lower() == '.pdf':
-            clickable_urls = ResumeParser.extract_clickable_links_from_pdf(file_path)
+        file_extension = (file_extension or os.path.splitext(str(file_path or ''))[1]).lower()
+        if file_path is not None and file_extension == '.pdf':
+            with stage('extract_links'):
+                clickable_urls = ResumeParser.extract_clickable_links_from_pdf(file_path)
             urls.extend(clickable_urls)
         
         return list(set(urls))
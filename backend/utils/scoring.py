@@ -0,0 +1,93 @@
+import re
+from typing import Any, Iterable, Set
+
+_WHITESPACE = re.compile(r'\s+')
+
+# Longest skill name kept (the Skill.name column); longer entries are
+# sentences the LLM put in a skills list, not skills
+MAX_SKILL_LENGTH = 255
+
+# Common spellings of the same skill, mapped to one canonical name
+SKILL_ALIASES = {
+    'js': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'python3': 'python',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'k8s': 'kubernetes',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vuejs': 'vue',
+    'vue.js': 'vue',
+    'amazon web services': 'aws',
+    'google cloud platform': 'gcp',
+    'ml': 'machine learning',
+    'c sharp': 'c#',
+    'cpp': 'c++',
+}
+
+
+def normalize_skill(skill: Any) -> str:
+    """
+    Normalize a single skill entry for comparison.
+
+    LLM output is not always a plain string, so dict entries are reduced
+    to their `name`/`skill` value.
+
+    Args:
+        skill: Skill entry from parsed_skills/required_skills
+
+    Returns:
+        str: Lower-cased, whitespace-collapsed skill name with aliases
+        resolved (see SKILL_ALIASES); '' if unusable or longer than
+        MAX_SKILL_LENGTH
+    """
+    if isinstance(skill, dict):
+        skill = skill.get('name') or skill.get('skill') or ''
+    if not isinstance(skill, str):
+        return ''
+    name = _WHITESPACE.sub(' ', skill).strip().lower()
+    if len(name) > MAX_SKILL_LENGTH:
+        return ''
+    return SKILL_ALIASES.get(name, name)
+
+
+def normalize_skills(skills: Iterable[Any]) -> Set[str]:
+    """
+    Normalize a list of skills into a set of comparable names.
+
+    Args:
+        skills: parsed_skills/required_skills value (may be None)
+
+    Returns:
+        Set[str]: Normalized skill names
+    """
+    if not skills or isinstance(skills, (str, dict)):
+        skills = [skills] if skills else []
+    return {name for name in (normalize_skill(skill) for skill in skills) if name}
+
+
+def local_match_score(candidate_skills: Iterable[Any], required_skills: Iterable[Any]) -> float:
+    """
+    Cheap, LLM-free match score: the share of required skills the
+    candidate lists, on the same 0-100 scale as the LLM score.
+
+    Both arguments are normalized here, so raw parsed_skills/required_skills
+    values and sets already passed through normalize_skills both work.
+
+    Args:
+        candidate_skills: Candidate's parsed skills
+        required_skills: Job's required skills
+
+    Returns:
+        float: Score between 0 and 100
+    """
+    required = normalize_skills(required_skills)
+    if not required:
+        return 0.0
+    candidate = normalize_skills(candidate_skills)
+    return round(100.0 * len(required & candidate) / len(required), 2)
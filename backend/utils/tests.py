@@ -0,0 +1,378 @@
+import hashlib
+import os
+import tempfile
+import zlib
+from unittest import mock, skipUnless
+
+from django.test import SimpleTestCase
+
+from .llm_functions import GroqLLMFunctions
+from .metrics import MetricsRegistry, collect_timings, record_llm_usage, record_stage, stage
+from .llm_schemas import MATCH_SCHEMA, RESUME_SCHEMA, as_score, repair_json
+from . import text_compression
+from .blob_store import BlobStore
+from .file_types import FileSniffer, FileTypeMismatch
+from .minhash import (
+    MinHasher, lsh_keys, normalize_text, pack_signature, shingles, signature_similarity,
+    text_fingerprint, unpack_signature
+)
+from .text_compression import ZLIB, ZSTD, compress_text, decompress_text
+
+
+class TextCompressionTests(SimpleTestCase):
+    TEXT = 'Résumé — Python, Django, 日本語\n' * 200
+
+    def test_round_trip(self):
+        codec, data = compress_text(self.TEXT)
+        self.assertLess(len(data), len(self.TEXT.encode('utf-8')))
+        self.assertEqual(decompress_text(codec, data), self.TEXT)
+
+    def test_empty_text(self):
+        self.assertEqual(decompress_text(*compress_text('')), '')
+
+    def test_zlib_fallback_without_zstandard(self):
+        with mock.patch.object(text_compression, 'zstandard', None):
+            codec, data = compress_text(self.TEXT)
+            self.assertEqual(codec, ZLIB)
+            self.assertEqual(decompress_text(codec, data), self.TEXT)
+
+    def test_zlib_text_readable_with_zstandard_installed(self):
+        self.assertEqual(decompress_text(ZLIB, zlib.compress(b'plain')), 'plain')
+
+    @skipUnless(text_compression.zstandard, "zstandard not installed")
+    def test_zstd_codec(self):
+        codec, data = compress_text(self.TEXT)
+        self.assertEqual(codec, ZSTD)
+        self.assertEqual(decompress_text(codec, data), self.TEXT)
+
+    def test_zstd_text_without_zstandard(self):
+        with mock.patch.object(text_compression, 'zstandard', None):
+            with self.assertRaises(ValueError):
+                decompress_text(ZSTD, b'...')
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            decompress_text('lz4', b'...')
+
+
+class BlobStoreTests(SimpleTestCase):
+    CONTENT = b'%PDF-1.7 resume ' * 1000
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = BlobStore(directory.name)
+        self.digest = hashlib.sha256(self.CONTENT).hexdigest()
+
+    def chunks(self, data=CONTENT, size=4096):
+        return (data[i:i + size] for i in range(0, len(data), size))
+
+    def leftovers(self):
+        tmp_dir = os.path.join(self.store.root, 'tmp')
+        return os.listdir(tmp_dir) if os.path.isdir(tmp_dir) else []
+
+    def test_put_and_open(self):
+        self.assertEqual(self.store.put_chunks(self.chunks()), (self.digest, len(self.CONTENT)))
+        self.assertEqual(
+            self.store.path(self.digest),
+            os.path.join(self.store.root, self.digest[:2], self.digest[2:4], self.digest)
+        )
+        with self.store.open(self.digest) as file:
+            self.assertTrue(file.seekable())
+            file.seek(-7, os.SEEK_END)
+            self.assertEqual(file.read(), b'resume ')
+            file.seek(0)
+            self.assertEqual(file.read(), self.CONTENT)
+        self.assertEqual(self.leftovers(), [])
+
+    def test_existing_blob_is_not_read_again(self):
+        self.store.put_chunks(self.chunks())
+
+        def unreadable():
+            raise AssertionError("chunks were read")
+            yield
+
+        self.assertEqual(self.store.put_chunks(unreadable(), digest=self.digest), (self.digest, len(self.CONTENT)))
+        # Without a known digest the copy is hashed, then discarded
+        self.assertEqual(self.store.put_chunks(self.chunks())[0], self.digest)
+        self.assertEqual(self.leftovers(), [])
+
+    def test_digest_mismatch_stores_nothing(self):
+        wrong = hashlib.sha256(b'other').hexdigest()
+        with self.assertRaises(ValueError):
+            self.store.put_chunks(self.chunks(), digest=wrong)
+        self.assertFalse(self.store.exists(wrong))
+        self.assertFalse(self.store.exists(self.digest))
+        self.assertEqual(self.leftovers(), [])
+
+    def test_interrupted_put_leaves_no_partial_blob(self):
+        def failing():
+            yield self.CONTENT[:100]
+            raise IOError("connection reset")
+
+        with self.assertRaises(IOError):
+            self.store.put_chunks(failing())
+        self.assertEqual(self.leftovers(), [])
+        self.assertEqual(sorted(os.listdir(self.store.root)), ['tmp'])
+
+    def test_digest_is_validated(self):
+        for digest in ('../../etc/passwd', self.digest.upper(), self.digest[:-1], None):
+            with self.assertRaises(ValueError):
+                self.store.path(digest)
+
+    def test_empty_blob_and_delete(self):
+        digest, size = self.store.put_chunks([])
+        self.assertEqual(size, 0)
+        with self.store.open(digest) as file:
+            self.assertEqual(file.read(), b'')
+        self.store.delete(digest)
+        self.store.delete(digest)
+        self.assertFalse(self.store.exists(digest))
+
+
+class FileSnifferTests(SimpleTestCase):
+    def sniff(self, file_type, *chunks):
+        sniffer = FileSniffer(file_type)
+        for chunk in chunks:
+            sniffer.update(chunk)
+        sniffer.finish()
+
+    def test_magic_bytes(self):
+        self.sniff('.pdf', b'\n' * 500, b'%PDF-1.7')
+        self.sniff('.docx', b'PK\x03', b'\x04rest')
+        self.sniff('.doc', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1')
+        for file_type, content in (('.pdf', b'\n' * 2000 + b'%PDF-'), ('.docx', b'%PDF-1.7'), ('.doc', b'MZ\x90\x00')):
+            with self.assertRaises(FileTypeMismatch, msg=file_type):
+                self.sniff(file_type, content)
+
+    def test_mismatch_caught_from_first_chunk(self):
+        sniffer = FileSniffer('.docx')
+        with self.assertRaises(FileTypeMismatch):
+            sniffer.update(b'%PDF-1.7 and much more')
+
+    def test_truncated_file(self):
+        with self.assertRaises(FileTypeMismatch):
+            self.sniff('.docx', b'PK')
+
+    def test_text_must_be_utf8(self):
+        self.sniff('.txt', 'Résumé'.encode('utf-8')[:2], 'Résumé'.encode('utf-8')[2:])
+        for content in (b'caf\xe9', b'text\x00with NUL', 'é'.encode('utf-8')[:1]):
+            with self.assertRaises(FileTypeMismatch, msg=content):
+                self.sniff('.txt', content)
+
+    def test_unsupported_type(self):
+        for file_type in ('.exe', ''):
+            with self.assertRaises(FileTypeMismatch):
+                FileSniffer(file_type)
+
+
+class MetricsTests(SimpleTestCase):
+    def test_prometheus_output(self):
+        registry = MetricsRegistry(window=4)
+        registry.describe('ats_request_duration_seconds', "Time to produce a response")
+        for value in (0.1, 0.2, 0.3, 0.4, 0.5):
+            registry.observe('ats_request_duration_seconds', value, endpoint='job-list', method='GET')
+        registry.increment('ats_llm_tokens_total', 7, model='m', kind='prompt')
+        registry.increment('ats_llm_tokens_total', 3, model='m', kind='prompt')
+        registry.increment('ats_llm_tokens_total', 1, model='say "hi"\n', kind='completion')
+
+        self.assertEqual(registry.render().splitlines(), [
+            '# HELP ats_request_duration_seconds Time to produce a response',
+            '# TYPE ats_request_duration_seconds summary',
+            # Quantiles over the last 4 observations, sum and count over all 5
+            'ats_request_duration_seconds{endpoint="job-list",method="GET",quantile="0.5"} 0.300000',
+            'ats_request_duration_seconds{endpoint="job-list",method="GET",quantile="0.95"} 0.500000',
+            'ats_request_duration_seconds{endpoint="job-list",method="GET",quantile="0.99"} 0.500000',
+            'ats_request_duration_seconds_sum{endpoint="job-list",method="GET"} 1.500000',
+            'ats_request_duration_seconds_count{endpoint="job-list",method="GET"} 5',
+            '# TYPE ats_llm_tokens_total counter',
+            'ats_llm_tokens_total{kind="completion",model="say \\"hi\\"\\n"} 1',
+            'ats_llm_tokens_total{kind="prompt",model="m"} 10',
+        ])
+
+        registry.reset()
+        self.assertEqual(registry.render(), '\n')
+
+    def test_request_timings(self):
+        with mock.patch('utils.metrics.registry', MetricsRegistry()) as registry:
+            record_stage('outside', 1.0)
+            with collect_timings() as timings:
+                record_stage('db_read', 0.002)
+                record_stage('db_read', 0.003)
+                with mock.patch('utils.metrics.time.perf_counter', side_effect=[10.0, 10.25]):
+                    with stage('llm'):
+                        pass
+            record_stage('after', 1.0)
+
+        self.assertEqual(timings.server_timing(), 'db_read;dur=5.0;desc="2x", llm;dur=250.0')
+        self.assertIn('ats_stage_duration_seconds_count{stage="outside"} 1', registry.render())
+        self.assertIn('ats_stage_duration_seconds_count{stage="db_read"} 2', registry.render())
+
+    def test_llm_usage(self):
+        with mock.patch('utils.metrics.registry', MetricsRegistry()) as registry:
+            record_llm_usage('m', mock.Mock(prompt_tokens=12, completion_tokens=0))
+            record_llm_usage('m', None)
+        self.assertEqual(
+            registry.render().splitlines()[-1], 'ats_llm_tokens_total{kind="prompt",model="m"} 12'
+        )
+
+
+class MinHashTests(SimpleTestCase):
+    TEXT = ' '.join(f'duty{i}' for i in range(200))
+
+    def setUp(self):
+        self.hasher = MinHasher(num_perm=128)
+
+    def test_fingerprint_ignores_case_whitespace_and_punctuation(self):
+        self.assertEqual(normalize_text('  Senior  Engineer,\nPython!'), 'senior engineer python')
+        self.assertEqual(text_fingerprint('Senior Engineer, Python'), text_fingerprint('senior engineer  python.'))
+        self.assertNotEqual(text_fingerprint('Senior Engineer'), text_fingerprint('Junior Engineer'))
+
+    def test_short_text_is_one_shingle(self):
+        self.assertEqual(len(shingles('Python developer')), 1)
+        self.assertEqual(len(shingles(self.TEXT)), 196)
+
+    def test_signatures_are_stable(self):
+        self.assertEqual(MinHasher(num_perm=128).signature(self.TEXT), self.hasher.signature(self.TEXT))
+        self.assertNotEqual(MinHasher(num_perm=128, seed=2).signature(self.TEXT), self.hasher.signature(self.TEXT))
+
+    def test_similarity_estimates_jaccard(self):
+        edited = self.TEXT.replace('duty100', 'task100')
+        # One edited word changes 5 of 196 shingles: Jaccard 191/201
+        similarity = signature_similarity(self.hasher.signature(self.TEXT), self.hasher.signature(edited))
+        self.assertGreater(similarity, 0.85)
+        self.assertLess(similarity, 1.0)
+
+        other = ' '.join(f'task{i}' for i in range(200))
+        self.assertLess(signature_similarity(self.hasher.signature(self.TEXT), self.hasher.signature(other)), 0.1)
+        self.assertEqual(signature_similarity([1, 2], [1, 2, 3]), 0.0)
+
+    def test_lsh_keys_shared_by_near_duplicates_only(self):
+        signature = self.hasher.signature(self.TEXT)
+        keys = lsh_keys(signature, 32)
+        self.assertEqual(len(keys), 32)
+        self.assertTrue(all(-(1 << 63) <= key < (1 << 63) for key in keys))
+
+        edited = lsh_keys(self.hasher.signature(self.TEXT.replace('duty100', 'task100')), 32)
+        other = lsh_keys(self.hasher.signature(' '.join(f'task{i}' for i in range(200))), 32)
+        self.assertTrue(set(keys) & set(edited))
+        self.assertFalse(set(keys) & set(other))
+
+    def test_identical_bands_in_different_positions_do_not_collide(self):
+        self.assertEqual(len(set(lsh_keys([7] * 8, 4))), 4)
+
+    def test_pack_round_trip(self):
+        signature = self.hasher.signature(self.TEXT)
+        data = pack_signature(signature)
+        self.assertEqual(len(data), 4 * 128)
+        self.assertEqual(unpack_signature(memoryview(data)), signature)
+
+
+class RepairJsonTests(SimpleTestCase):
+    def test_valid_json(self):
+        self.assertEqual(repair_json('{"a": [1, 2]}'), {'a': [1, 2]})
+
+    def test_code_fence_and_prose(self):
+        text = 'Here is the result:\n```json\n{"a": 1}\n```\nLet me know if you need more.'
+        self.assertEqual(repair_json(text), {'a': 1})
+
+    def test_trailing_prose_with_non_ascii_letters(self):
+        self.assertEqual(repair_json('{"a": 1} Voilà'), {'a': 1})
+        self.assertEqual(repair_json('Résumé analysé : {"a": 1} — terminé'), {'a': 1})
+
+    def test_trailing_commas(self):
+        self.assertEqual(repair_json('{"a": [1, 2,], "b": 3,}'), {'a': [1, 2], 'b': 3})
+
+    def test_python_literals(self):
+        self.assertEqual(repair_json('{"a": True}'), {'a': True})
+        self.assertEqual(repair_json('{"a": None, "b": False}'), {'a': None, 'b': False})
+
+    def test_literal_words_inside_strings_are_kept(self):
+        self.assertEqual(repair_json('{"a": "None of True", "b": 1,}'), {'a': 'None of True', 'b': 1})
+
+    def test_truncated_array(self):
+        self.assertEqual(repair_json('{"skills": ["Python", "Django"'), {'skills': ['Python', 'Django']})
+
+    def test_truncated_string_member_is_dropped(self):
+        text = '{"match_score": 72, "missing_skills": ["Go"], "summary": "Strong backgr'
+        self.assertEqual(repair_json(text), {'match_score': 72, 'missing_skills': ['Go']})
+
+    def test_truncated_after_key(self):
+        self.assertEqual(repair_json('{"a": 1, "b":'), {'a': 1, 'b': None})
+
+    def test_unrecoverable(self):
+        for text in ('I cannot comply with this request.', '', None):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    repair_json(text)
+
+
+class AsScoreTests(SimpleTestCase):
+    def test_coercion(self):
+        cases = [
+            (85, 85),
+            (85.6, 86),
+            ('85', 85),
+            ('85%', 85),
+            ('85/100', 85),
+            ('Score: 70 out of 100', 70),
+            (0.85, 85),
+            ([64], 64),
+            (150, 100),
+            (-5, 0),
+            (0, 0),
+            (1, 1),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(as_score(value), expected)
+
+    def test_unusable_values(self):
+        for value in (None, True, 'high', [], float('inf'), float('nan'), {}):
+            with self.subTest(value=value):
+                self.assertIsNone(as_score(value))
+
+
+class SchemaTests(SimpleTestCase):
+    def test_keys_and_types_are_coerced(self):
+        data, problems = MATCH_SCHEMA.validate({'matchScore': '90%', 'Missing Skills': 'Go; Rust', 'summary': ['Good']})
+        self.assertEqual(problems, [])
+        self.assertEqual(data, {'match_score': 90, 'missing_skills': ['Go', 'Rust'], 'summary': 'Good'})
+
+    def test_wrapper_object_is_unwrapped(self):
+        data, problems = RESUME_SCHEMA.validate({'candidate': {'name': 'Ann', 'email': ['Email: ann@example.com']}})
+        self.assertEqual(problems, [])
+        self.assertEqual(data['name'], 'Ann')
+        self.assertEqual(data['email'], 'ann@example.com')
+
+    def test_missing_required_field(self):
+        data, problems = MATCH_SCHEMA.parse('{"summary": "No score"}')
+        self.assertEqual(len(problems), 1)
+        self.assertEqual(data['match_score'], 0)
+
+    def test_unparseable_response(self):
+        data, problems = RESUME_SCHEMA.parse('Sorry, no.')
+        self.assertTrue(problems)
+        self.assertEqual(data, RESUME_SCHEMA.defaults())
+
+
+class StructuredResponseTests(SimpleTestCase):
+    def setUp(self):
+        self.llm = GroqLLMFunctions(api_key='test-key')
+
+    def test_missing_optional_field_is_not_reasked(self):
+        response = '{"title": "Backend Engineer", "company": null, "location": "Remote", "required_skills": "Python, Django"}'
+        with mock.patch.object(self.llm, '_call_groq_api', return_value=response) as call:
+            parsed = self.llm.parse_job_posting('We are hiring a backend engineer...')
+        self.assertEqual(call.call_count, 1)
+        self.assertEqual(parsed['title'], 'Backend Engineer')
+        self.assertIsNone(parsed['company'])
+        self.assertEqual(parsed['location'], 'Remote')
+        self.assertEqual(parsed['required_skills'], ['Python', 'Django'])
+
+    def test_missing_required_field_is_reasked_once(self):
+        responses = ['{"company": "Acme"}', '{"title": "Data Analyst", "company": "Acme"}']
+        with mock.patch.object(self.llm, '_call_groq_api', side_effect=responses) as call:
+            parsed = self.llm.parse_job_posting('Data analyst at Acme...')
+        self.assertEqual(call.call_count, 2)
+        self.assertEqual(parsed['title'], 'Data Analyst')
@@ -0,0 +1,51 @@
+import zlib
+from typing import Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+ZLIB = 'zlib'
+ZSTD = 'zstd'
+
+
+def compress_text(text: str, level: int = 6) -> Tuple[str, bytes]:
+    """
+    Compress text with zstd when the `zstandard` package is installed,
+    falling back to zlib.
+
+    Args:
+        text (str): Text to compress
+        level (int): Compression level
+
+    Returns:
+        Tuple[str, bytes]: Codec name and compressed bytes
+    """
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        return ZSTD, zstandard.ZstdCompressor(level=level).compress(data)
+    return ZLIB, zlib.compress(data, level)
+
+
+def decompress_text(codec: str, data: bytes) -> str:
+    """
+    Decompress bytes produced by `compress_text`.
+
+    Args:
+        codec (str): Codec name returned by `compress_text`
+        data (bytes): Compressed bytes
+
+    Returns:
+        str: Original text
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable
+    """
+    if codec == ZLIB:
+        return zlib.decompress(data).decode('utf-8')
+    if codec == ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd-compressed text requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data).decode('utf-8')
+    raise ValueError(f"Unsupported compression codec: {codec}")
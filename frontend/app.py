@@ -1,8 +1,29 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.cookiejar import DefaultCookiePolicy
+
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 
 # Base API URL
 BASE_URL = "http://127.0.0.1:8000/api"
+# LLM-backed actions (resume parsing, matching) can take a while
+REQUEST_TIMEOUT = 120
+# Seconds cached API reads are reused before being fetched again
+CACHE_TTL = 60
+JOB_PAGE_SIZE = 50
+# Resumes uploaded at once in batch mode. The backend parses
+# LLM_USER_CONCURRENCY (2) of a user's uploads at a time and queues
+# ADMISSION_USER_QUEUE_SIZE (2) more, so 4 keeps it busy without 429s.
+BATCH_UPLOAD_WORKERS = 4
+# Attempts per resume when the backend answers 429 (busy)
+BATCH_UPLOAD_ATTEMPTS = 3
+# Jobs listed on the match dashboard, and the most sent to the LLM at once
+# (the backend's MATCH_BULK_MAX_PAIRS)
+DASHBOARD_MAX_JOBS = 1000
+DASHBOARD_MAX_LLM_JOBS = 500
 
 # Initialize session state for token, candidate id, and job id
 if "token" not in st.session_state:
@@ -10,6 +31,52 @@ if "token" not in st.session_state:
 if "candidate_id" not in st.session_state:
     st.session_state.candidate_id = None
 
+
+@st.cache_resource
+def get_http_session():
+    """
+    Keep-alive connection pool shared by every rerun and browser session.
+    Cookies are never stored, since the session is shared between users.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def api_request(method, url, token=None, **kwargs):
+    """Call the API. `url` is relative to BASE_URL, or absolute (e.g. a `next` page link)."""
+    if not url.startswith(("http://", "https://")):
+        url = f"{BASE_URL}{url}"
+    headers = kwargs.pop("headers", {})
+    if token:
+        headers["Authorization"] = f"Token {token}"
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    return get_http_session().request(method, url, headers=headers, **kwargs)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def cached_get(url, token, params=None):
+    """
+    GET a JSON resource, cached per URL, params and token (so users never
+    see each other's data). Raises requests.HTTPError on error responses,
+    which are not cached.
+    """
+    response = api_request("GET", url, token, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def api_post(url, token=None, **kwargs):
+    """POST, dropping cached reads after a successful write since they may be stale."""
+    response = api_request("POST", url, token, **kwargs)
+    if response.ok:
+        cached_get.clear()
+    return response
+
+
 st.sidebar.title("Navigation")
 page = st.sidebar.radio("Go to", [
     "Register", 
@@ -17,7 +84,8 @@ page = st.sidebar.radio("Go to", [
     "Upload Resume", 
     "Post Job Description", 
     "View Profile", 
-    "Match Candidate to Job"
+    "Match Candidate to Job",
+    "Match Dashboard"
 ])
 
 def register():
@@ -36,7 +104,7 @@ def register():
             "name": name
         }
         try:
-            response = requests.post(f"{BASE_URL}/register/", json=data)
+            response = api_request("POST", "/register/", json=data)
             if response.status_code in (200, 201):
                 st.success("Registration successful!")
             else:
@@ -54,7 +122,7 @@ def login():
             "password": password
         }
         try:
-            response = requests.post(f"{BASE_URL}/login/", json=data)
+            response = api_request("POST", "/login/", json=data)
             if response.status_code == 200:
                 token = response.json().get("token")
                 if token:
@@ -72,15 +140,21 @@ def upload_resume():
     if not st.session_state.token:
         st.warning("Please log in first.")
         return
+    mode = st.radio("Mode", ["My resume", "Batch import (many candidates)"], horizontal=True)
+    if mode == "My resume":
+        upload_own_resume()
+    else:
+        import_resumes()
+
+def upload_own_resume():
     resume_file = st.file_uploader("Upload your resume", type=["pdf", "doc", "docx"])
     if st.button("Upload"):
         if resume_file is None:
             st.warning("Please upload a resume file.")
             return
-        headers = {"Authorization": f"Token {st.session_state.token}"}
         files = {"resume": resume_file}
         try:
-            response = requests.post(f"{BASE_URL}/candidates/upload_resume/", headers=headers, files=files)
+            response = api_post("/candidates/upload_resume/", st.session_state.token, files=files)
             if response.status_code in (200, 201):
                 data = response.json()
                 st.session_state.candidate_id = data.get("id")
@@ -91,6 +165,76 @@ def upload_resume():
         except Exception as e:
             st.error(f"Error: {e}")
 
+def import_resume_file(token, name, content):
+    """
+    Upload one resume to the batch import endpoint, retrying while the
+    backend is busy (429). Runs in a worker thread, so it must not call
+    Streamlit.
+
+    Returns:
+        A result row for the batch table
+    """
+    started = time.monotonic()
+    for attempt in range(1, BATCH_UPLOAD_ATTEMPTS + 1):
+        try:
+            response = api_request(
+                "POST", "/candidates/import_resume/", token, files={"resume": (name, content)}
+            )
+        except Exception as e:
+            return {"File": name, "Status": "error", "Candidate": None, "Details": str(e)}
+        if response.status_code != 429 or attempt == BATCH_UPLOAD_ATTEMPTS:
+            break
+        time.sleep(float(response.headers.get("Retry-After", 5)))
+
+    elapsed = f"{time.monotonic() - started:.1f}s"
+    try:
+        data = response.json()
+    except ValueError:
+        data = {}
+    if response.status_code == 201:
+        return {"File": name, "Status": "imported", "Candidate": data.get("name"), "Details": f"{data.get('email')} ({elapsed})"}
+    if response.status_code == 200:
+        return {"File": name, "Status": "already imported", "Candidate": data.get("name"), "Details": data.get("email")}
+    error = data.get("error") or data.get("detail") or response.text
+    return {"File": name, "Status": f"failed ({response.status_code})", "Candidate": None, "Details": error}
+
+def import_resumes():
+    """
+    Import a folder's worth of resumes as new candidates, uploading up to
+    BATCH_UPLOAD_WORKERS at a time and showing each result as it finishes.
+    """
+    resume_files = st.file_uploader(
+        "Upload resumes", type=["pdf", "doc", "docx", "txt"], accept_multiple_files=True
+    )
+    if not st.button("Import"):
+        return
+    if not resume_files:
+        st.warning("Please upload at least one resume file.")
+        return
+
+    token = st.session_state.token
+    progress = st.progress(0.0, text=f"Importing 0 of {len(resume_files)} resumes...")
+    table = st.empty()
+    rows = []
+    with ThreadPoolExecutor(max_workers=BATCH_UPLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(import_resume_file, token, resume_file.name, resume_file.getvalue())
+            for resume_file in resume_files
+        ]
+        for future in as_completed(futures):
+            rows.append(future.result())
+            progress.progress(
+                len(rows) / len(resume_files),
+                text=f"Importing {len(rows)} of {len(resume_files)} resumes..."
+            )
+            table.dataframe(rows, use_container_width=True)
+
+    imported = sum(row["Status"] == "imported" for row in rows)
+    failed = sum(row["Status"].startswith(("failed", "error")) for row in rows)
+    progress.progress(1.0, text=f"Done: {imported} imported, {len(rows) - imported - failed} already imported, {failed} failed.")
+    if imported:
+        cached_get.clear()
+
 def post_job_description():
     st.title("Post Job Description")
     if not st.session_state.token:
@@ -99,9 +243,8 @@ def post_job_description():
     job_description = st.text_area("Enter Job Description")
     if st.button("Post Job"):
         data = {"job_description": job_description}
-        headers = {"Authorization": f"Token {st.session_state.token}"}
         try:
-            response = requests.post(f"{BASE_URL}/jobs/create_from_description/", json=data, headers=headers)
+            response = api_post("/jobs/create_from_description/", st.session_state.token, json=data)
             if response.status_code in (200, 201):
                 job_data = response.json()
                 st.success("Job posted successfully!")
@@ -116,61 +259,91 @@ def view_profile():
     if not st.session_state.token:
         st.warning("Please log in first.")
         return
-    headers = {"Authorization": f"Token {st.session_state.token}"}
     try:
-        response = requests.get(f"{BASE_URL}/candidates/", headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("results"):
-                candidate_data = data["results"][0]
-                st.write("Candidate Profile:", candidate_data)
-                # Store candidate_id for matching
-                st.session_state.candidate_id = candidate_data.get("id")
-            else:
-                st.info("No candidate profile found. Please upload your resume.")
+        data = cached_get("/candidates/", st.session_state.token)
+        if data.get("results"):
+            candidate_data = data["results"][0]
+            st.write("Candidate Profile:", candidate_data)
+            # Store candidate_id for matching
+            st.session_state.candidate_id = candidate_data.get("id")
         else:
-            st.error(f"Failed to fetch profile: {response.text}")
+            st.info("No candidate profile found. Please upload your resume.")
+    except requests.HTTPError as e:
+        st.error(f"Failed to fetch profile: {e.response.text}")
     except Exception as e:
         st.error(f"Error: {e}")
 
 
+def select_job(token):
+    """
+    Job picker backed by server-side search and cursor pagination, so it
+    stays fast with thousands of jobs: only the pages the user loads are
+    fetched (a few fields each), and each page is cached.
+
+    Returns:
+        The selected job's id, or None if no job matches
+    """
+    search = st.text_input("Search jobs (title, company or location)").strip()
+    if st.session_state.get("job_search") != search:
+        st.session_state.job_search = search
+        st.session_state.job_pages = 1
+
+    jobs = []
+    url = "/jobs/"
+    params = {"fields": "id,title,company,location", "page_size": JOB_PAGE_SIZE}
+    if search:
+        params["search"] = search
+    for _ in range(st.session_state.job_pages):
+        page = cached_get(url, token, params)
+        jobs.extend(page.get("results", []))
+        # The `next` link already carries the query parameters
+        url, params = page.get("next"), None
+        if not url:
+            break
+
+    if not jobs:
+        return None
+
+    job_labels = {}
+    for job in jobs:
+        label = f"{job.get('title') or 'No Title'} at {job.get('company') or 'unknown company'}"
+        if job.get("location"):
+            label += f" ({job['location']})"
+        job_labels[job["id"]] = label
+    selected_job_id = st.selectbox("Select Job", options=list(job_labels), format_func=job_labels.get)
+
+    if url:
+        st.caption(f"Showing the {len(jobs)} most recent matching jobs.")
+        if st.button("Load more jobs"):
+            st.session_state.job_pages += 1
+            st.rerun()
+    return selected_job_id
+
+
 def match_candidate_to_job():
     st.title("Match Candidate to Job")
     if not st.session_state.token:
         st.warning("Please log in first.")
         return
 
-    # Fetch available jobs to populate the dropdown
-    headers = {"Authorization": f"Token {st.session_state.token}"}
-    try:
-        response = requests.get(f"{BASE_URL}/jobs/", headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            jobs = data.get("results", [])
-        else:
-            st.error(f"Failed to fetch jobs: {response.text}")
-            jobs = []
-    except Exception as e:
-        st.error(f"Error fetching jobs: {e}")
-        jobs = []
-
-    # Create a mapping for job titles to job IDs
-    job_options = {}
-    for job in jobs:
-        title = job.get("title", "No Title")
-        job_id = job.get("id", "")
-        if job_id:
-            job_options[title] = job_id
-
     # Candidate ID (if available)
     candidate_id = st.text_input("Candidate ID", value=st.session_state.candidate_id if st.session_state.candidate_id else "")
 
-    if not job_options:
-        st.info("No jobs available to match. Please post a job description first or check the job listings.")
+    try:
+        selected_job_id = select_job(st.session_state.token)
+    except requests.HTTPError as e:
+        st.error(f"Failed to fetch jobs: {e.response.text}")
+        return
+    except Exception as e:
+        st.error(f"Error fetching jobs: {e}")
         return
 
-    selected_job_title = st.selectbox("Select Job (by Title)", options=list(job_options.keys()))
-    selected_job_id = job_options[selected_job_title]
+    if selected_job_id is None:
+        if st.session_state.job_search:
+            st.info("No jobs match your search.")
+        else:
+            st.info("No jobs available to match. Please post a job description first or check the job listings.")
+        return
 
     if st.button("Match"):
         data = {
@@ -178,7 +351,7 @@ def match_candidate_to_job():
             "job_id": selected_job_id
         }
         try:
-            response = requests.post(f"{BASE_URL}/matches/match_candidate_to_job/", json=data, headers=headers)
+            response = api_post("/matches/match_candidate_to_job/", st.session_state.token, json=data)
             if response.status_code == 200:
                 match_data = response.json()
                 st.success("Matching completed!")
@@ -190,6 +363,140 @@ def match_candidate_to_job():
         except Exception as e:
             st.error(f"Error: {e}")
 
+DASHBOARD_SORTS = {
+    "LLM score, then pre-score": lambda row: (row["LLM score"] is not None, row["LLM score"] or 0, row["Pre-score"]),
+    "Pre-score": lambda row: row["Pre-score"],
+    "Fewest missing skills": lambda row: -len(row["Missing skills"]),
+}
+
+def dashboard_rows(prescores, llm_scores):
+    """
+    Table rows for the match dashboard: local pre-scores, overlaid with
+    stored matches and the LLM scores streamed in this session.
+    """
+    rows = []
+    for prescore in prescores:
+        scored = llm_scores.get(prescore["job_id"])
+        if scored is None and prescore["match_score"] is not None:
+            scored = prescore
+        rows.append({
+            "Job": f"{prescore['title']} at {prescore['company']}",
+            "Location": prescore.get("location") or "",
+            "Pre-score": prescore["local_score"],
+            "LLM score": scored["match_score"] if scored else None,
+            "Missing skills": (scored["missing_skills"] if scored else prescore["local_missing_skills"]) or [],
+            "Summary": scored["summary"] if scored else "",
+        })
+    return rows
+
+def show_dashboard(table, rows, sort_by, hidden_skills):
+    hidden = {skill.lower() for skill in hidden_skills}
+    visible = [
+        row for row in rows
+        if not hidden & {str(skill).lower() for skill in row["Missing skills"]}
+    ]
+    visible.sort(key=DASHBOARD_SORTS[sort_by], reverse=True)
+    table.dataframe(
+        [{**row, "Missing skills": ", ".join(map(str, row["Missing skills"]))} for row in visible],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+def match_dashboard():
+    """
+    Score a candidate against every open job: local pre-scores and still
+    valid stored matches show at once, then LLM scores for the best
+    pre-scored jobs fill in as the backend streams them.
+    """
+    st.title("Match Dashboard")
+    if not st.session_state.token:
+        st.warning("Please log in first.")
+        return
+
+    token = st.session_state.token
+    candidate_id = st.text_input(
+        "Candidate ID", value=st.session_state.candidate_id if st.session_state.candidate_id else "",
+        key="dashboard_candidate_id"
+    ).strip()
+    if not candidate_id:
+        st.info("Enter a candidate ID, or upload a resume first.")
+        return
+
+    try:
+        params = {"candidate_id": candidate_id, "limit": DASHBOARD_MAX_JOBS}
+        prescores = cached_get("/matches/prescores/", token, params)["results"]
+    except requests.HTTPError as e:
+        st.error(f"Failed to score jobs: {e.response.text}")
+        return
+    except Exception as e:
+        st.error(f"Error: {e}")
+        return
+    if not prescores:
+        st.info("No open jobs to match against. Please post a job description first.")
+        return
+
+    # LLM results streamed in during this session, by job id
+    if "llm_scores" not in st.session_state:
+        st.session_state.llm_scores = {}
+    llm_scores = st.session_state.llm_scores.setdefault(candidate_id, {})
+
+    rows = dashboard_rows(prescores, llm_scores)
+    sort_column, filter_column = st.columns(2)
+    sort_by = sort_column.selectbox("Sort by", list(DASHBOARD_SORTS))
+    all_missing = sorted({str(skill) for row in rows for skill in row["Missing skills"]}, key=str.lower)
+    hidden_skills = filter_column.multiselect("Hide jobs missing any of", all_missing)
+
+    unscored = [
+        prescore["job_id"] for prescore in sorted(prescores, key=lambda p: p["local_score"], reverse=True)
+        if prescore["match_score"] is None and prescore["job_id"] not in llm_scores
+    ]
+    st.caption(f"{len(prescores)} open jobs, {len(prescores) - len(unscored)} scored by the LLM.")
+    table = st.empty()
+    show_dashboard(table, rows, sort_by, hidden_skills)
+
+    if not unscored:
+        return
+    top_n = st.number_input(
+        "Best pre-scored jobs to score with the LLM", min_value=1,
+        max_value=min(len(unscored), DASHBOARD_MAX_LLM_JOBS), value=min(len(unscored), 20)
+    )
+    if not st.button("Score with LLM"):
+        return
+
+    job_ids = unscored[:top_n]
+    progress = st.progress(0.0, text=f"Scored 0 of {len(job_ids)} jobs...")
+    data = {"candidate_ids": [candidate_id], "job_ids": job_ids}
+    done = failed = 0
+    try:
+        # Results arrive one JSON line per job, in completion order; the
+        # backend stores each one, so an interrupted run is not wasted
+        with api_post("/matches/bulk/", token, json=data, stream=True) as response:
+            if response.status_code != 200:
+                st.error(f"Matching failed: {response.text}")
+                return
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                result = json.loads(line)
+                if "error" in result and "job_id" not in result:
+                    st.error(f"Matching failed: {result['error']}")
+                    break
+                done += 1
+                if "error" in result:
+                    failed += 1
+                else:
+                    llm_scores[result["job_id"]] = result
+                progress.progress(done / len(job_ids), text=f"Scored {done} of {len(job_ids)} jobs...")
+                show_dashboard(table, dashboard_rows(prescores, llm_scores), sort_by, hidden_skills)
+    except Exception as e:
+        st.error(f"Error: {e}")
+    # Stored matches changed, so the next pre-score fetch picks them up
+    cached_get.clear()
+    if failed or done < len(job_ids):
+        st.warning(f"{failed + len(job_ids) - done} jobs could not be scored. Try again to retry them.")
+    else:
+        progress.progress(1.0, text=f"Scored {done} jobs.")
+
 if page == "Register":
     register()
 elif page == "Login":
@@ -201,4 +508,6 @@ elif page == "Post Job Description":
 elif page == "View Profile":
     view_profile()
 elif page == "Match Candidate to Job":
-    match_candidate_to_job()
\ No newline at end of file
+    match_candidate_to_job()
+elif page == "Match Dashboard":
+    match_dashboard()
\ No newline at end of file